@@ -0,0 +1,13 @@
+"""
+Shared Rich console for AgentWeave CLI commands.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_console():
+    """Return the process-wide Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
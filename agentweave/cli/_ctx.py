@@ -0,0 +1,17 @@
+"""
+Per-invocation context shared by AgentWeave CLI commands.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def cwd() -> Path:
+    """
+    Return the directory the CLI was invoked from.
+
+    Resolved once per process; call ``cwd.cache_clear()`` if a command ever
+    changes directory.
+    """
+    return Path.cwd()
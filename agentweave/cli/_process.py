@@ -0,0 +1,42 @@
+"""
+Subprocess helpers for AgentWeave CLI commands.
+"""
+
+import subprocess
+import sys
+from collections import deque
+
+# pip for the running interpreter, resolved once. Module invocation needs no PATH or
+# Scripts/ lookup and lets pip upgrade itself on every platform, including Windows.
+PIP_COMMAND = (sys.executable, "-m", "pip")
+
+# Lines of stderr kept for error reports; earlier output is dropped as it streams
+STDERR_TAIL_LINES = 200
+
+
+def run_quiet(cmd: list[str], **kwargs) -> None:
+    """
+    Run a command with stdout discarded and only the tail of stderr retained.
+
+    Memory stays bounded no matter how much the command writes.
+
+    Args:
+        cmd: Command and arguments to run
+        **kwargs: Extra keyword arguments for subprocess.Popen (e.g. cwd)
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero; its ``stderr``
+            holds the last STDERR_TAIL_LINES lines of error output as text
+    """
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        **kwargs,
+    ) as process:
+        tail = deque(process.stderr, maxlen=STDERR_TAIL_LINES)
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr="".join(tail))
@@ -0,0 +1,36 @@
+"""
+Shared progress spinner for AgentWeave CLI commands.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+
+from agentweave.cli._console import get_console
+
+
+@lru_cache(maxsize=None)
+def _columns() -> tuple:
+    """Build the spinner columns once per process."""
+    from rich.progress import SpinnerColumn, TextColumn
+
+    return (SpinnerColumn(), TextColumn("[bold cyan]{task.description}[/bold cyan]"))
+
+
+@contextmanager
+def spinner(description: str) -> Iterator[Callable[[str], None]]:
+    """
+    Show a transient spinner while the wrapped block runs.
+
+    Yields a callable that replaces the spinner's description, for commands
+    that report intermediate steps.
+    """
+    from rich.progress import Progress
+
+    with Progress(*_columns(), console=get_console(), transient=True) as progress:
+        task = progress.add_task(description, total=None)
+
+        def update(new_description: str) -> None:
+            progress.update(task, description=new_description)
+
+        yield update
@@ -1,16 +1,6 @@
 """CLI commands for AgentWeave."""
 
-from . import (
-    add,
-    convert_to_template,
-    deploy,
-    dev,
-    init,
-    install_env,
-    list_cmd,
-    run,
-    template,
-)
+import importlib
 
 __all__ = [
     "add",
@@ -23,3 +13,16 @@ __all__ = [
     "run",
     "template",
 ]
+
+
+def __getattr__(name: str):
+    """Import command modules on first access so unused commands cost nothing."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -6,9 +6,9 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
 
+from agentweave.cli._ctx import cwd
 from agentweave.utils.config import (
     get_available_memories,
     get_available_monitors,
@@ -31,12 +31,22 @@ def callback():
     """
     Add components to an AgentWeave project.
     """
-    # Check if current directory is an AgentWeave project
-    if not is_agentweave_project():
+
+
+def _require_project() -> Path:
+    """
+    Return the project directory, exiting if it is not an AgentWeave project.
+
+    Called from each command rather than the group callback, which Click runs before
+    the command's own options are parsed, so --help works outside a project.
+    """
+    project_dir = cwd()
+    if not is_agentweave_project(project_dir):
         console.print(
             "[red]Not an AgentWeave project. Run this command from the project root.[/red]"
         )
         raise typer.Exit(1)
+    return project_dir
 
 
 @app.command()
@@ -56,7 +66,7 @@ def tool(
         agentweave add tool web-search
         agentweave add tool my-custom-tool --custom
     """
-    project_dir = Path.cwd()
+    project_dir = _require_project()
 
     if custom:
         # Create a custom tool
@@ -64,29 +74,20 @@ def tool(
             f"[bold cyan]Creating custom tool: [/bold cyan][bold white]{tool_name}[/bold white]"
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Creating custom tool...", total=None)
-
-            settings = {
-                "tool_name": tool_name,
-                "tool_description": Prompt.ask(
-                    "Tool description",
-                    default=f"A custom tool for {tool_name}",
-                ),
-            }
-
-            # Create the tool from the custom template
-            render_template_file(
-                "custom_tool.py.jinja2",
-                project_dir / "tools" / f"{tool_name.replace('-', '_')}.py",
-                settings,
-            )
-
-            progress.update(task, description="Custom tool created successfully!")
+        settings = {
+            "tool_name": tool_name,
+            "tool_description": Prompt.ask(
+                "Tool description",
+                default=f"A custom tool for {tool_name}",
+            ),
+        }
+
+        # Create the tool from the custom template
+        render_template_file(
+            "custom_tool.py.jinja2",
+            project_dir / "tools" / f"{tool_name.replace('-', '_')}.py",
+            settings,
+        )
 
         console.print(
             f"\n[bold green]✓ Custom tool '{tool_name}' created successfully![/bold green]"
@@ -96,23 +97,13 @@ def tool(
         available_tools = get_available_tools()
         if tool_name not in available_tools:
             console.print(f"[red]Tool '{tool_name}' not found. Available tools:[/red]")
-            for t in available_tools:
-                console.print(f"  - {t}")
+            console.print("\n".join(f"  - {t}" for t in sorted(available_tools)))
             raise typer.Exit(1)
 
         console.print(f"[bold cyan]Adding tool: [/bold cyan][bold white]{tool_name}[/bold white]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Adding tool...", total=None)
-
-            # Copy the tool template
-            copy_template_dir(f"tools/{tool_name}", project_dir / "tools", {})
-
-            progress.update(task, description="Tool added successfully!")
+        # Copy the tool template
+        copy_template_dir(f"tools/{tool_name}", project_dir / "tools", {})
 
         console.print(f"\n[bold green]✓ Tool '{tool_name}' added successfully![/bold green]")
 
@@ -128,28 +119,18 @@ def memory(
         agentweave add memory simple
         agentweave add memory vector-store
     """
-    project_dir = Path.cwd()
+    project_dir = _require_project()
 
     available_memories = get_available_memories()
     if memory_type not in available_memories:
         console.print(f"[red]Memory type '{memory_type}' not found. Available memory types:[/red]")
-        for m in available_memories:
-            console.print(f"  - {m}")
+        console.print("\n".join(f"  - {m}" for m in sorted(available_memories)))
         raise typer.Exit(1)
 
     console.print(f"[bold cyan]Adding memory: [/bold cyan][bold white]{memory_type}[/bold white]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Adding memory component...", total=None)
-
-        # Copy the memory template
-        copy_template_dir(f"memory/{memory_type}", project_dir / "memory", {})
-
-        progress.update(task, description="Memory component added successfully!")
+    # Copy the memory template
+    copy_template_dir(f"memory/{memory_type}", project_dir / "memory", {})
 
     console.print(
         f"\n[bold green]✓ Memory component '{memory_type}' added successfully![/bold green]"
@@ -167,28 +148,18 @@ def monitor(
         agentweave add monitor tracing
         agentweave add monitor dashboard
     """
-    project_dir = Path.cwd()
+    project_dir = _require_project()
 
     available_monitors = get_available_monitors()
     if monitor_name not in available_monitors:
         console.print(f"[red]Monitor '{monitor_name}' not found. Available monitors:[/red]")
-        for m in available_monitors:
-            console.print(f"  - {m}")
+        console.print("\n".join(f"  - {m}" for m in sorted(available_monitors)))
         raise typer.Exit(1)
 
     console.print(f"[bold cyan]Adding monitor: [/bold cyan][bold white]{monitor_name}[/bold white]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Adding monitoring component...", total=None)
-
-        # Copy the monitor template
-        copy_template_dir(f"monitoring/{monitor_name}", project_dir / "monitoring", {})
-
-        progress.update(task, description="Monitoring component added successfully!")
+    # Copy the monitor template
+    copy_template_dir(f"monitoring/{monitor_name}", project_dir / "monitoring", {})
 
     console.print(
         f"\n[bold green]✓ Monitoring component '{monitor_name}' added successfully![/bold green]"
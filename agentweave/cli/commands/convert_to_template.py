@@ -6,9 +6,11 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from agentweave.utils.template_generator import create_template_from_project
+from agentweave.utils.template_generator import (
+    compile_exclude_patterns,
+    create_template_from_project,
+)
 
 app = typer.Typer(
     name="convert-to-template",
@@ -47,44 +49,40 @@ def main(
         agentweave convert-to-template ./my-project my-custom-template
         agentweave convert-to-template ./my-project my-template --exclude "*.pyc,node_modules"
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Converting project to template...", total=None)
-
-        try:
-            # Convert exclude string to list if provided
-            exclude_patterns = None
-            if exclude:
-                exclude_patterns = [pattern.strip() for pattern in exclude.split(",")]
-
-            # Convert the project to a template
-            create_template_from_project(
-                project_dir=Path(project_dir),
-                template_name=template_name,
-                exclude_paths=exclude_patterns,
+    console.print("[bold cyan]Converting project to template...[/bold cyan]")
+
+    try:
+        # Convert exclude string to list if provided
+        exclude_patterns = None
+        if exclude:
+            exclude_patterns = compile_exclude_patterns(
+                pattern.strip() for pattern in exclude.split(",") if pattern.strip()
             )
 
-            progress.update(task, description="Project converted to template successfully!")
-
-            console.print(
-                f"\n[bold green]✓ Project successfully converted to template: {template_name}[/bold green]"
-            )
-            console.print("\n[cyan]Next steps:[/cyan]")
-            console.print(
-                "  1. Edit files in the template to replace specific values with placeholders like {{project_name}}"
-            )
-            console.print("  2. Update the schema.yaml file with appropriate configuration options")
-            console.print(
-                "  3. Use your new template with: agentweave init my-new-project -t "
-                + template_name
+        # Convert the project to a template
+        create_template_from_project(
+            project_dir=Path(project_dir),
+            template_name=template_name,
+            exclude_paths=exclude_patterns,
+        )
+
+        console.print(
+            "\n".join(
+                [
+                    "\n[bold green]✓ Project successfully converted to template: "
+                    f"{template_name}[/bold green]",
+                    "\n[cyan]Next steps:[/cyan]",
+                    "  1. Edit files in the template to replace specific values with "
+                    "placeholders like {{project_name}}",
+                    "  2. Update the schema.yaml file with appropriate configuration options",
+                    f"  3. Use your new template with: agentweave init my-new-project -t {template_name}",
+                ]
             )
+        )
 
-        except Exception as e:
-            console.print(f"[red]Error converting project to template: {str(e)}[/red]")
-            raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error converting project to template: {str(e)}[/red]")
+        raise typer.Exit(1)
 
 
 if __name__ == "__main__":
@@ -2,36 +2,59 @@
 Command to deploy an AgentWeave project.
 """
 
-import subprocess
+from functools import lru_cache
 from pathlib import Path
+from shutil import which
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt
 
+from agentweave.cli._console import get_console
+from agentweave.cli._ctx import cwd
+from agentweave.cli._progress import spinner
 from agentweave.utils.config import is_agentweave_project
 
+_DOCKERFILE_TEMPLATE = """FROM python:3.9-slim
+
+WORKDIR /app
+
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+COPY . .
+
+EXPOSE 8000
+
+CMD ["uvicorn", "backend.main:app", "--host", "0.0.0.0", "--port", "8000"]
+"""
+
 app = typer.Typer(
     name="deploy",
     help="Deploy an AgentWeave project",
     add_completion=False,
 )
 
-console = Console()
-
 
 @app.callback()
 def callback():
     """
     Deploy an AgentWeave project.
     """
-    # Check if current directory is an AgentWeave project
-    if not is_agentweave_project():
-        console.print(
+
+
+def _require_project() -> Path:
+    """
+    Return the project directory, exiting if it is not an AgentWeave project.
+
+    Called from each command rather than the group callback, which Click runs before
+    the command's own options are parsed, so --help works outside a project.
+    """
+    project_dir = cwd()
+    if not is_agentweave_project(project_dir):
+        get_console().print(
             "[red]Not an AgentWeave project. Run this command from the project root.[/red]"
         )
         raise typer.Exit(1)
+    return project_dir
 
 
 @app.command()
@@ -42,25 +65,19 @@ def local():
     Examples:
         agentweave deploy local
     """
-    console.print("\n[bold cyan]Deploying agent locally...[/bold cyan]")
+    project_dir = _require_project()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Building deployment package...", total=None)
+    console = get_console()
+    console.print("\n[bold cyan]Deploying agent locally...[/bold cyan]")
 
+    with spinner("Building deployment package..."):
         # Create deployment files
-        project_dir = Path.cwd()
         deploy_dir = project_dir / "deployment" / "local"
         deploy_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy necessary deployment files
         # TODO: Implement actual deployment logic
 
-        progress.update(task, description="Deployment files created successfully!")
-
     console.print("\n[bold green]✓ Agent deployed locally![/bold green]")
     console.print("\n[cyan]To start your agent:[/cyan]")
     console.print("  cd deployment/local")
@@ -75,56 +92,48 @@ def docker():
     Examples:
         agentweave deploy docker
     """
-    console.print("\n[bold cyan]Deploying agent as Docker container...[/bold cyan]")
+    import subprocess
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Building Docker image...", total=None)
+    from rich.prompt import Prompt
 
-        # Check if Dockerfile exists
-        project_dir = Path.cwd()
-        if not (project_dir / "Dockerfile").exists():
-            progress.stop()
-            console.print("[yellow]Dockerfile not found. Creating one now...[/yellow]")
+    project_dir = _require_project()
 
-            # Create Dockerfile
-            create_dockerfile(project_dir)
+    console = get_console()
+    console.print("\n[bold cyan]Deploying agent as Docker container...[/bold cyan]")
 
-            # Restart progress
-            progress.start()
-            task = progress.add_task("Building Docker image...", total=None)
+    docker_path = _docker_path()
+    if not docker_path:
+        console.print("[red]Docker not found. Install Docker and make sure it is on PATH.[/red]")
+        raise typer.Exit(1)
+
+    # Check if Dockerfile exists before any spinner is running
+    if not (project_dir / "Dockerfile").exists():
+        console.print("[yellow]Dockerfile not found. Creating one now...[/yellow]")
+        create_dockerfile(project_dir)
 
+    image_name = Prompt.ask(
+        "Docker image name",
+        default=f"agentweave-{project_dir.name}:latest",
+    )
+
+    with spinner("Building Docker image..."):
         # Build the Docker image
         try:
-            image_name = Prompt.ask(
-                "Docker image name",
-                default=f"agentweave-{project_dir.name}:latest",
-            )
-
-            # Build the Docker image
             result = subprocess.run(
-                ["docker", "build", "-t", image_name, "."],
+                [docker_path, "build", "-t", image_name, "."],
                 cwd=project_dir,
                 capture_output=True,
                 text=True,
                 check=False,
             )
-
-            if result.returncode != 0:
-                progress.stop()
-                console.print(f"[red]Error building Docker image: {result.stderr}[/red]")
-                raise typer.Exit(1)
-
-            progress.update(task, description="Docker image built successfully!")
-
         except Exception as e:
-            progress.stop()
             console.print(f"[red]Error building Docker image: {str(e)}[/red]")
             raise typer.Exit(1)
 
+        if result.returncode != 0:
+            console.print(f"[red]Error building Docker image: {result.stderr}[/red]")
+            raise typer.Exit(1)
+
     console.print(f"\n[bold green]✓ Docker image '{image_name}' built successfully![/bold green]")
     console.print("\n[cyan]To run your agent:[/cyan]")
     console.print(f"  docker run -p 8000:8000 {image_name}")
@@ -147,6 +156,11 @@ def cloud(
         agentweave deploy cloud --provider gcp
         agentweave deploy cloud --provider azure
     """
+    from rich.prompt import Prompt
+
+    _require_project()
+
+    console = get_console()
     console.print("\n[bold cyan]Deploying agent to cloud...[/bold cyan]")
 
     # Validate provider
@@ -165,17 +179,10 @@ def cloud(
 
     console.print(f"[bold]Selected provider: {provider.upper()}[/bold]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Preparing deployment for {provider.upper()}...", total=None)
-
+    with spinner(f"Preparing deployment for {provider.upper()}..."):
         # Create deployment package
         # TODO: Implement actual cloud deployment logic per provider
-
-        progress.update(task, description=f"Deployment package for {provider.upper()} prepared!")
+        pass
 
     console.print(
         f"\n[bold yellow]Cloud deployment to {provider.upper()} is a beta feature.[/bold yellow]"
@@ -185,26 +192,17 @@ def cloud(
     )
 
 
-def create_dockerfile(project_dir: Path):
-    """Create a Dockerfile for the project."""
-    docker_content = """FROM python:3.9-slim
+@lru_cache(maxsize=1)
+def _docker_path() -> str | None:
+    """Locate the docker executable once per process."""
+    return which("docker")
 
-WORKDIR /app
-
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
 
-COPY . .
-
-EXPOSE 8000
-
-CMD ["uvicorn", "backend.main:app", "--host", "0.0.0.0", "--port", "8000"]
-"""
-
-    with open(project_dir / "Dockerfile", "w") as f:
-        f.write(docker_content)
+def create_dockerfile(project_dir: Path):
+    """Create a Dockerfile for the project."""
+    (project_dir / "Dockerfile").write_text(_DOCKERFILE_TEMPLATE)
 
-    console.print("[green]Created Dockerfile.[/green]")
+    get_console().print("[green]Created Dockerfile.[/green]")
 
 
 if __name__ == "__main__":
@@ -2,21 +2,17 @@
 Command to set up and run development tools for an AgentWeave project.
 """
 
-import subprocess
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from agentweave.cli.commands.install_env import install_env
-from agentweave.cli.commands.run import run_command as run_project
+from agentweave.cli._console import get_console
+from agentweave.cli._ctx import cwd
 from agentweave.utils.config import is_agentweave_project, load_project_config
 
-console = Console()
-
 
 def dev_command(
     watch: bool = typer.Option(
@@ -85,14 +81,19 @@ def dev_command(
         agentweave dev --check       # Run all checks
         agentweave dev --install     # Install dev dependencies
     """
+    console = get_console()
+
+    # Get project root directory
+    project_dir = cwd()
+
     # Check if we're in an AgentWeave project
-    if not is_agentweave_project():
+    if not is_agentweave_project(project_dir):
         console.print(
             "[red]Not in an AgentWeave project. Please run this command in the root of an AgentWeave project.[/red]"
         )
         raise typer.Exit(1)
 
-    project_config = load_project_config()
+    project_config = load_project_config(project_dir)
     project_name = project_config.get("name", "AgentWeave project")
 
     console.print(
@@ -103,10 +104,9 @@ def dev_command(
     if install:
         console.print("\n[bold]Installing development dependencies...[/bold]")
         # Use the existing install_env command with dev=True
-        install_env(force=False, skip_frontend=False, dev=True)
+        from agentweave.cli.commands.install_env import install_env
 
-    # Get project root directory
-    project_dir = Path.cwd()
+        install_env(force=False, skip_frontend=False, dev=True)
 
     # If any specific tool was requested, run it
     if lint or test or format or check:
@@ -117,6 +117,8 @@ def dev_command(
         return
 
     # If no specific tool was requested, run the project
+    from agentweave.cli.commands.run import run_command as run_project
+
     if watch:
         show_dev_dashboard(project_dir)
         # Run the project with hot reloading - explicitly pass all parameters
@@ -138,26 +140,46 @@ def dev_command(
         )
 
 
-def show_dev_dashboard(project_dir: Path):
-    """Display a dashboard with useful development information."""
-    # Gather project info
-    templates_dir = project_dir / "templates" if (project_dir / "templates").exists() else None
-    frontend_dir = project_dir / "frontend" if (project_dir / "frontend").exists() else None
-    backend_dir = project_dir / "backend" if (project_dir / "backend").exists() else None
-    test_dir = project_dir / "tests" if (project_dir / "tests").exists() else None
-
-    panel = Panel(
-        "[bold blue]AgentWeave Development Dashboard[/bold blue]\n\n"
-        "[cyan]Commands:[/cyan]\n"
-        "  - [green]lint[/green]: Run linters (agentweave dev --lint)\n"
-        "  - [green]test[/green]: Run tests (agentweave dev --test)\n"
-        "  - [green]format[/green]: Format code (agentweave dev --format)\n"
-        "  - [green]check[/green]: Run all checks (agentweave dev --check)\n\n"
-        "[cyan]Project Structure:[/cyan]",
+@lru_cache(maxsize=1)
+def _dashboard_panel():
+    """Build the static dashboard panel, parsing its markup only once."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(
+            "[bold blue]AgentWeave Development Dashboard[/bold blue]\n\n"
+            "[cyan]Commands:[/cyan]\n"
+            "  - [green]lint[/green]: Run linters (agentweave dev --lint)\n"
+            "  - [green]test[/green]: Run tests (agentweave dev --test)\n"
+            "  - [green]format[/green]: Format code (agentweave dev --format)\n"
+            "  - [green]check[/green]: Run all checks (agentweave dev --check)\n\n"
+            "[cyan]Project Structure:[/cyan]"
+        ),
         title="Development Mode",
         border_style="cyan",
     )
-    console.print(panel)
+
+
+def show_dev_dashboard(project_dir: Path):
+    """Display a dashboard with useful development information."""
+    from rich.table import Table
+
+    console = get_console()
+
+    # Gather project info with a single directory listing
+    try:
+        with os.scandir(project_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        names = set()
+
+    templates_dir = project_dir / "templates" if "templates" in names else None
+    frontend_dir = project_dir / "frontend" if "frontend" in names else None
+    backend_dir = project_dir / "backend" if "backend" in names else None
+    test_dir = project_dir / "tests" if "tests" in names else None
+
+    console.print(_dashboard_panel())
 
     # Print project structure table
     table = Table(title="Project Components")
@@ -188,16 +210,14 @@ def show_dev_dashboard(project_dir: Path):
 
 def run_tests(project_dir: Path):
     """Run tests on the project."""
+    import importlib.util
+    import subprocess
+
+    console = get_console()
     console.print("\n[bold]Running tests...[/bold]")
 
-    # Check if pytest is available
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "pytest", "--version"],
-            capture_output=True,
-            check=False,
-        )
-    except (subprocess.SubprocessError, FileNotFoundError):
+    # Check if pytest is available without forking an interpreter
+    if importlib.util.find_spec("pytest") is None:
         console.print("[yellow]pytest not found. Install it to run tests.[/yellow]")
         return
 
@@ -205,21 +225,17 @@ def run_tests(project_dir: Path):
     test_dir = project_dir / "tests"
     test_path = str(test_dir) if test_dir.exists() else "."
 
-    # Run pytest
+    # Run pytest, letting its output stream straight to the terminal
     try:
         result = subprocess.run(
             [sys.executable, "-m", "pytest", test_path, "-v"],
-            capture_output=True,
-            text=True,
             cwd=str(project_dir),
             check=False,
         )
         if result.returncode != 0:
-            console.print("[red]Tests failed:[/red]")
-            console.print(result.stdout)
+            console.print("[red]Tests failed.[/red]")
         else:
             console.print("[green]All tests passed![/green]")
-            console.print(result.stdout)
     except Exception as e:
         console.print(f"[red]Error running tests: {str(e)}[/red]")
 
@@ -2,21 +2,25 @@
 Command to initialize a new AgentWeave project.
 """
 
+import re
+import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
 
+from agentweave.cli._console import get_console
+from agentweave.cli._progress import spinner
 from agentweave.utils.config import get_available_templates
 from agentweave.utils.template_generator import (
     generate_from_template,
     get_templates_dir,
 )
 
-# Create a single command function
-console = Console()
+# KEY=value lines from .env files; comments and blank lines never match
+_ENV_LINE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))[ \t]*$""",
+    re.MULTILINE,
+)
 
 
 def init_command(
@@ -33,6 +37,11 @@ def init_command(
         "-y",
         help="Skip all prompts and use defaults",
     ),
+    defaults_for_env: bool = typer.Option(
+        False,
+        "--defaults-for-env",
+        help="Write .env with the template's default values without prompting",
+    ),
 ):
     """
     Initialize a new AgentWeave project.
@@ -41,7 +50,12 @@ def init_command(
         agentweave init {{project_name}}
         agentweave init {{project_name}} --template conversational
         agentweave init {{project_name}} -t basic -y
+        agentweave init {{project_name}} --defaults-for-env
     """
+    from rich.prompt import Confirm, Prompt
+
+    console = get_console()
+
     console.print(
         f"\n[bold cyan]Creating new AgentWeave project: [/bold cyan][bold white]{project_name}[/bold white]"
     )
@@ -93,38 +107,19 @@ def init_command(
 
     env_vars = {}
     if env_example_path.exists() and not skip_prompts:
-        console.print("\n[cyan]Setting up environment variables:[/cyan]")
-
-        with open(env_example_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, default_value = line.split("=", 1)
-                    key = key.strip()
-                    default_value = default_value.strip()
-
-                    # If value is in quotes, remove them
-                    if (
-                        default_value
-                        and default_value[0] in ('"', "'")
-                        and default_value[-1] == default_value[0]
-                    ):
-                        default_value = default_value[1:-1]
-
-                    value = Prompt.ask(
-                        f"Enter value for {key}",
-                        default=default_value,
-                    )
-                    env_vars[key] = value
+        # Quoted values arrive without their quotes
+        env_defaults = {
+            match.group(1): next(g for g in match.group(2, 3, 4) if g is not None)
+            for match in _ENV_LINE.finditer(env_example_path.read_text())
+        }
 
-    # Initialize project using the template generator
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Initializing project...", total=None)
+        if defaults_for_env:
+            env_vars = env_defaults
+        elif env_defaults:
+            env_vars = _collect_env_vars(env_defaults)
 
+    # Initialize project using the template generator
+    with spinner("Initializing project..."):
         try:
             # Generate the project from the template using our new generator
             generate_from_template(
@@ -135,22 +130,23 @@ def init_command(
 
             # Write the .env file if we collected env vars
             if env_vars:
-                env_path = project_dir / ".env"
-                with open(env_path, "w") as f:
-                    for key, value in env_vars.items():
-                        f.write(f"{key}={value}\n")
+                env_payload = "".join(f"{key}={value}\n" for key, value in env_vars.items())
+                (project_dir / ".env").write_text(env_payload, encoding="utf-8")
 
                 console.print("[green]Environment variables saved to .env file[/green]")
 
-            progress.update(task, description="Project initialized successfully!")
-
-            console.print("\n[bold green]✓ Project initialized successfully![/bold green]")
-            console.print("\n[cyan]To get started:[/cyan]")
-            console.print(f"  cd {project_name}")
-            console.print("  agentweave install_env")
-            console.print("  agentweave run")
             console.print(
-                "\n[cyan]For more information, see the README.md file in your project directory.[/cyan]"
+                "\n".join(
+                    [
+                        "\n[bold green]✓ Project initialized successfully![/bold green]",
+                        "\n[cyan]To get started:[/cyan]",
+                        f"  cd {project_name}",
+                        "  agentweave install_env",
+                        "  agentweave run",
+                        "\n[cyan]For more information, see the README.md file in your project "
+                        "directory.[/cyan]",
+                    ]
+                )
             )
 
         except Exception as e:
@@ -158,5 +154,30 @@ def init_command(
             raise typer.Exit(1)
 
 
+def _collect_env_vars(env_defaults: dict[str, str]) -> dict[str, str]:
+    """Ask for environment variable values, showing every default at once on a terminal."""
+    from rich.prompt import Confirm, Prompt
+    from rich.table import Table
+
+    console = get_console()
+    console.print("\n[cyan]Setting up environment variables:[/cyan]")
+
+    if sys.stdin.isatty():
+        table = Table()
+        table.add_column("Variable", style="bold cyan")
+        table.add_column("Default", style="white")
+        for key, default_value in env_defaults.items():
+            table.add_row(key, default_value)
+        console.print(table)
+
+        if Confirm.ask("Use these values?", default=True):
+            return dict(env_defaults)
+
+    return {
+        key: Prompt.ask(f"Enter value for {key}", default=default_value)
+        for key, default_value in env_defaults.items()
+    }
+
+
 # Export the command as app
 app = init_command
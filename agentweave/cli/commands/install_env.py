@@ -2,19 +2,28 @@
 Command to set up the environment for an AgentWeave project.
 """
 
+import os
 import re
 import shutil
 import subprocess
-import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from agentweave.cli._console import get_console
+from agentweave.cli._ctx import cwd
+from agentweave.cli._process import PIP_COMMAND, run_quiet
+from agentweave.cli._progress import spinner
 from agentweave.utils.config import is_agentweave_project, load_project_config
 
-console = Console()
+# Top-level project directories that are made importable for development installs
+_PACKAGE_DIRS = frozenset({"tools", "agents", "memory", "backend"})
+
+# Runs of characters not allowed in a package name; each run collapses to one underscore
+_PACKAGE_NAME_UNSAFE = re.compile(r"[^a-zA-Z0-9]+")
 
 
 def install_env(
@@ -55,201 +64,224 @@ def install_env(
         agentweave install_env --skip-frontend
         agentweave install_env --no-dev
     """
+    console = get_console()
+
+    # Get project root directory
+    project_dir = cwd()
+
     # Check if we're in an AgentWeave project
-    if not is_agentweave_project():
+    if not is_agentweave_project(project_dir):
         console.print(
             "[red]Not in an AgentWeave project. Please run this command in the root of an AgentWeave project.[/red]"
         )
         raise typer.Exit(1)
 
-    project_config = load_project_config()
+    project_config = load_project_config(project_dir)
     project_name = project_config.get("name", "AgentWeave project")
 
     console.print(
         f"\n[bold cyan]Setting up environment for: [/bold cyan][bold white]{project_name}[/bold white]"
     )
 
-    # Get project root directory
-    project_dir = Path.cwd()
+    with spinner("Setting up environment...") as update:
+        # Spinner updates arrive from worker threads, so serialize them
+        update_lock = threading.Lock()
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Setting up environment...", total=None)
+        def locked_update(description: str) -> None:
+            with update_lock:
+                update(description)
 
         try:
-            progress.update(task, description="Using current Python environment")
-            pip_path = Path(sys.executable).parent / "pip"
-            if not pip_path.exists():
-                # Use module invocation as a fallback
-                pip_path = [sys.executable, "-m", "pip"]
-            else:
-                pip_path = [str(pip_path)]
-
-            # Step 2: Install backend dependencies
-            progress.update(task, description="Installing backend dependencies...")
-
-            # Install requirements if requirements.txt exists
-            requirements_file = project_dir / "requirements.txt"
-            if requirements_file.exists():
-                try:
-                    subprocess.run(
-                        pip_path + ["install", "-U", "pip", "setuptools", "wheel"],
-                        check=True,
-                        capture_output=True,
-                    )
-                    subprocess.run(
-                        pip_path + ["install", "-r", str(requirements_file)],
-                        check=True,
-                        capture_output=True,
-                    )
-                except subprocess.CalledProcessError as e:
-                    console.print(
-                        f"[red]Error installing backend dependencies: {e.stderr.decode()}[/red]"
-                    )
-                    raise typer.Exit(1)
-
-                progress.update(task, description="Backend dependencies installed successfully!")
-            else:
-                console.print(
-                    "[yellow]No requirements.txt found. Skipping backend dependencies installation.[/yellow]"
-                )
-
-            # Step 3: Install the project as a development package
-            if dev:
-                progress.update(task, description="Installing project as a development package...")
-
-                # Create or update setup.py if it doesn't exist
-                setup_py_path = project_dir / "setup.py"
-                if not setup_py_path.exists():
-                    # Get project name for the package name - convert to snake_case
-                    package_name = re.sub(r"[^a-zA-Z0-9]", "_", project_name.lower())
-                    package_name = re.sub(
-                        r"_+", "_", package_name
-                    )  # Replace multiple underscores with a single one
-
-                    # Create setup.py content
-                    setup_py_content = f"""
-from setuptools import setup, find_packages
+            locked_update("Using current Python environment")
 
-setup(
-    name="{package_name}",
-    version="0.1.0",
-    packages=find_packages(),
-    install_requires=[],
-    python_requires=">=3.8",
-)
-"""
-                    with open(setup_py_path, "w") as f:
-                        f.write(setup_py_content)
-
-                    console.print("[green]Created setup.py for the project.[/green]")
-
-                # Create __init__.py in relevant directories to make them packages
-                for dir_path in ["tools", "agents", "memory", "backend"]:
-                    init_path = project_dir / dir_path / "__init__.py"
-                    if (project_dir / dir_path).exists() and not init_path.exists():
-                        with open(init_path, "w") as f:
-                            f.write(f"# Package initialization for {dir_path}\n")
-
-                # Install the project in development mode
-                try:
-                    subprocess.run(
-                        pip_path + ["install", "-e", "."],
-                        check=True,
-                        capture_output=True,
-                        cwd=str(project_dir),
-                    )
-                    progress.update(task, description="Project installed as development package!")
-                except subprocess.CalledProcessError as e:
-                    console.print(
-                        f"[red]Error installing project package: {e.stderr.decode()}[/red]"
-                    )
-                    console.print("[yellow]Continuing with setup...[/yellow]")
-
-            # Step 4: Install frontend dependencies (if frontend directory exists and skip_frontend is False)
-            frontend_dir = project_dir / "frontend"
-            if frontend_dir.exists() and not skip_frontend:
-                progress.update(task, description="Installing frontend dependencies...")
-
-                # Check if package.json exists
-                package_json = frontend_dir / "package.json"
-                if package_json.exists():
-                    # Check if npm is installed
-                    try:
-                        subprocess.run(
-                            ["npm", "--version"],
-                            check=True,
-                            capture_output=True,
-                        )
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        console.print(
-                            "[yellow]npm not found. Please install Node.js and npm to set up the frontend.[/yellow]"
-                        )
-                        progress.update(task, description="Skipping frontend setup (npm not found)")
-                    else:
-                        # Install frontend dependencies
-                        try:
-                            subprocess.run(
-                                ["npm", "install"],
-                                check=True,
-                                capture_output=True,
-                                cwd=str(frontend_dir),
-                            )
-                        except subprocess.CalledProcessError as e:
-                            console.print(
-                                f"[red]Error installing frontend dependencies: {e.stderr.decode()}[/red]"
-                            )
-                            raise typer.Exit(1)
-
-                        progress.update(
-                            task,
-                            description="Frontend dependencies installed successfully!",
-                        )
-                else:
-                    console.print(
-                        "[yellow]No package.json found in frontend directory. Skipping frontend setup.[/yellow]"
-                    )
-            elif skip_frontend:
-                progress.update(
-                    task,
-                    description="Skipping frontend setup (--skip-frontend flag used)",
-                )
+            # Backend and frontend dependencies are independent, so install them
+            # concurrently; the development package is installed with the requirements
+            def install_backend() -> None:
+                if dev:
+                    _prepare_dev_package(project_dir, project_name)
+                _install_backend_deps(project_dir, dev, locked_update)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(install_backend)]
+
+                frontend_dir = project_dir / "frontend"
+                if frontend_dir.exists() and not skip_frontend:
+                    futures.append(executor.submit(_install_frontend, frontend_dir, locked_update))
+                elif skip_frontend:
+                    locked_update("Skipping frontend setup (--skip-frontend flag used)")
+
+                wait(futures)
+
+            errors = [future.exception() for future in futures if future.exception()]
+            for error in errors:
+                if not isinstance(error, typer.Exit):
+                    console.print(f"[red]Error setting up environment: {str(error)}[/red]")
+            if errors:
+                raise typer.Exit(1)
 
             # Final step: Create a .env file if it doesn't exist
             env_local = project_dir / ".env"
             if not env_local.exists():
                 env_example = project_dir / ".env.example"
                 if env_example.exists():
-                    shutil.copy(env_example, env_local)
+                    shutil.copyfile(env_example, env_local)
                     console.print("[green]Created .env from .env.example[/green]")
                 else:
                     # Create a basic .env
-                    with open(env_local, "w") as f:
-                        f.write(
-                            """# Local environment variables
+                    env_local.write_text(
+                        """# Local environment variables
 OPENAI_API_KEY=
 
 # Vector store settings
 VECTOR_STORE_DIR=./vector_store
-"""
-                        )
+""",
+                        encoding="utf-8",
+                        newline="\n",
+                    )
                     console.print("[green]Created a basic .env file[/green]")
 
             # Update completion message
-            progress.update(task, description="Environment setup completed successfully!")
+            update("Environment setup completed successfully!")
 
             console.print("\n[bold green]✓ Environment set up successfully![/bold green]")
 
             console.print("\n[cyan]To run the project:[/cyan]")
             console.print("  agentweave run")
 
+        except typer.Exit:
+            raise
         except Exception as e:
             console.print(f"[red]Error setting up environment: {str(e)}[/red]")
             raise typer.Exit(1)
 
 
+def _install_backend_deps(project_dir: Path, dev: bool, update: Callable[[str], None]) -> None:
+    """Install the backend requirements and, optionally, the project itself in one pip run."""
+    console = get_console()
+
+    requirements_file = project_dir / "requirements.txt"
+    requirements = ["-r", str(requirements_file)] if requirements_file.exists() else []
+    if not requirements:
+        console.print(
+            "[yellow]No requirements.txt found. Skipping backend dependencies installation.[/yellow]"
+        )
+        if not dev:
+            return
+
+    update("Installing backend dependencies...")
+
+    try:
+        if requirements:
+            # Only the packaging tools are upgraded; satisfied requirements are left as is
+            _pip_install(project_dir, "-U", "pip", "setuptools", "wheel")
+
+        if not dev:
+            _pip_install(project_dir, *requirements)
+        else:
+            try:
+                _pip_install(project_dir, *requirements, "-e", ".")
+            except subprocess.CalledProcessError as e:
+                # The project itself is optional: install the requirements on their own
+                console.print(f"[red]Error installing project package: {e.stderr}[/red]")
+                console.print("[yellow]Continuing with setup...[/yellow]")
+                if requirements:
+                    _pip_install(project_dir, *requirements)
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Error installing backend dependencies: {e.stderr}[/red]")
+        raise typer.Exit(1)
+
+    update("Backend dependencies installed successfully!")
+
+
+def _pip_install(project_dir: Path, *args: str) -> None:
+    """Run ``pip install`` quietly in the project directory."""
+    run_quiet(
+        [*PIP_COMMAND, "install", "--disable-pip-version-check", "--no-input", "-q", *args],
+        cwd=str(project_dir),
+    )
+
+
+def _prepare_dev_package(project_dir: Path, project_name: str) -> None:
+    """Create setup.py and package markers so the project can be installed in development mode."""
+    console = get_console()
+
+    # Create or update setup.py if it doesn't exist
+    setup_py_path = project_dir / "setup.py"
+    if not setup_py_path.exists():
+        # Get project name for the package name - convert to snake_case
+        package_name = _PACKAGE_NAME_UNSAFE.sub("_", project_name.lower()).strip("_")
+
+        # Create setup.py content
+        setup_py_content = f"""
+from setuptools import setup, find_packages
+
+setup(
+    name="{package_name}",
+    version="0.1.0",
+    packages=find_packages(),
+    install_requires=[],
+    python_requires=">=3.8",
+)
+"""
+        setup_py_path.write_text(setup_py_content, encoding="utf-8", newline="\n")
+
+        console.print("[green]Created setup.py for the project.[/green]")
+
+    # Create __init__.py in relevant directories to make them packages. One directory
+    # read finds the candidates, and O_EXCL folds the existence check into the create.
+    with os.scandir(project_dir) as entries:
+        present = [e.name for e in entries if e.name in _PACKAGE_DIRS and e.is_dir()]
+    for name in present:
+        try:
+            fd = os.open(
+                project_dir / name / "__init__.py", os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+            )
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, f"# Package initialization for {name}\n".encode())
+        finally:
+            os.close(fd)
+
+
+def _install_frontend(frontend_dir: Path, update: Callable[[str], None]) -> None:
+    """Install the frontend's npm dependencies."""
+    console = get_console()
+
+    update("Installing frontend dependencies...")
+
+    # Check if package.json exists
+    if not (frontend_dir / "package.json").exists():
+        console.print(
+            "[yellow]No package.json found in frontend directory. Skipping frontend setup.[/yellow]"
+        )
+        return
+
+    # Check if npm is installed; a PATH lookup avoids forking a probe process
+    if shutil.which("npm") is None:
+        _report_missing_npm(update)
+        return
+
+    # Install frontend dependencies
+    try:
+        run_quiet(["npm", "install"], cwd=str(frontend_dir))
+    except FileNotFoundError:
+        _report_missing_npm(update)
+        return
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Error installing frontend dependencies: {e.stderr}[/red]")
+        raise typer.Exit(1)
+
+    update("Frontend dependencies installed successfully!")
+
+
+def _report_missing_npm(update: Callable[[str], None]) -> None:
+    """Tell the user the frontend setup is skipped because npm is unavailable."""
+    get_console().print(
+        "[yellow]npm not found. Please install Node.js and npm to set up the frontend.[/yellow]"
+    )
+    update("Skipping frontend setup (npm not found)")
+
+
 # Export the command as app
 app = install_env
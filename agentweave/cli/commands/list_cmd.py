@@ -2,10 +2,13 @@
 Command to list available components in AgentWeave.
 """
 
+from collections.abc import Callable, Collection, Mapping
+from types import MappingProxyType
+from typing import NamedTuple
+
 import typer
-from rich.console import Console
-from rich.table import Table
 
+from agentweave.cli._console import get_console
 from agentweave.utils.config import (
     get_available_memories,
     get_available_monitors,
@@ -19,7 +22,96 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+_TEMPLATE_DESCRIPTIONS = MappingProxyType(
+    {
+        "basic": "A simple agent with minimal components",
+        "conversational": "A conversational agent optimized for chat",
+        "reasoning": "An agent with advanced reasoning capabilities",
+        "tool-using": "An agent focused on using tools effectively",
+        "advanced": "A fully-featured agent with all components",
+    }
+)
+
+_TOOL_DESCRIPTIONS = MappingProxyType(
+    {
+        "web-search": "Search the web for information",
+        "file-io": "Read and write files",
+        "calculator": "Perform calculations",
+        "weather": "Get weather information",
+        "wikipedia": "Query Wikipedia",
+        "calendar": "Manage calendar events",
+        "email": "Send and receive emails",
+        "code-interpreter": "Run Python code",
+        "database": "Query databases",
+        "api-connector": "Connect to external APIs",
+    }
+)
+
+_MEMORY_DESCRIPTIONS = MappingProxyType(
+    {
+        "simple": "Basic in-memory storage",
+        "vector-store": "Vector-based retrieval memory",
+        "conversation": "Conversation history tracker",
+        "document": "Document storage and retrieval",
+        "redis": "Redis-backed persistent memory",
+    }
+)
+
+_MONITOR_DESCRIPTIONS = MappingProxyType(
+    {
+        "tracing": "Tracing and logging for agent actions",
+        "dashboard": "Web dashboard for monitoring agents",
+        "metrics": "Metrics collection and visualization",
+        "debugger": "Interactive debugger for agents",
+        "langfuse": "Langfuse integration for observability",
+    }
+)
+
+
+class _Category(NamedTuple):
+    """A listable component category and how to render it."""
+
+    heading: str
+    title: str
+    column: str
+    get_items: Callable[[], Collection[str]]
+    descriptions: Mapping[str, str]
+
+
+_TEMPLATES = _Category(
+    "Templates", "Available Templates", "Template", get_available_templates, _TEMPLATE_DESCRIPTIONS
+)
+_TOOLS = _Category("Tools", "Available Tools", "Tool", get_available_tools, _TOOL_DESCRIPTIONS)
+_MEMORIES = _Category(
+    "Memory Components",
+    "Available Memory Components",
+    "Memory",
+    get_available_memories,
+    _MEMORY_DESCRIPTIONS,
+)
+_MONITORS = _Category(
+    "Monitoring Components",
+    "Available Monitoring Components",
+    "Monitor",
+    get_available_monitors,
+    _MONITOR_DESCRIPTIONS,
+)
+
+_CATEGORIES = (_TEMPLATES, _TOOLS, _MEMORIES, _MONITORS)
+
+
+def _print_table(category: _Category) -> None:
+    """Print a two-column table of a category's component names and descriptions."""
+    from rich.table import Table
+
+    table = Table(title=category.title)
+    table.add_column(category.column, style="cyan", no_wrap=True)
+    table.add_column("Description", style="white")
+
+    for item in sorted(category.get_items()):
+        table.add_row(item, category.descriptions.get(item, ""))
+
+    get_console().print(table)
 
 
 @app.callback()
@@ -38,25 +130,7 @@ def templates():
     Examples:
         agentweave list templates
     """
-    templates = get_available_templates()
-
-    table = Table(title="Available Templates")
-    table.add_column("Template", style="cyan", no_wrap=True)
-    table.add_column("Description", style="white")
-
-    template_descriptions = {
-        "basic": "A simple agent with minimal components",
-        "conversational": "A conversational agent optimized for chat",
-        "reasoning": "An agent with advanced reasoning capabilities",
-        "tool-using": "An agent focused on using tools effectively",
-        "advanced": "A fully-featured agent with all components",
-    }
-
-    for template in sorted(templates):
-        description = template_descriptions.get(template, "")
-        table.add_row(template, description)
-
-    console.print(table)
+    _print_table(_TEMPLATES)
 
 
 @app.command(name="tools")
@@ -67,30 +141,7 @@ def list_tools():
     Examples:
         agentweave list tools
     """
-    tools = get_available_tools()
-
-    table = Table(title="Available Tools")
-    table.add_column("Tool", style="cyan", no_wrap=True)
-    table.add_column("Description", style="white")
-
-    tool_descriptions = {
-        "web-search": "Search the web for information",
-        "file-io": "Read and write files",
-        "calculator": "Perform calculations",
-        "weather": "Get weather information",
-        "wikipedia": "Query Wikipedia",
-        "calendar": "Manage calendar events",
-        "email": "Send and receive emails",
-        "code-interpreter": "Run Python code",
-        "database": "Query databases",
-        "api-connector": "Connect to external APIs",
-    }
-
-    for tool in sorted(tools):
-        description = tool_descriptions.get(tool, "")
-        table.add_row(tool, description)
-
-    console.print(table)
+    _print_table(_TOOLS)
 
 
 @app.command(name="memories")
@@ -101,25 +152,7 @@ def list_memories():
     Examples:
         agentweave list memories
     """
-    memories = get_available_memories()
-
-    table = Table(title="Available Memory Components")
-    table.add_column("Memory", style="cyan", no_wrap=True)
-    table.add_column("Description", style="white")
-
-    memory_descriptions = {
-        "simple": "Basic in-memory storage",
-        "vector-store": "Vector-based retrieval memory",
-        "conversation": "Conversation history tracker",
-        "document": "Document storage and retrieval",
-        "redis": "Redis-backed persistent memory",
-    }
-
-    for memory in sorted(memories):
-        description = memory_descriptions.get(memory, "")
-        table.add_row(memory, description)
-
-    console.print(table)
+    _print_table(_MEMORIES)
 
 
 @app.command(name="monitors")
@@ -130,25 +163,7 @@ def list_monitors():
     Examples:
         agentweave list monitors
     """
-    monitors = get_available_monitors()
-
-    table = Table(title="Available Monitoring Components")
-    table.add_column("Monitor", style="cyan", no_wrap=True)
-    table.add_column("Description", style="white")
-
-    monitor_descriptions = {
-        "tracing": "Tracing and logging for agent actions",
-        "dashboard": "Web dashboard for monitoring agents",
-        "metrics": "Metrics collection and visualization",
-        "debugger": "Interactive debugger for agents",
-        "langfuse": "Langfuse integration for observability",
-    }
-
-    for monitor in sorted(monitors):
-        description = monitor_descriptions.get(monitor, "")
-        table.add_row(monitor, description)
-
-    console.print(table)
+    _print_table(_MONITORS)
 
 
 @app.command()
@@ -159,19 +174,12 @@ def components():
     Examples:
         agentweave list components
     """
-    console.print("[bold cyan]Available Components in AgentWeave[/bold cyan]\n")
-
-    console.print("[bold]Templates:[/bold]")
-    templates()
-
-    console.print("\n[bold]Tools:[/bold]")
-    list_tools()
-
-    console.print("\n[bold]Memory Components:[/bold]")
-    list_memories()
+    console = get_console()
+    console.print("[bold cyan]Available Components in AgentWeave[/bold cyan]")
 
-    console.print("\n[bold]Monitoring Components:[/bold]")
-    list_monitors()
+    for category in _CATEGORIES:
+        console.print(f"\n[bold]{category.heading}:[/bold]")
+        _print_table(category)
 
 
 if __name__ == "__main__":
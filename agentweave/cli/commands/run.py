@@ -3,45 +3,87 @@ Command to run an AgentWeave project in development mode.
 """
 
 import atexit
+import hashlib
 import os
+import queue
 import signal
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
-import psutil
 import typer
-from rich.console import Console
 
+from agentweave.cli._console import get_console
+from agentweave.cli._ctx import cwd
+from agentweave.cli._process import PIP_COMMAND, run_quiet
 from agentweave.utils.config import is_agentweave_project, load_project_config
 
-# Create a command directly rather than a command group
-console = Console()
-
 # Global list to track all child processes
 _processes = []
 
+# Files whose contents decide whether `pip install -e .` has to run again
+_INSTALL_INPUTS = ("setup.py", "pyproject.toml", "requirements.txt")
+_INSTALL_MARKER = Path(".agentweave") / "install.hash"
+
+# Keeps the startup banners of concurrently launched servers from interleaving
+_output_lock = threading.Lock()
+
+# Seconds servers get to shut down after SIGTERM before they are killed
+_TERMINATE_TIMEOUT = 5
+
 
 def cleanup_processes():
     """Cleanup all tracked processes when the program exits."""
-    for proc in _processes:
+    console = get_console()
+
+    running = [proc for proc in _processes if proc.poll() is None]
+
+    # Each server runs in its own process group, so one signal reaches its children too
+    for proc in running:
         try:
-            # Check if process is still running
-            if proc.poll() is None:
-                process = psutil.Process(proc.pid)
-                # Kill process and its children
-                for child in process.children(recursive=True):
-                    try:
-                        child.terminate()
-                    except Exception:
-                        pass
-                process.terminate()
+            _signal_process_group(proc, force=False)
+            if isinstance(proc, _InProcessServer):
+                # Runs in this process, so there is no separate PID to report
+                console.print("[yellow]Stopped the in-process backend server[/yellow]")
+            else:
                 console.print(f"[yellow]Terminated process with PID {proc.pid}[/yellow]")
-        except (psutil.NoSuchProcess, ProcessLookupError):
+        except (ProcessLookupError, OSError):
             # Process already terminated
             pass
-        except Exception as e:
-            console.print(f"[red]Error terminating process: {str(e)}[/red]")
+
+    # Escalate for anything that ignores the polite request
+    deadline = time.monotonic() + _TERMINATE_TIMEOUT
+    for proc in running:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                _signal_process_group(proc, force=True)
+            except (ProcessLookupError, OSError):
+                pass
+            except Exception as e:
+                console.print(f"[red]Error terminating process: {str(e)}[/red]")
+
+
+def _signal_process_group(proc: subprocess.Popen, force: bool) -> None:
+    """Terminate (or kill, if forced) a server process together with its children."""
+    if isinstance(proc, _InProcessServer):
+        if force:
+            proc.kill()
+        else:
+            proc.terminate()
+    elif sys.platform == "win32":
+        if force:
+            proc.kill()
+        else:
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+    else:
+        os.killpg(os.getpgid(proc.pid), signal.SIGKILL if force else signal.SIGTERM)
 
 
 def run_command(
@@ -92,19 +134,21 @@ def run_command(
         agentweave run --port 8080 --frontend-port 3001
         agentweave run --use-current-env
     """
+    console = get_console()
+
+    # Get project directory
+    project_dir = cwd()
+
     # Check if current directory is an AgentWeave project
-    if not is_agentweave_project():
+    if not is_agentweave_project(project_dir):
         console.print(
             "[red]Not an AgentWeave project. Run this command from the project root.[/red]"
         )
         raise typer.Exit(1)
 
-    # Get project directory
-    project_dir = Path.cwd()
-
     # Get project config
-    project_config = load_project_config()
-    project_name = project_config.get("name", Path.cwd().name)
+    project_config = load_project_config(project_dir)
+    project_name = project_config.get("name", project_dir.name)
 
     console.print(f"\n[bold cyan]Running {project_name}[/bold cyan]")
 
@@ -122,17 +166,16 @@ def run_command(
             "[yellow]This is important for integrating with external services and APIs.[/yellow]\n"
         )
 
-    # Install the package in development mode if not skipped
-    if not no_install:
+    # Install the package in development mode if not skipped and its inputs changed
+    if not no_install and _needs_reinstall(project_dir):
         console.print("[cyan]Installing package in development mode...[/cyan]")
         try:
-            cmd = [sys.executable, "-m", "pip", "install", "-e", "."]
-            subprocess.run(cmd, check=True, capture_output=True)
+            cmd = [*PIP_COMMAND, "install", "-e", "."]
+            run_quiet(cmd, cwd=str(project_dir))
+            _record_install(project_dir)
             console.print("[green]Package installed successfully[/green]")
         except subprocess.CalledProcessError as e:
-            console.print(
-                f"[yellow]Warning: Failed to install package: {e.stderr.decode()}[/yellow]"
-            )
+            console.print(f"[yellow]Warning: Failed to install package: {e.stderr}[/yellow]")
             console.print(
                 "[yellow]You may encounter import errors. Try running 'pip install -e .' manually.[/yellow]"
             )
@@ -150,11 +193,13 @@ def run_command(
     # Set the signal handler for SIGINT (Ctrl+C)
     signal.signal(signal.SIGINT, signal_handler)
 
+    ctx = RunContext(project_dir, port, frontend_port, reload)
+
     try:
         # Run backend only
         if backend_only:
             console.print("[green]Running backend server only[/green]")
-            process = run_backend(project_dir, port, reload)
+            process = run_backend(ctx)
             if process:
                 _processes.append(process)
                 process.wait()  # Wait for the backend process to exit
@@ -163,7 +208,7 @@ def run_command(
         # Run frontend only
         if frontend_only:
             console.print("[green]Running frontend server only[/green]")
-            process = run_frontend(project_dir, frontend_port)
+            process = run_frontend(ctx)
             if process:
                 _processes.append(process)
                 process.wait()  # Wait for the frontend process to exit
@@ -171,63 +216,123 @@ def run_command(
 
         # Run both backend and frontend
         console.print("[green]Running backend and frontend servers[/green]")
-        run_both(project_dir, port, frontend_port, reload)
+        run_both(ctx)
 
     except Exception as e:
         console.print(f"[red]Error running project: {str(e)}[/red]")
         raise typer.Exit(1)
 
 
-def run_backend(project_dir: Path, port: int, reload: bool):
+def _install_digest(project_dir: Path) -> str:
+    """Hash the packaging inputs and the target interpreter of a development install."""
+    digest = hashlib.sha256(sys.executable.encode())
+    for name in _INSTALL_INPUTS:
+        try:
+            data = (project_dir / name).read_bytes()
+        except FileNotFoundError:
+            continue
+        digest.update(b"\0" + name.encode() + b"\0" + data)
+    return digest.hexdigest()
+
+
+def _needs_reinstall(project_dir: Path) -> bool:
+    """Check whether the packaging inputs changed since the last successful install."""
+    try:
+        recorded = (project_dir / _INSTALL_MARKER).read_text().strip()
+    except OSError:
+        return True
+    return recorded != _install_digest(project_dir)
+
+
+def _record_install(project_dir: Path) -> None:
+    """Remember the packaging inputs of a successful development install."""
+    marker = project_dir / _INSTALL_MARKER
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(_install_digest(project_dir))
+    except OSError:
+        # Without the marker the next run simply reinstalls
+        pass
+
+
+def _process_group_kwargs() -> dict:
+    """Popen arguments that start the child in its own process group."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+@dataclass(frozen=True)
+class RunContext:
+    """Settings for one `agentweave run`, with the paths derived from them computed once."""
+
+    project_dir: Path
+    backend_port: int = 8000
+    frontend_port: int = 3000
+    reload: bool = True
+
+    @cached_property
+    def frontend_dir(self) -> Path:
+        return self.project_dir / "frontend"
+
+    @cached_property
+    def module_path(self) -> str | None:
+        """The backend's ASGI app, preferring src/backend over backend."""
+        for package in ("src.backend", "backend"):
+            # A main.py inside the directory implies the directory itself exists
+            if self.project_dir.joinpath(*package.split("."), "main.py").is_file():
+                return f"{package}.main:app"
+        return None
+
+
+def run_backend(ctx: RunContext):
     """Run the backend server."""
-    # First try to find the backend directory
-    src_backend_dir = project_dir / "src" / "backend"
-    backend_dir = project_dir / "backend"
+    console = get_console()
+    port = ctx.backend_port
 
     # Determine the module path based on the directory structure
-    if src_backend_dir.exists() and (src_backend_dir / "main.py").exists():
-        # Use src.backend.main:app
-        module_path = "src.backend.main:app"
-    elif backend_dir.exists() and (backend_dir / "main.py").exists():
-        # Use backend.main:app
-        module_path = "backend.main:app"
-    else:
+    module_path = ctx.module_path
+    if module_path is None:
         console.print("[red]Backend directory with main.py not found.[/red]")
         raise typer.Exit(1)
 
-    # Build the command to run the backend server
-    cmd = [
-        sys.executable,
-        "-m",
-        "uvicorn",
-        module_path,
-        "--host",
-        "0.0.0.0",
-        "--port",
-        str(port),
-    ]
-
-    if reload:
-        cmd.append("--reload")
-
     # Run the backend server
     try:
-        console.print(f"[bold]Starting backend server on port {port}[/bold]")
-        console.print(f"[cyan]API available at: http://localhost:{port}[/cyan]")
-        console.print(f"[cyan]API docs available at: http://localhost:{port}/docs[/cyan]")
-        console.print(f"[dim]Using module: {module_path}[/dim]")
-
-        # Use start_new_session on Unix-like systems to create a new process group
-        # This ensures child processes can be properly terminated
-        kwargs = {}
-        if sys.platform != "win32":
-            kwargs["start_new_session"] = True
+        with _output_lock:
+            console.print(f"[bold]Starting backend server on port {port}[/bold]")
+            console.print(f"[cyan]API available at: http://localhost:{port}[/cyan]")
+            console.print(f"[cyan]API docs available at: http://localhost:{port}/docs[/cyan]")
+            console.print(f"[dim]Using module: {module_path}[/dim]")
+
+        # Without the reloader there is no supervising parent to keep, so serve from
+        # this interpreter and skip starting (and importing into) a second one
+        if not ctx.reload:
+            server = _serve_in_process(ctx.project_dir, module_path, port)
+            if server is not None:
+                return server
+
+        # Build the command to run the backend server
+        cmd = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            module_path,
+            "--host",
+            "0.0.0.0",
+            "--port",
+            str(port),
+        ]
+
+        if ctx.reload:
+            cmd.append("--reload")
+
+        # Start a new process group so child processes can be properly terminated
+        kwargs = _process_group_kwargs()
 
         # Add PYTHONPATH to ensure the package can be imported
-        env = os.environ.copy()
-        env["PYTHONPATH"] = str(project_dir)
+        env = {**os.environ, "PYTHONPATH": str(ctx.project_dir)}
 
-        process = subprocess.Popen(cmd, cwd=str(project_dir), env=env, **kwargs)
+        process = subprocess.Popen(cmd, cwd=str(ctx.project_dir), env=env, **kwargs)
 
         return process
 
@@ -238,30 +343,96 @@ def run_backend(project_dir: Path, port: int, reload: bool):
         raise typer.Exit(1)
 
 
-def run_frontend(project_dir: Path, port: int):
+class _InProcessServer:
+    """
+    A uvicorn server running on a background thread of this process.
+
+    Provides the part of the subprocess.Popen interface the run command relies on,
+    so it is tracked, awaited and shut down like a server process.
+    """
+
+    def __init__(self, server) -> None:
+        self._server = server
+        self._thread = threading.Thread(target=self._serve, name="uvicorn", daemon=True)
+        self.returncode: int | None = None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _serve(self) -> None:
+        try:
+            self._server.run()
+        except SystemExit as e:
+            # uvicorn exits when the app cannot be imported or the port cannot be bound
+            self.returncode = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            self.returncode = 1
+            raise
+        else:
+            self.returncode = 0
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise subprocess.TimeoutExpired("uvicorn", timeout)
+        return self.returncode
+
+    def terminate(self) -> None:
+        self._server.should_exit = True
+
+    def kill(self) -> None:
+        self._server.force_exit = True
+        self._server.should_exit = True
+
+
+def _serve_in_process(project_dir: Path, module_path: str, port: int) -> _InProcessServer | None:
+    """Start the backend on a thread of this process, or return None if uvicorn is unavailable."""
+    try:
+        import uvicorn
+    except ImportError:
+        return None
+
+    # The subprocess finds the project through PYTHONPATH; here it goes on sys.path
+    if str(project_dir) not in sys.path:
+        sys.path.insert(0, str(project_dir))
+
+    server = _InProcessServer(
+        uvicorn.Server(uvicorn.Config(module_path, host="0.0.0.0", port=port))
+    )
+    server.start()
+    return server
+
+
+def run_frontend(ctx: RunContext):
     """Run the frontend server."""
-    frontend_dir = project_dir / "frontend"
+    console = get_console()
+    port = ctx.frontend_port
+    frontend_dir = ctx.frontend_dir
 
-    # Check if the frontend directory exists
-    if not frontend_dir.exists():
+    # Read the frontend directory once; its listing answers every check below
+    try:
+        with os.scandir(frontend_dir) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         console.print("[red]Frontend directory not found. Cannot run frontend server.[/red]")
         raise typer.Exit(1)
 
     # Check if package.json exists
-    if not (frontend_dir / "package.json").exists():
+    if "package.json" not in names:
         console.print(
             "[red]package.json not found in frontend directory. Cannot run frontend server.[/red]"
         )
         raise typer.Exit(1)
 
     try:
-        # Check if yarn.lock exists
-        if (frontend_dir / "yarn.lock").exists():
+        # Pick the package manager from the lock file present, defaulting to npm
+        if "yarn.lock" in names:
             cmd = ["yarn", "dev"]
-        # Check if pnpm-lock.yaml exists
-        elif (frontend_dir / "pnpm-lock.yaml").exists():
+        elif "pnpm-lock.yaml" in names:
             cmd = ["pnpm", "dev"]
-        # Default to npm
         else:
             cmd = ["npm", "run", "dev"]
 
@@ -269,20 +440,16 @@ def run_frontend(project_dir: Path, port: int):
         if port != 3000:
             cmd.extend(["--", "--port", str(port)])
 
-        console.print(f"[bold]Starting frontend server on port {port}[/bold]")
-        console.print(f"[cyan]Frontend available at: http://localhost:{port}[/cyan]")
+        with _output_lock:
+            console.print(f"[bold]Starting frontend server on port {port}[/bold]")
+            console.print(f"[cyan]Frontend available at: http://localhost:{port}[/cyan]")
 
-        # Use start_new_session on Unix-like systems to create a new process group
-        # This ensures child processes can be properly terminated
-        kwargs = {}
-        if sys.platform != "win32":
-            kwargs["start_new_session"] = True
+        # Start a new process group so child processes can be properly terminated
+        kwargs = _process_group_kwargs()
 
         # Set environment variables for the frontend process
-        env = os.environ.copy()
-        backend_port = os.environ.get("BACKEND_PORT", "8000")
-        env["BACKEND_URL"] = f"http://localhost:{backend_port}"
-        env["NEXT_PUBLIC_BACKEND_URL"] = f"http://localhost:{backend_port}"
+        backend_url = f"http://localhost:{os.environ.get('BACKEND_PORT', '8000')}"
+        env = {**os.environ, "BACKEND_URL": backend_url, "NEXT_PUBLIC_BACKEND_URL": backend_url}
 
         process = subprocess.Popen(cmd, cwd=str(frontend_dir), env=env, **kwargs)
 
@@ -300,18 +467,24 @@ def run_frontend(project_dir: Path, port: int):
         raise typer.Exit(1)
 
 
-def run_both(project_dir: Path, backend_port: int, frontend_port: int, reload: bool):
+def run_both(ctx: RunContext):
     """Run both backend and frontend servers."""
-    # Start backend
-    backend_process = run_backend(project_dir, backend_port, reload)
-    if backend_process:
-        _processes.append(backend_process)
+    console = get_console()
+    backend_port, frontend_port = ctx.backend_port, ctx.frontend_port
 
-    # Start frontend
+    # The two servers share nothing, so spawn them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_future = executor.submit(run_backend, ctx)
+        frontend_future = executor.submit(run_frontend, ctx)
+
+    # Track whichever servers started before reporting a failure, so none are orphaned
+    for future in (backend_future, frontend_future):
+        if future.exception() is None and future.result():
+            _processes.append(future.result())
+
+    backend_process = backend_future.result()
     try:
-        frontend_process = run_frontend(project_dir, frontend_port)
-        if frontend_process:
-            _processes.append(frontend_process)
+        frontend_process = frontend_future.result()
     except typer.Exit:
         # If frontend fails, kill backend and exit
         console.print(
@@ -327,17 +500,37 @@ def run_both(project_dir: Path, backend_port: int, frontend_port: int, reload: b
     console.print(f"[cyan]Frontend available at: http://localhost:{frontend_port}[/cyan]")
     console.print("\n[yellow]Press Ctrl+C to stop all servers[/yellow]")
 
-    # Wait for processes to complete
+    # Wait until either server exits, so a crashed frontend is noticed as well
     try:
-        # Wait for the backend process specifically
-        if backend_process:
-            backend_process.wait()
+        exited = _wait_for_first_exit([backend_process, frontend_process])
     except KeyboardInterrupt:
         # This shouldn't actually be reached because of our signal handler,
         # but just in case...
         console.print("\n[yellow]Shutting down servers...[/yellow]")
         cleanup_processes()
         console.print("[green]Servers shut down successfully.[/green]")
+        return
+
+    server = "Backend" if exited is backend_process else "Frontend"
+    console.print(
+        f"\n[yellow]{server} server exited with code {exited.returncode}. "
+        "Shutting down the other server...[/yellow]"
+    )
+    cleanup_processes()
+
+
+def _wait_for_first_exit(processes: list[subprocess.Popen]) -> subprocess.Popen:
+    """Block until one of the processes exits and return it."""
+    exited: queue.SimpleQueue = queue.SimpleQueue()
+
+    def watch(proc: subprocess.Popen) -> None:
+        proc.wait()
+        exited.put(proc)
+
+    # One daemon watcher per child; they end once cleanup stops the survivors
+    for proc in processes:
+        threading.Thread(target=watch, args=(proc,), daemon=True).start()
+    return exited.get()
 
 
 # Export the command as app
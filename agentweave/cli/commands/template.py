@@ -6,16 +6,19 @@ import os
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from agentweave.cli._console import get_console
+from agentweave.utils.config import load_yaml_file
 from agentweave.utils.template_generator import (
     create_template_from_project,
     get_templates_dir,
 )
 
-app = typer.Typer(help="Manage project templates")
-console = Console()
+app = typer.Typer(
+    name="template",
+    help="Manage project templates",
+    add_completion=False,
+)
 
 
 @app.command("create")
@@ -29,55 +32,56 @@ def create_template(
     ),
 ):
     """Create a new template from an existing project."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Creating template...", total=1)
+    console = get_console()
+    console.print("[cyan]Creating template...[/cyan]")
 
+    try:
+        # One stat answers "does it exist?" before the path is resolved
         try:
-            project_path = Path(project_dir).resolve()
-            if not project_path.exists():
-                console.print(f"[red]Error: Project directory {project_dir} not found[/red]")
-                raise typer.Exit(1)
-
-            create_template_from_project(
-                project_dir=project_path,
-                template_name=template_name,
-                exclude_paths=exclude,
-            )
-
-            progress.update(task, completed=1, description="Template created successfully!")
-
-            console.print(
-                f"\n[bold green]✓ Template '{template_name}' created successfully![/bold green]"
-            )
-            console.print("\n[cyan]Now update the template by:[/cyan]")
-            console.print(f"  1. Edit files in {get_templates_dir() / template_name}")
-            console.print(
-                "  2. Replace project-specific values with placeholders like {{project_name}}"
-            )
-            console.print("  3. Update schema.yaml with appropriate configuration options")
-
-        except Exception as e:
-            console.print(f"[red]Error creating template: {str(e)}[/red]")
+            os.stat(project_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            console.print(f"[red]Error: Project directory {project_dir} not found[/red]")
             raise typer.Exit(1)
+        project_path = Path(os.path.realpath(project_dir))
+
+        create_template_from_project(
+            project_dir=project_path,
+            template_name=template_name,
+            exclude_paths=exclude,
+        )
+
+        console.print(
+            f"\n[bold green]✓ Template '{template_name}' created successfully![/bold green]"
+        )
+        console.print("\n[cyan]Now update the template by:[/cyan]")
+        console.print(f"  1. Edit files in {get_templates_dir() / template_name}")
+        console.print(
+            "  2. Replace project-specific values with placeholders like {{project_name}}"
+        )
+        console.print("  3. Update schema.yaml with appropriate configuration options")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error creating template: {str(e)}[/red]")
+        raise typer.Exit(1)
 
 
 @app.command("list")
 def list_templates():
     """List available templates."""
+    console = get_console()
     templates_dir = get_templates_dir()
-    templates = [d.name for d in templates_dir.iterdir() if d.is_dir()]
+    with os.scandir(templates_dir) as it:
+        templates = sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
 
     if not templates:
         console.print("[yellow]No templates found.[/yellow]")
         return
 
-    console.print("[bold]Available templates:[/bold]")
-    for template in sorted(templates):
-        console.print(f"  • {template}")
+    lines = ["[bold]Available templates:[/bold]"]
+    lines.extend(f"  • {template}" for template in templates)
+    console.print("\n".join(lines))
 
 
 @app.command("info")
@@ -85,6 +89,7 @@ def template_info(
     template_name: str = typer.Argument(..., help="Name of the template to show info for"),
 ):
     """Show information about a template."""
+    console = get_console()
     templates_dir = get_templates_dir()
     template_dir = templates_dir / template_name
 
@@ -95,54 +100,61 @@ def template_info(
     # Check if the template has a schema.yaml file
     schema_path = template_dir / "schema.yaml"
 
-    console.print(f"[bold]Template:[/bold] {template_name}")
+    # Collect the whole report and render it with a single print
+    lines = [f"[bold]Template:[/bold] {template_name}"]
 
     if schema_path.exists():
-        import yaml
-
-        with open(schema_path) as f:
-            schema = yaml.safe_load(f)
+        schema = load_yaml_file(schema_path)
 
         if "description" in schema:
-            console.print(f"[bold]Description:[/bold] {schema['description']}")
+            lines.append(f"[bold]Description:[/bold] {schema['description']}")
+
+        # Look up each field's definition once; a set makes the optional split linear
+        properties = schema.get("properties") or {}
+        required = schema.get("required") or []
+        required_set = set(required)
+
+        def field_line(field: str) -> str:
+            description = (properties.get(field) or {}).get("description")
+            return f"  • {field} - {description}" if description else f"  • {field}"
 
         if "required" in schema:
-            console.print("\n[bold]Required configuration:[/bold]")
-            for field in schema["required"]:
-                description = ""
-                if "properties" in schema and field in schema["properties"]:
-                    if "description" in schema["properties"][field]:
-                        description = f" - {schema['properties'][field]['description']}"
-                console.print(f"  • {field}{description}")
-
-        if "properties" in schema:
-            optional_props = [
-                p
-                for p in schema["properties"]
-                if "required" not in schema or p not in schema["required"]
-            ]
-
-            if optional_props:
-                console.print("\n[bold]Optional configuration:[/bold]")
-                for field in optional_props:
-                    description = ""
-                    if "description" in schema["properties"][field]:
-                        description = f" - {schema['properties'][field]['description']}"
-                    console.print(f"  • {field}{description}")
+            lines.append("\n[bold]Required configuration:[/bold]")
+            lines.extend(field_line(field) for field in required)
+
+        optional_props = [p for p in properties if p not in required_set]
+        if optional_props:
+            lines.append("\n[bold]Optional configuration:[/bold]")
+            lines.extend(field_line(field) for field in optional_props)
     else:
-        console.print("[yellow]No schema.yaml found for this template.[/yellow]")
+        lines.append("[yellow]No schema.yaml found for this template.[/yellow]")
 
     # List files in the template
-    console.print("\n[bold]Template structure:[/bold]")
-    for root, _dirs, files in os.walk(template_dir):
-        level = root.replace(str(template_dir), "").count(os.sep)
-        indent = "  " * level
-        rel_path = os.path.relpath(root, template_dir)
-
-        if rel_path != ".":
-            console.print(f"{indent}• {os.path.basename(root)}/")
-
-        sub_indent = "  " * (level + 1)
-        for file in sorted(files):
-            if file != "schema.yaml":  # Skip schema file as we've already processed it
-                console.print(f"{sub_indent}◦ {file}")
+    lines.append("\n[bold]Template structure:[/bold]")
+    _tree_lines(str(template_dir), lines)
+
+    console.print("\n".join(lines))
+
+
+def _tree_lines(root: str, lines: list[str]) -> None:
+    """Append a directory tree, listing each directory's files before its subdirectories."""
+    # Explicit stack of (name, path, depth); subdirectories are pushed in reverse so
+    # they pop, and print, in sorted order
+    stack = [("", root, 0)]
+    while stack:
+        name, path, depth = stack.pop()
+        if depth:
+            lines.append(f"{'  ' * depth}• {name}/")
+
+        # Directory entries carry their type, so no per-entry stat is needed
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        indent = "  " * (depth + 1)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.name, entry.path, depth + 1))
+            elif entry.name != "schema.yaml":  # Skip schema file as we've already processed it
+                lines.append(f"{indent}◦ {entry.name}")
+        stack.extend(reversed(subdirs))
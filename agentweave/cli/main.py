@@ -3,42 +3,69 @@ AgentWeave CLI - A tool for initializing and managing AI agent projects based on
 """
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-
-from agentweave.cli.commands import (
-    add,
-    convert_to_template,
-    deploy,
-    dev,
-    init,
-    install_env,
-    list_cmd,
-    run,
-    template,
-)
+from typer.core import TyperGroup
+
+from agentweave.cli import commands
+from agentweave.cli._console import get_console
+
+# Commands are imported from agentweave.cli.commands only when they are dispatched,
+# so running one command never pays for loading the others.
+# Direct commands: command name -> module whose `app` is the command function
+_LAZY_COMMANDS = {
+    "init": "init",
+    "run": "run",
+    "install_env": "install_env",
+    "dev": "dev",
+}
+# Command groups: command name -> module whose `app` is a Typer sub-app
+_LAZY_GROUPS = {
+    "add": "add",
+    "list": "list_cmd",
+    "deploy": "deploy",
+    "template": "template",
+    "convert-to-template": "convert_to_template",
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Top-level command group that loads subcommand modules on first lookup."""
+
+    def list_commands(self, ctx):
+        # Keep the help listing in the original order: direct commands, then the
+        # ones defined in this module, then the groups
+        return list(dict.fromkeys([*_LAZY_COMMANDS, *super().list_commands(ctx), *_LAZY_GROUPS]))
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and (cmd_name in _LAZY_COMMANDS or cmd_name in _LAZY_GROUPS):
+            command = _load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+
+def _load_command(name: str):
+    """Import a subcommand's module and build its Click command."""
+    module = getattr(commands, _LAZY_COMMANDS.get(name) or _LAZY_GROUPS[name])
+
+    if isinstance(module.app, typer.Typer):
+        command = typer.main.get_command(module.app)
+    else:
+        wrapper = typer.Typer(add_completion=False)
+        wrapper.command(name=name)(module.app)
+        command = typer.main.get_command(wrapper)
+
+    command.name = name
+    return command
+
 
 # Create Typer app
 app = typer.Typer(
     name="agentweave",
     help="CLI tool for initializing and managing AI agent projects based on LangGraph",
     add_completion=False,
+    cls=_LazyGroup,
 )
 
-# Register commands
-app.command(name="init")(init.app)  # Register init as a direct command
-app.add_typer(add.app, name="add")
-app.add_typer(list_cmd.app, name="list")
-app.command(name="run")(run.app)  # Register run as a direct command
-app.add_typer(deploy.app, name="deploy")
-app.add_typer(template.app, name="template")
-app.add_typer(convert_to_template.app, name="convert-to-template")
-app.command(name="install_env")(install_env.app)  # Register install_env as a direct command
-app.command(name="dev")(dev.app)  # Register dev as a direct command
-
-console = Console()
-
 
 @app.callback()
 def callback():
@@ -53,12 +80,15 @@ def version():
     """Show the current version of AgentWeave"""
     from agentweave import __version__
 
-    console.print(f"AgentWeave v{__version__}")
+    get_console().print(f"AgentWeave v{__version__}")
 
 
 @app.command()
 def info():
     """Display information about AgentWeave"""
+    from rich.panel import Panel
+    from rich.text import Text
+
     from agentweave import __version__
 
     title = Text("AgentWeave", style="bold cyan")
@@ -82,7 +112,7 @@ def info():
         padding=(1, 2),
     )
 
-    console.print(panel)
+    get_console().print(panel)
 
 
 if __name__ == "__main__":
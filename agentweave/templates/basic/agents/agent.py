@@ -4,12 +4,20 @@ Main agent implementation for {{project_name}}.
 This file implements a LangGraph agent with configurable tools.
 """
 
+import asyncio
+import itertools
 import json
 import logging
 import operator
 import os
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated, Any, TypedDict
 
 from backend.utils.config import get_llm_config
@@ -19,17 +27,62 @@ from langchain_core.messages import (
     HumanMessage,
     SystemMessage,
     ToolMessage,
+    get_buffer_string,
 )
-from langchain_core.tools import BaseTool
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, Tool
+from langchain_openai import ChatOpenAI, OpenAI
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
+from agents.llm_cache import get_response_cache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global registry of active agents
-_agents = {}
+# Optional components, resolved once; the agent works without any of them
+try:
+    from tools.weather import WeatherTool
+except ImportError as e:
+    logger.warning("Weather tool unavailable: %s", e)
+    WeatherTool = None
+
+try:
+    from langchain.chains import LLMMathChain
+except ImportError as e:
+    logger.warning("Calculator tool unavailable: %s", e)
+    LLMMathChain = None
+
+try:
+    from tools.registry import get_available_tools
+except ImportError as e:
+    logger.warning("Tool registry unavailable: %s", e)
+    get_available_tools = None
+
+# orjson is used for tool arguments when installed, the standard library otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON, with orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_sorted(obj: Any) -> str:
+    """Serialize to JSON with sorted keys, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True)
+
+
+# Agents for recently active conversations, least recently used first. Conversation
+# state lives in the checkpointer, so an evicted agent is simply rebuilt on demand.
+_agents: OrderedDict[str, dict[str, Any]] = OrderedDict()
+MAX_ACTIVE_AGENTS = int(os.environ.get("MAX_ACTIVE_AGENTS", "100"))
 
 # Default system prompt
 DEFAULT_SYSTEM_PROMPT = """You are an AI assistant for {{project_name}}.
@@ -52,6 +105,197 @@ Step by step:
 Important: You must use the appropriate tool rather than making up information yourself.
 """
 
+# Number of most recent messages sent to the LLM verbatim; older ones are summarized
+RECENT_MESSAGES = 6
+# How many messages must leave the window before an existing summary is refreshed;
+# the first summary is made as soon as any message leaves it
+SUMMARY_REFRESH_MESSAGES = 6
+SUMMARY_INSTRUCTION_MESSAGE = SystemMessage(
+    content="Summarize the conversation below in at most 200 tokens. Keep names, facts, "
+    "decisions and open questions that later turns may refer to."
+)
+
+# Per-turn instruction appended after the conversation for weather questions
+WEATHER_HINT_MESSAGE = SystemMessage(
+    content="The user is asking about weather. Use the weather tool to get the most "
+    "up-to-date information."
+)
+
+
+# Tools whose single argument is a location; a lone argument under another name is
+# passed on as the location
+_LOCATION_ARG_TOOLS = frozenset({"weather"})
+
+# Words that make a message weather-related, and phrases that suggest a weather lookup
+_WEATHER_KEYWORD_RE = re.compile(
+    r"\b(?:weather|temperature|hot|cold|rainy|sunny|forecast)\b", re.IGNORECASE
+)
+_WEATHER_PATTERN_RE = re.compile(
+    r"\b(?:weather (?:in|for|at)|temperature in|current weather|check weather)\b",
+    re.IGNORECASE,
+)
+
+# Plain weather lookups ("What's the weather in Paris?") are routed straight to the
+# weather tool. The whole message must match, so anything more involved still goes
+# through the LLM.
+_SIMPLE_WEATHER_QUERY = re.compile(
+    r"^\s*(?:(?:what(?:'s| is) )?(?:the )?(?:current )?weather (?:like )?(?:in|for|at)|"
+    r"weather (?:in|for|at))\s+([a-z][a-z .,'-]*?)\s*(?:today|now|right now)?\s*[?.!]*\s*$",
+    re.IGNORECASE,
+)
+# Words that turn a location into a compound request the LLM has to handle
+_COMPOUND_QUERY_WORDS = re.compile(r"\b(?:and|or|but|if|should|will|vs)\b", re.IGNORECASE)
+# Upper bound on tool calls from one LLM turn that run at the same time
+MAX_PARALLEL_TOOLS = 8
+
+# Seconds a single tool call may take before it is abandoned and retried
+DEFAULT_TOOL_TIMEOUT = 10.0
+# Retries after a timeout, with exponential backoff starting at TOOL_RETRY_BACKOFF
+TOOL_TIMEOUT_RETRIES = 1
+TOOL_RETRY_BACKOFF = 0.5
+
+# Repeat tool calls (same tool, same arguments) reuse the earlier result for this long
+TOOL_CACHE_TTL = 300.0
+# Maximum number of tool results remembered per agent
+TOOL_CACHE_MAX_ENTRIES = 256
+
+# Only the most recent execution steps are kept, and message contents recorded in
+# a step are cut to this many characters
+MAX_EXECUTION_STEPS = 500
+STEP_PREVIEW_CHARS = 200
+
+# Chat models with their tools bound, keyed on (model, temperature, tool names)
+_bound_llms: OrderedDict[tuple, tuple[Any, Any]] = OrderedDict()
+_bound_llms_lock = threading.Lock()
+MAX_BOUND_LLMS = 8
+
+# Messages longer than this are never routed around the LLM
+_SIMPLE_QUERY_MAX_WORDS = 12
+
+
+def _get_bound_llm(model: str, temperature: float, tools: list[BaseTool]) -> tuple[Any, Any]:
+    """
+    Get the chat model and its tool-bound runnable for the given settings.
+
+    The result depends only on the model settings and the tools' names and schemas,
+    so it is built once and shared by every agent that uses the same combination.
+    This also shares the client's HTTP connection pool between conversations.
+
+    Args:
+        model: The model name
+        temperature: The sampling temperature
+        tools: The tools to bind
+
+    Returns:
+        The chat model and the runnable to invoke (the model itself if binding failed)
+    """
+    key = (model, temperature, tuple(sorted(tool.name for tool in tools)))
+    with _bound_llms_lock:
+        if key in _bound_llms:
+            _bound_llms.move_to_end(key)
+            return _bound_llms[key]
+
+    try:
+        chat_model = ChatOpenAI(model=model, temperature=temperature)
+
+        # Handle tool binding
+        if tools:
+            try:
+                # Try with the current API
+                llm = chat_model.bind_tools(tools)
+                logger.info(f"Successfully bound {len(tools)} tools to LLM")
+            except Exception as e:
+                logger.error(f"Error binding tools to model with bind_tools: {str(e)}")
+
+                # Try legacy method
+                try:
+                    llm = chat_model.bind(functions=[tool.metadata for tool in tools])
+                    logger.info("Successfully bound tools using legacy method")
+                except Exception as e2:
+                    logger.error(f"Error binding tools with legacy method: {str(e2)}")
+                    llm = chat_model
+                    logger.warning("Using LLM without tool binding")
+        else:
+            llm = chat_model
+            logger.warning("No tools to bind to LLM")
+    except Exception as e:
+        logger.error(f"Error initializing LLM: {str(e)}")
+        import traceback
+
+        logger.error(traceback.format_exc())
+
+        # Fall back to default initialization, without caching it
+        chat_model = ChatOpenAI()
+        return chat_model, chat_model
+
+    with _bound_llms_lock:
+        _bound_llms[key] = (chat_model, llm)
+        while len(_bound_llms) > MAX_BOUND_LLMS:
+            _bound_llms.popitem(last=False)
+
+    return chat_model, llm
+
+
+def _window_start(messages: list[AnyMessage]) -> int:
+    """
+    Index of the first message sent to the LLM verbatim.
+
+    The window never starts on a tool result, because its tool call would have
+    been cut off.
+    """
+    start = max(len(messages) - RECENT_MESSAGES, 0)
+    while start < len(messages) and isinstance(messages[start], ToolMessage):
+        start += 1
+    return start
+
+
+def _parse_tool_call(tool_call: Any) -> tuple[str | None, dict[str, Any], str | None]:
+    """
+    Extract the name, arguments and id from a tool call.
+
+    Handles LangChain's tool call dicts (``name``/``args``/``id``), which is what
+    the model normally produces, as well as OpenAI-style calls that keep the name
+    and JSON-encoded arguments under ``function``, as dicts or objects.
+
+    Args:
+        tool_call: The tool call as produced by the LLM
+
+    Returns:
+        The tool name, its arguments as a dict, and the tool call id
+    """
+    if isinstance(tool_call, dict):
+        tool_id = tool_call.get("id")
+        if "name" in tool_call and "args" in tool_call:
+            tool_name, tool_args = tool_call["name"], tool_call["args"]
+        else:
+            function = tool_call.get("function", {})
+            tool_name = tool_call.get("name") or function.get("name")
+            tool_args = tool_call.get("args") or function.get("arguments", "{}")
+    else:
+        tool_id = getattr(tool_call, "id", None)
+        function = getattr(tool_call, "function", None)
+        tool_name = getattr(tool_call, "name", None) or getattr(function, "name", None)
+        tool_args = getattr(tool_call, "args", None)
+        if tool_args is None:
+            tool_args = getattr(function, "arguments", "{}")
+
+    # Log what we extracted
+    logger.info("Extracted tool call: name=%s, args=%s, id=%s", tool_name, tool_args, tool_id)
+
+    # Convert string arguments to dict if needed
+    if isinstance(tool_args, str):
+        try:
+            tool_args = _json_loads(tool_args)
+        except Exception as e:
+            logger.warning("Failed to parse tool arguments: %s. Using as string input.", e)
+
+    # Anything that is still not a dict is passed on as the tool's single input
+    if not isinstance(tool_args, dict):
+        key = "location" if tool_name in _LOCATION_ARG_TOOLS else "input"
+        tool_args = {key: tool_args}
+
+    return tool_name, tool_args, tool_id
+
 
 # Define the agent state schema
 class AgentState(TypedDict):
@@ -62,6 +306,46 @@ class AgentState(TypedDict):
     context: dict[str, Any]
 
 
+def _run_agent(config: RunnableConfig) -> "Agent":
+    """Get the agent a shared graph invocation is running for."""
+    return config["configurable"]["agent"]
+
+
+async def _call_llm_node(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+    return await _run_agent(config).call_llm(state)
+
+
+async def _execute_tool_node(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+    return await _run_agent(config).execute_tool(state)
+
+
+def _should_use_tool(state: AgentState, config: RunnableConfig) -> bool:
+    return _run_agent(config).should_use_tool(state)
+
+
+@lru_cache(maxsize=None)
+def _get_compiled_graph(checkpointer: BaseCheckpointSaver) -> Any:
+    """
+    Compile the agent graph for a checkpointer.
+
+    The graph's shape is the same for every agent, so it is compiled once and its
+    nodes dispatch to the agent passed in the invocation config.
+    """
+    # Build the graph
+    graph = StateGraph(AgentState)
+    graph.add_node("llm", _call_llm_node)
+    graph.add_node("action", _execute_tool_node)
+
+    # Add conditional edges
+    graph.add_conditional_edges("llm", _should_use_tool, {True: "action", False: END})
+
+    graph.add_edge("action", "llm")
+    graph.set_entry_point("llm")
+
+    # Compile the graph
+    return graph.compile(checkpointer=checkpointer)
+
+
 class Agent:
     """
     Agent implementation using LangGraph with a class-based approach.
@@ -72,13 +356,32 @@ class Agent:
         model_config: dict[str, Any],
         tools: list[BaseTool],
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
     ):
         """Initialize an agent with model configuration, tools, and system prompt."""
         self.model_config = model_config
         self.system_prompt = system_prompt
+        self.tool_timeout = tool_timeout
+
+        # Recent tool results keyed on (tool name, normalized arguments), least recent first
+        self._tool_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._tool_cache_lock = threading.Lock()
+        # Built once so every call sends a byte-identical prompt prefix
+        self._system_message = SystemMessage(content=system_prompt)
+        # Shortened prompt recorded in every LLM execution step
+        self._system_prompt_preview = (
+            system_prompt[:100] + "..." if len(system_prompt) > 100 else system_prompt
+        )
+
+        # Summary of the messages that have left the prompt window, refreshed in the
+        # background; _summarized_upto counts the messages it covers
+        self._running_summary = ""
+        self._summarized_upto = 0
+        self._summary_task: asyncio.Task | None = None
 
         # Add execution steps tracking
-        self.execution_steps = []
+        self.execution_steps: deque[dict[str, Any]] = deque(maxlen=MAX_EXECUTION_STEPS)
+        self._step_counter = itertools.count(1)
 
         # Make sure we have at least one tool
         if not tools:
@@ -101,29 +404,24 @@ class Agent:
                     continue
 
                 # Special handling for weather tool
-                if tool.name == "weather":
+                if tool.name == "weather" and WeatherTool is not None:
                     # Try to ensure the weather tool has a proper API key
-                    try:
-                        from tools.weather import WeatherTool
-
-                        api_key = os.environ.get("OPENWEATHER_API_KEY")
-                        if api_key:
-                            if api_key == "your_openweather_api_key_here":
-                                logger.warning(
-                                    "Using placeholder OpenWeather API key. Weather tool will return mock data."
-                                )
-                            else:
-                                # Create a new instance with the API key
-                                logger.info(
-                                    f"Creating new WeatherTool instance with API key: {api_key[:4]}..."
-                                )
-                                tool = WeatherTool(api_key=api_key)
-                                # Print confirmation for debugging
-                                logger.info(
-                                    f"Weather tool initialized: {tool.name} with API key: {api_key[:4]}..."
-                                )
-                    except ImportError:
-                        logger.warning("Could not import WeatherTool - using original tool")
+                    api_key = os.environ.get("OPENWEATHER_API_KEY")
+                    if api_key and getattr(tool, "api_key", None) != api_key:
+                        if api_key == "your_openweather_api_key_here":
+                            logger.warning(
+                                "Using placeholder OpenWeather API key. Weather tool will return mock data."
+                            )
+                        else:
+                            # Create a new instance with the API key
+                            logger.info(
+                                f"Creating new WeatherTool instance with API key: {api_key[:4]}..."
+                            )
+                            tool = WeatherTool(api_key=api_key)
+                            # Print confirmation for debugging
+                            logger.info(
+                                f"Weather tool initialized: {tool.name} with API key: {api_key[:4]}..."
+                            )
 
                 processed_tools.append(tool)
                 logger.info(f"Added tool: {tool.name}")
@@ -140,81 +438,58 @@ class Agent:
         # Log available tools for debugging
         logger.info(f"Available tools in agent: {list(self.tools_map.keys())}")
 
-        # Initialize LLM
-        # Make sure ChatOpenAI is imported at the top level of the file
-        try:
-            self.model = ChatOpenAI(
-                model=model_config.get("model", "gpt-3.5-turbo"),
-                temperature=model_config.get("temperature", 0.7),
-            )
-
-            # Handle tool binding
-            if processed_tools:
-                try:
-                    # Try with the current API
-                    self.llm = self.model.bind_tools(processed_tools)
-                    logger.info(f"Successfully bound {len(processed_tools)} tools to LLM")
-                except Exception as e:
-                    logger.error(f"Error binding tools to model with bind_tools: {str(e)}")
-
-                    # Try legacy method
-                    try:
-                        self.llm = self.model.bind(
-                            functions=[tool.metadata for tool in processed_tools]
-                        )
-                        logger.info("Successfully bound tools using legacy method")
-                    except Exception as e2:
-                        logger.error(f"Error binding tools with legacy method: {str(e2)}")
-                        self.llm = self.model
-                        logger.warning("Using LLM without tool binding")
-            else:
-                self.llm = self.model
-                logger.warning("No tools to bind to LLM")
-        except Exception as e:
-            logger.error(f"Error initializing LLM: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
-
-            # Fall back to default initialization
-            self.model = ChatOpenAI()
-            self.llm = self.model
-
-        # Create checkpointer
-        memory = MemorySaver()
+        # Responses are cached per model, temperature and set of bound tools
+        self.response_cache = get_response_cache()
+        self._cache_scope = (
+            model_config.get("model", "gpt-3.5-turbo"),
+            model_config.get("temperature", 0.7),
+            tuple(sorted(self.tools_map)),
+        )
 
-        # Build the graph
-        graph = StateGraph(AgentState)
-        graph.add_node("llm", self.call_llm)
-        graph.add_node("action", self.execute_tool)
+        # Initialize LLM. Agents with the same settings share one client and tool binding.
+        self.model, self.llm = _get_bound_llm(
+            model_config.get("model", "gpt-3.5-turbo"),
+            model_config.get("temperature", 0.7),
+            processed_tools,
+        )
 
-        # Add conditional edges
-        graph.add_conditional_edges("llm", self.should_use_tool, {True: "action", False: END})
+        # The graph is shared by all agents; invocations pass the agent to run it for
+        # in the config (see graph_config). Conversation state is stored by the
+        # shared checkpointer.
+        self.graph = _get_compiled_graph(get_checkpointer())
 
-        graph.add_edge("action", "llm")
-        graph.set_entry_point("llm")
+    def graph_config(self, conversation_id: str) -> dict[str, Any]:
+        """Build the config that runs the shared graph for this agent and conversation."""
+        return {"configurable": {"thread_id": conversation_id, "agent": self}}
 
-        # Compile the graph
-        self.graph = graph.compile(checkpointer=memory)
+    def reset_execution_steps(self) -> None:
+        """Forget recorded execution steps and restart step numbering."""
+        self.execution_steps.clear()
+        self._step_counter = itertools.count(1)
 
-    def call_llm(self, state: AgentState) -> dict[str, Any]:
+    async def call_llm(self, state: AgentState) -> dict[str, Any]:
         """Call the LLM with the current conversation history."""
         # Create step to track this action
-        step_id = len(self.execution_steps) + 1
         step = {
-            "id": step_id,
+            "id": next(self._step_counter),
             "type": "llm_call",
             "timestamp": datetime.now().isoformat(),
-            "input": {
-                "system_prompt": self.system_prompt[:100] + "..."
-                if len(self.system_prompt) > 100
-                else self.system_prompt
-            },
+            "input": {"system_prompt": self._system_prompt_preview},
         }
 
         try:
             # Extract messages from state
             messages = state.get("messages", [])
+
+            # Answer simple lookups with a direct tool call instead of an LLM round trip
+            routed = self._try_deterministic_route(messages)
+            if routed is not None:
+                step["type"] = "deterministic_route"
+                step["output"] = routed.tool_calls
+                step["status"] = "success"
+                self.execution_steps.append(step)
+                return {"messages": [routed]}
+
             if not messages:
                 logger.warning("No messages in state")
                 step["output"] = "No messages to process"
@@ -224,55 +499,64 @@ class Agent:
 
             # Update step input with messages
             step["input"]["messages"] = [
-                msg.content if hasattr(msg, "content") else str(msg)
-                for msg in messages[-5:]
-                if messages
+                str(getattr(msg, "content", msg))[:STEP_PREVIEW_CHARS] for msg in messages[-5:]
             ]
 
             # Check if there are weather-related keywords in the last user message
-            modified_system_prompt = self.system_prompt
+            add_weather_hint = False
             if messages and hasattr(messages[-1], "content") and messages[-1].content:
-                last_message = messages[-1].content.lower()
-                weather_keywords = [
-                    "weather",
-                    "temperature",
-                    "hot",
-                    "cold",
-                    "rainy",
-                    "sunny",
-                    "forecast",
-                ]
+                last_message = messages[-1].content
 
                 # Check if any weather keyword is in the last message
-                if any(keyword in last_message for keyword in weather_keywords):
+                if _WEATHER_KEYWORD_RE.search(last_message) is not None:
                     # Add a custom instruction to use the weather tool
                     weather_tools_available = "weather" in self.tools_map
                     if weather_tools_available:
-                        logger.info("Adding weather tool instruction to system prompt")
-                        weather_instruction = "\nI notice you're asking about weather. I'll use the weather tool to get you the most up-to-date information."
-                        modified_system_prompt += weather_instruction
-
-            # Build the list of messages to send to the LLM
-            prompt_messages = [SystemMessage(content=modified_system_prompt)]
-
-            # Add only the recent messages to avoid context length issues
-            max_messages = 10  # Limit to avoid context length issues
-            for msg in messages[-max_messages:]:
-                prompt_messages.append(msg)
-
-            # Call the LLM directly
-            logger.info(f"Calling LLM with {len(prompt_messages)} messages")
-            response = self.llm.invoke(prompt_messages)
+                        logger.info("Adding weather tool instruction after the conversation")
+                        add_weather_hint = True
+
+            # Only the most recent messages are sent verbatim; older ones are covered
+            # by the running summary
+            window_start = _window_start(messages)
+            self._schedule_summary_refresh(messages[:window_start])
+            # Messages the summary does not cover yet are still sent verbatim
+            window_start = min(window_start, self._summarized_upto)
+
+            # Build the list of messages to send to the LLM. The system prompt always
+            # leads unchanged, so the provider can reuse its cached prompt prefix;
+            # per-turn hints go after the conversation instead of into the prompt.
+            prompt_messages = [self._system_message]
+            if self._running_summary:
+                prompt_messages.append(
+                    SystemMessage(
+                        content=f"Summary of the earlier conversation:\n{self._running_summary}"
+                    )
+                )
+            prompt_messages.extend(messages[window_start:])
+            if add_weather_hint:
+                prompt_messages.append(WEATHER_HINT_MESSAGE)
+
+            # Answer repeated prompts from the cache before touching the network
+            response = await self.response_cache.aget(self._cache_scope, prompt_messages)
+            if response is not None:
+                logger.info("Answering from the LLM response cache")
+                step["status"] = "cache_hit"
+            else:
+                # Identical prompts already in flight share that call's response
+                logger.info("Calling LLM with %d messages", len(prompt_messages))
+                response, shared = await self.response_cache.coalesce(
+                    self._cache_scope, prompt_messages, lambda: self.llm.ainvoke(prompt_messages)
+                )
+                step["status"] = "coalesced" if shared else "success"
 
             # Update the step with the result
             step["output"] = response.content if hasattr(response, "content") else str(response)
-            step["status"] = "success"
             self.execution_steps.append(step)
 
             return {"messages": [response]}
 
         except Exception as e:
-            logger.error(f"Error calling LLM: {str(e)}")
+            logger.error("Error calling LLM: %s", e)
 
             # Update the step with the error
             step["error"] = str(e)
@@ -282,6 +566,87 @@ class Agent:
             error_message = AIMessage(content=f"I encountered an error: {str(e)}")
             return {"messages": [error_message]}
 
+    def _try_deterministic_route(self, messages: list[AnyMessage]) -> AIMessage | None:
+        """
+        Turn a plain weather question into a weather tool call without the LLM.
+
+        Args:
+            messages: The conversation so far
+
+        Returns:
+            An AIMessage carrying the tool call, or None if the LLM should decide
+        """
+        if "weather" not in self.tools_map or not messages:
+            return None
+
+        last_message = messages[-1]
+        if not isinstance(last_message, HumanMessage) or not isinstance(last_message.content, str):
+            return None
+
+        # Cheap complexity gate before the regex: long messages need the LLM
+        word_count = len(last_message.content.split())
+        if word_count > _SIMPLE_QUERY_MAX_WORDS:
+            return None
+
+        match = _SIMPLE_WEATHER_QUERY.match(last_message.content)
+        if not match or _COMPOUND_QUERY_WORDS.search(match.group(1)):
+            return None
+
+        location = match.group(1).strip(" ,.")
+        logger.info("Routing weather query for '%s' directly (%d words)", location, word_count)
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": "weather",
+                    "args": {"location": location},
+                    "id": f"call_{uuid.uuid4().hex}",
+                }
+            ],
+        )
+
+    def _schedule_summary_refresh(self, older_messages: list[AnyMessage]) -> None:
+        """
+        Fold messages that left the prompt window into the running summary.
+
+        The summary is refreshed in a background task once enough new messages
+        have left the window, so the current turn never waits for it.
+        """
+        threshold = SUMMARY_REFRESH_MESSAGES if self._running_summary else 1
+        if len(older_messages) - self._summarized_upto < threshold:
+            return
+        if self._summary_task is not None and not self._summary_task.done():
+            return
+
+        new_messages = older_messages[self._summarized_upto :]
+        self._summary_task = asyncio.create_task(
+            self._refresh_summary(new_messages, len(older_messages))
+        )
+
+    async def _refresh_summary(self, new_messages: list[AnyMessage], covered_upto: int) -> None:
+        """
+        Update the running summary with messages it does not cover yet.
+
+        Args:
+            new_messages: Messages that left the prompt window since the last refresh
+            covered_upto: Number of messages the summary covers once they are added
+        """
+        # Sent as a plain transcript, so tool results need no matching tool calls
+        transcript = get_buffer_string(new_messages)
+        if self._running_summary:
+            transcript = f"Summary so far:\n{self._running_summary}\n\nNew messages:\n{transcript}"
+
+        try:
+            summary = await self.model.ainvoke(
+                [SUMMARY_INSTRUCTION_MESSAGE, HumanMessage(content=transcript)]
+            )
+            self._running_summary = str(summary.content)
+            # Only now, so messages are retried and kept in the prompt if this failed
+            self._summarized_upto = covered_upto
+            logger.info("Refreshed conversation summary (%d messages)", covered_upto)
+        except Exception as e:
+            logger.warning("Could not refresh the conversation summary: %s", e)
+
     def should_use_tool(self, state: AgentState) -> bool:
         """
         Determine if the agent should use a tool.
@@ -310,28 +675,20 @@ class Agent:
         # If tool_calls is explicitly defined, use it
         if tool_calls is not None:
             has_tool_calls = len(tool_calls) > 0
-            logger.info(f"Found {len(tool_calls) if has_tool_calls else 0} tool calls")
+            logger.info("Found %d tool calls", len(tool_calls))
             return has_tool_calls
 
         # If no tool_calls found but the content contains indicators of tools
         elif hasattr(last_message, "content") and last_message.content:
-            content = last_message.content.lower()
+            content = last_message.content
 
             # Check for patterns that suggest tool usage
-            weather_patterns = [
-                "weather in",
-                "weather for",
-                "temperature in",
-                "weather at",
-                "current weather",
-                "check weather",
-            ]
-
-            # Check if any weather pattern is in the content
-            for pattern in weather_patterns:
-                if pattern in content:
-                    logger.info(f"Detected weather pattern: '{pattern}' in message: '{content}'")
-                    return True
+            match = _WEATHER_PATTERN_RE.search(content)
+            if match is not None:
+                logger.info(
+                    "Detected weather pattern: '%s' in message: '%s'", match.group(0), content
+                )
+                return True
 
             # No tool use detected from content
             return False
@@ -339,7 +696,7 @@ class Agent:
         # Default case - no tool use
         return False
 
-    def execute_tool(self, state: AgentState) -> dict[str, Any]:
+    async def execute_tool(self, state: AgentState) -> dict[str, Any]:
         """
         Execute tools called by the LLM.
 
@@ -355,254 +712,315 @@ class Agent:
         last_message = state["messages"][-1]
 
         # Extract tool calls in a safe way
-        tool_calls = None
         if hasattr(last_message, "tool_calls"):
             tool_calls = last_message.tool_calls
-        elif (
-            hasattr(last_message, "additional_kwargs")
-            and "tool_calls" in last_message.additional_kwargs
-        ):
-            tool_calls = last_message.additional_kwargs.get("tool_calls")
+        else:
+            tool_calls = getattr(last_message, "additional_kwargs", {}).get("tool_calls")
 
         if not tool_calls:
             logger.warning("No tool calls found in message")
             return {"messages": []}
 
         # Log information about available tools
-        logger.info(f"Available tools: {list(self.tools_map.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Available tools: %s", list(self.tools_map.keys()))
+
+        # The request's context is passed on to tools that accept a RunnableConfig
+        context = state.get("context") or {}
+
+        # Tool calls are independent, so run them concurrently; the turn then takes
+        # as long as the slowest tool rather than the sum of all of them
+        if len(tool_calls) == 1:
+            outcomes = [await self._run_one_tool(tool_calls[0], context)]
+        else:
+            slots = asyncio.Semaphore(MAX_PARALLEL_TOOLS)
+
+            async def run_limited(tool_call: Any) -> tuple[ToolMessage, dict[str, Any]]:
+                async with slots:
+                    return await self._run_one_tool(tool_call, context)
 
+            outcomes = await asyncio.gather(*(run_limited(tc) for tc in tool_calls))
+
+        # Record the steps in call order once every tool has finished
         results = []
-        for tool_call in tool_calls:
-            # Extract tool information safely
-            if isinstance(tool_call, dict):
-                tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
-                tool_args = tool_call.get("args") or tool_call.get("function", {}).get(
-                    "arguments", "{}"
-                )
-                tool_id = tool_call.get("id")
-            else:
-                # Try different attributes that might exist
-                tool_name = None
-                tool_args = "{}"
-                tool_id = None
-
-                # Try to get name
-                if hasattr(tool_call, "name"):
-                    tool_name = tool_call.name
-                elif hasattr(tool_call, "function") and hasattr(tool_call.function, "name"):
-                    tool_name = tool_call.function.name
-
-                # Try to get args
-                if hasattr(tool_call, "args"):
-                    tool_args = tool_call.args
-                elif hasattr(tool_call, "function") and hasattr(tool_call.function, "arguments"):
-                    tool_args = tool_call.function.arguments
-
-                # Try to get id
-                if hasattr(tool_call, "id"):
-                    tool_id = tool_call.id
-
-            # Log what we extracted
-            logger.info(f"Extracted tool call: name={tool_name}, args={tool_args}, id={tool_id}")
-
-            # Convert string arguments to dict if needed
-            if isinstance(tool_args, str):
-                try:
-                    tool_args = json.loads(tool_args)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to parse tool arguments: {str(e)}. Using as string input."
-                    )
-                    tool_args = (
-                        {"location": tool_args} if tool_name == "weather" else {"input": tool_args}
-                    )
+        for message, step in outcomes:
+            step["id"] = next(self._step_counter)
+            self.execution_steps.append(step)
+            results.append(message)
+
+        return {"messages": results}
 
-            # Create a step to track this tool execution
-            step_id = len(self.execution_steps) + 1
-            step = {
-                "id": step_id,
-                "type": "tool_call",
-                "timestamp": datetime.now().isoformat(),
-                "tool": tool_name,
-                "input": tool_args,
-                "tool_id": tool_id,
-            }
+    async def _run_one_tool(
+        self, tool_call: Any, context: dict[str, Any]
+    ) -> tuple[ToolMessage, dict[str, Any]]:
+        """
+        Execute a single tool call.
 
-            logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
+        Args:
+            tool_call: The tool call as produced by the LLM
+            context: Additional context sent with the query
 
-            try:
-                if tool_name and tool_name in self.tools_map:
-                    tool = self.tools_map[tool_name]
-                    logger.info(f"Found tool in tools_map: {tool.name}")
-
-                    # Special handling for weather tool
-                    if (
-                        tool_name == "weather"
-                        and "location" not in tool_args
-                        and len(tool_args) > 0
-                    ):
-                        # Try to extract location from args
-                        if isinstance(tool_args, dict) and (
-                            first_value := next(iter(tool_args.values()), None)
-                        ):
-                            # Use the first value as location
-                            tool_args = {"location": first_value}
-                            logger.info(f"Extracted location from args: {tool_args}")
+        Returns:
+            The tool message for the conversation and the execution step to record
+        """
+        tool_name, tool_args, tool_id = _parse_tool_call(tool_call)
+
+        # Create a step to track this tool execution
+        step = {
+            "id": None,  # Assigned when the step is recorded
+            "type": "tool_call",
+            "timestamp": datetime.now().isoformat(),
+            "tool": tool_name,
+            "input": tool_args,
+            "tool_id": tool_id,
+        }
+
+        logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
 
-                    # Call the tool and get the result
-                    try:
-                        tool_result = tool.invoke(tool_args)
+        try:
+            tool = self.tools_map.get(tool_name) if tool_name else None
+            if tool is not None:
+                logger.info("Found tool in tools_map: %s", tool.name)
+
+                # Special handling for weather tool
+                if tool_name in _LOCATION_ARG_TOOLS and "location" not in tool_args:
+                    # Use the first argument's value as the location
+                    for first_value in tool_args.values():
+                        if first_value:
+                            tool_args = {"location": first_value}
+                            logger.info("Extracted location from args: %s", tool_args)
+                        break
 
-                        # Update the step with the result
-                        step["output"] = tool_result
+                # Call the tool and get the result
+                try:
+                    cache_key = self._tool_cache_key(tool, tool_args)
+                    tool_result = self._cached_tool_result(cache_key)
+                    if tool_result is None:
+                        tool_result = await self._invoke_tool(tool, tool_args, context)
+                        self._cache_tool_result(cache_key, tool_result)
                         step["status"] = "success"
-                        self.execution_steps.append(step)
-
-                        # Create a tool message for the result
-                        results.append(
-                            ToolMessage(
-                                content=str(tool_result),
-                                tool_call_id=tool_id or "unknown",
-                                name=tool_name,
-                            )
-                        )
-                    except Exception as e:
-                        # Tool execution failed
-                        error_msg = f"Error executing {tool_name}: {str(e)}"
-                        logger.error(error_msg)
-
-                        # Update the step with the error
-                        step["error"] = error_msg
-                        step["status"] = "error"
-                        self.execution_steps.append(step)
-
-                        # Create an error tool message
-                        results.append(
-                            ToolMessage(
-                                content=f"Error: {error_msg}",
-                                tool_call_id=tool_id or "unknown",
-                                name=tool_name,
-                            )
-                        )
-                else:
-                    # Tool not found
-                    error_msg = f"Tool {tool_name} not found in available tools: {list(self.tools_map.keys())}"
+                    else:
+                        step["status"] = "cache_hit"
+
+                    # Update the step with the result
+                    step["output"] = tool_result
+
+                    # Create a tool message for the result
+                    message = ToolMessage(
+                        content=str(tool_result),
+                        tool_call_id=tool_id or "unknown",
+                        name=tool_name,
+                    )
+                except Exception as e:
+                    # Tool execution failed
+                    error_msg = f"Error executing {tool_name}: {str(e)}"
                     logger.error(error_msg)
 
-                    # Try to provide a fallback for weather tool
-                    if tool_name == "weather" and "location" in tool_args:
-                        fallback_msg = (
-                            f"I don't have access to real-time weather data for {tool_args.get('location')}. "
-                            + "You can check a weather website or app for the current conditions."
-                        )
-                        results.append(
-                            ToolMessage(
-                                content=fallback_msg,
-                                tool_call_id=tool_id or "unknown",
-                                name=tool_name,
-                            )
-                        )
+                    # Update the step with the error
+                    step["error"] = error_msg
+                    step["status"] = "error"
 
-                        # Add step for tracking
-                        step["output"] = fallback_msg
-                        step["status"] = "success"  # Mark as success since we provided a fallback
-                        self.execution_steps.append(step)
-                    else:
-                        # Update the step with the error
-                        step["error"] = error_msg
-                        step["status"] = "error"
-                        self.execution_steps.append(step)
-
-                        # Create an error tool message
-                        results.append(
-                            ToolMessage(
-                                content=f"Error: {error_msg}",
-                                tool_call_id=tool_id or "unknown",
-                                name=tool_name if tool_name else "unknown_tool",
-                            )
-                        )
-            except Exception as e:
-                # Something went wrong in the try/except itself
-                error_msg = f"Error in tool execution process: {str(e)}"
+                    # Create an error tool message
+                    message = ToolMessage(
+                        content=f"Error: {error_msg}",
+                        tool_call_id=tool_id or "unknown",
+                        name=tool_name,
+                    )
+            else:
+                # Tool not found
+                error_msg = (
+                    f"Tool {tool_name} not found in available tools: {list(self.tools_map.keys())}"
+                )
                 logger.error(error_msg)
 
-                # Update the step with the error
-                step["error"] = error_msg
-                step["status"] = "error"
-                self.execution_steps.append(step)
+                # Try to provide a fallback for weather tool
+                if tool_name == "weather" and "location" in tool_args:
+                    fallback_msg = (
+                        f"I don't have access to real-time weather data for {tool_args.get('location')}. "
+                        + "You can check a weather website or app for the current conditions."
+                    )
+                    message = ToolMessage(
+                        content=fallback_msg,
+                        tool_call_id=tool_id or "unknown",
+                        name=tool_name,
+                    )
+
+                    # Add step for tracking
+                    step["output"] = fallback_msg
+                    step["status"] = "success"  # Mark as success since we provided a fallback
+                else:
+                    # Update the step with the error
+                    step["error"] = error_msg
+                    step["status"] = "error"
 
-                # Create an error tool message
-                results.append(
-                    ToolMessage(
+                    # Create an error tool message
+                    message = ToolMessage(
                         content=f"Error: {error_msg}",
                         tool_call_id=tool_id or "unknown",
                         name=tool_name if tool_name else "unknown_tool",
                     )
-                )
+        except Exception as e:
+            # Something went wrong in the try/except itself
+            error_msg = f"Error in tool execution process: {str(e)}"
+            logger.error(error_msg)
 
-        return {"messages": results}
+            # Update the step with the error
+            step["error"] = error_msg
+            step["status"] = "error"
 
+            # Create an error tool message
+            message = ToolMessage(
+                content=f"Error: {error_msg}",
+                tool_call_id=tool_id or "unknown",
+                name=tool_name if tool_name else "unknown_tool",
+            )
 
-def get_agent_config() -> dict[str, Any]:
-    """Get the agent configuration."""
-    config = get_llm_config()
+        return message, step
 
-    # Set defaults if not provided
-    if "llm_provider" not in config:
-        config["llm_provider"] = "openai"
+    @staticmethod
+    def _tool_cache_key(tool: BaseTool, tool_args: Any) -> tuple[str, str] | None:
+        """Build the result cache key for a tool call, or None if it must not be cached."""
+        if (tool.metadata or {}).get("cacheable") is False:
+            return None
+        try:
+            return tool.name, _json_dumps_sorted(tool_args)
+        except (TypeError, ValueError):
+            return None
+
+    def _cached_tool_result(self, key: tuple[str, str] | None) -> Any:
+        """Return a fresh cached result for a tool call key, or None."""
+        if key is None:
+            return None
+        with self._tool_cache_lock:
+            entry = self._tool_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= TOOL_CACHE_TTL:
+                del self._tool_cache[key]
+                return None
+            self._tool_cache.move_to_end(key)
+            return result
+
+    def _cache_tool_result(self, key: tuple[str, str] | None, result: Any) -> None:
+        """Remember a tool result, evicting the least recently used entry when full."""
+        # Tools report failures as "Error..." strings; those should be retried, not reused
+        if key is None or result is None or str(result).startswith("Error"):
+            return
+        with self._tool_cache_lock:
+            self._tool_cache[key] = (time.monotonic(), result)
+            self._tool_cache.move_to_end(key)
+            while len(self._tool_cache) > TOOL_CACHE_MAX_ENTRIES:
+                self._tool_cache.popitem(last=False)
+
+    async def _invoke_tool(self, tool: BaseTool, tool_args: Any, context: dict[str, Any]) -> Any:
+        """
+        Invoke a tool, retrying with backoff when it exceeds the tool timeout.
 
-    if "model" not in config:
-        config["model"] = "gpt-3.5-turbo-0125"
+        A timed-out call cannot be cancelled if the tool runs in a worker thread, so
+        tools marked non-cacheable, which may have side effects, are not retried.
 
-    if "temperature" not in config:
-        config["temperature"] = 0.7
+        Args:
+            tool: The tool to invoke
+            tool_args: The arguments for the tool
+            context: Additional context sent with the query, available to the tool
+                as config["configurable"]["context"]
 
-    return config
+        Returns:
+            The tool's result
 
+        Raises:
+            TimeoutError: If every attempt timed out
+        """
+        retries = TOOL_TIMEOUT_RETRIES if (tool.metadata or {}).get("cacheable") is not False else 0
+        for attempt in range(retries + 1):
+            try:
+                return await asyncio.wait_for(
+                    tool.ainvoke(tool_args, config={"configurable": {"context": context}}),
+                    timeout=self.tool_timeout,
+                )
+            except asyncio.TimeoutError:
+                if attempt == retries:
+                    break
+                backoff = TOOL_RETRY_BACKOFF * 2**attempt
+                logger.warning(
+                    "Tool %s timed out after %ss, retrying in %ss",
+                    tool.name,
+                    self.tool_timeout,
+                    backoff,
+                )
+                await asyncio.sleep(backoff)
 
-def create_agent(conversation_id: str | None = None, reset: bool = False) -> Any:
-    """
-    Create or get an agent for a conversation.
+        raise TimeoutError(
+            f"{tool.name} timed out after {retries + 1} attempts of {self.tool_timeout}s"
+        )
 
-    Args:
-        conversation_id: Unique identifier for the conversation
-        reset: Whether to reset the agent if it already exists
 
-    Returns:
-        The agent instance
+@lru_cache(maxsize=1)
+def get_checkpointer() -> BaseCheckpointSaver:
     """
-    global _agents
+    Get the checkpointer that stores conversation state for all agents.
 
-    # Generate a new conversation ID if not provided
-    if not conversation_id:
-        conversation_id = str(uuid.uuid4())
+    Conversations are kept in Redis when REDIS_URL is set and
+    langgraph-checkpoint-redis is installed, so they survive restarts and are
+    shared between workers. Otherwise they are kept in process memory.
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        try:
+            from langgraph.checkpoint.redis import RedisSaver
+            from langgraph.checkpoint.redis.aio import AsyncRedisSaver
 
-    # Check if we need to create a new agent
-    if reset or conversation_id not in _agents:
-        # Get configuration
-        config = get_agent_config()
+            # Create the indices up front; the graph runs async, so it gets the async saver
+            RedisSaver(redis_url=redis_url).setup()
+            logger.info("Storing conversation state in Redis")
+            return AsyncRedisSaver(redis_url=redis_url)
+        except Exception as e:
+            logger.warning(
+                f"Redis checkpointer unavailable, keeping conversations in memory: {str(e)}"
+            )
 
-        # Create tools directly instead of using registry
-        try:
-            # Initialize the tools list
-            tools = []
+    return MemorySaver()
 
-            # Create weather tool
-            try:
-                from tools.weather import WeatherTool
 
+def get_agent_config() -> dict[str, Any]:
+    """Get the agent configuration."""
+    # Copied, since the LLM config is shared and the defaults below modify it
+    config = dict(get_llm_config())
+
+    # Set defaults if not provided
+    config.setdefault("llm_provider", "openai")
+    config.setdefault("model", "gpt-3.5-turbo-0125")
+    config.setdefault("temperature", 0.7)
+
+    return config
+
+
+@lru_cache(maxsize=1)
+def _build_default_tools() -> tuple[BaseTool, ...]:
+    """
+    Build the tools shared by every agent.
+
+    Tools hold no per-conversation state, so they are created once per process
+    instead of for each new conversation.
+    """
+    # Create tools directly instead of using registry
+    try:
+        # Initialize the tools list
+        tools = []
+
+        # Create weather tool
+        if WeatherTool is not None:
+            try:
                 weather_tool = WeatherTool()
                 logger.info(f"Created weather tool with name: {weather_tool.name}")
                 tools.append(weather_tool)
             except Exception as e:
                 logger.error(f"Error creating weather tool: {str(e)}")
 
-            # Load a calculator tool if available
+        # Load a calculator tool if available
+        if LLMMathChain is not None:
             try:
-                from langchain.chains import LLMMathChain
-                from langchain.tools import Tool
-                from langchain_openai import OpenAI
-
                 llm = OpenAI(temperature=0)
                 llm_math_chain = LLMMathChain.from_llm(llm=llm, verbose=True)
                 calc_tool = Tool(
@@ -615,10 +1033,9 @@ def create_agent(conversation_id: str | None = None, reset: bool = False) -> Any
             except Exception as e:
                 logger.error(f"Error creating calculator tool: {str(e)}")
 
-            # Try to get other tools from registry
+        # Try to get other tools from registry
+        if get_available_tools is not None:
             try:
-                from tools.registry import get_available_tools
-
                 registry_tools = get_available_tools()
                 logger.info(f"Loaded {len(registry_tools)} tools from registry")
                 # Add non-duplicate tools
@@ -631,49 +1048,113 @@ def create_agent(conversation_id: str | None = None, reset: bool = False) -> Any
 
                 logger.error(traceback.format_exc())
 
-            if not tools:
-                logger.warning("No tools could be created. The agent might not function correctly.")
+        if not tools:
+            logger.warning("No tools could be created. The agent might not function correctly.")
+    except Exception as e:
+        logger.error(f"Error setting up tools: {str(e)}")
+        import traceback
+
+        logger.error(traceback.format_exc())
+        # Fallback to empty tools list
+        tools = []
+
+    return tuple(tools)
+
+
+def refresh_default_tools() -> None:
+    """Rebuild the shared tools for new conversations, e.g. after a tool is toggled."""
+    _build_default_tools.cache_clear()
+
+
+def create_agent(conversation_id: str | None = None, reset: bool = False) -> Any:
+    """
+    Create or get an agent for a conversation.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+        reset: Whether to reset the agent if it already exists
+
+    Returns:
+        The agent instance
+    """
+    global _agents
+
+    # Generate a new conversation ID if not provided
+    if not conversation_id:
+        conversation_id = str(uuid.uuid4())
+
+    if reset:
+        # Drop the stored conversation so the new agent starts from scratch. Async
+        # callers should use reset_conversation, which also works with async savers.
+        _agents.pop(conversation_id, None)
+        try:
+            get_checkpointer().delete_thread(conversation_id)
         except Exception as e:
-            logger.error(f"Error setting up tools: {str(e)}")
-            import traceback
+            logger.warning(f"Could not clear stored conversation {conversation_id}: {str(e)}")
 
-            logger.error(traceback.format_exc())
-            # Fallback to empty tools list
-            tools = []
+    # Check if we need to create a new agent
+    if conversation_id not in _agents:
+        # Get configuration
+        config = get_agent_config()
+
+        tools = list(_build_default_tools())
 
         logger.info(
             f"Creating agent with {len(tools)} tools: {[getattr(t, 'name', str(t)) for t in tools]}"
         )
 
         # Create a new agent
-        agent = Agent(model_config=config, tools=tools, system_prompt=DEFAULT_SYSTEM_PROMPT)
+        agent = Agent(
+            model_config=config,
+            tools=tools,
+            system_prompt=DEFAULT_SYSTEM_PROMPT,
+            tool_timeout=float(config.get("tool_timeout", DEFAULT_TOOL_TIMEOUT)),
+        )
 
         _agents[conversation_id] = {
             "agent": agent,
             "conversation_id": conversation_id,
-            "messages": [],
         }
 
+        # Evict the agents of the least recently used conversations
+        while len(_agents) > MAX_ACTIVE_AGENTS:
+            _agents.popitem(last=False)
+    else:
+        _agents.move_to_end(conversation_id)
+
     return _agents[conversation_id]
 
 
-def invoke_agent(
-    agent: dict[str, Any],
-    query: str,
-    conversation_id: str | None = None,
-    context: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+async def reset_conversation(conversation_id: str) -> dict[str, Any]:
     """
-    Invoke the agent with a query.
+    Forget a conversation's stored state and start it over with a new agent.
 
     Args:
-        agent: The agent instance
-        query: The user query to process
-        conversation_id: The conversation ID
-        context: Additional context for the agent
+        conversation_id: The conversation to reset
 
     Returns:
-        The agent response
+        The new agent instance
+    """
+    _agents.pop(conversation_id, None)
+    try:
+        await get_checkpointer().adelete_thread(conversation_id)
+    except Exception as e:
+        logger.warning(f"Could not clear stored conversation {conversation_id}: {str(e)}")
+
+    return create_agent(conversation_id)
+
+
+def _prepare_invocation(
+    agent: dict[str, Any],
+    query: str,
+    conversation_id: str | None,
+    context: dict[str, Any] | None,
+) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """
+    Build the thread config and initial graph state for a query.
+
+    Returns:
+        The conversation ID, the thread config, and the initial state
     """
     if conversation_id is None:
         conversation_id = agent["conversation_id"]
@@ -685,47 +1166,129 @@ def invoke_agent(
     user_message = HumanMessage(content=query)
 
     # Prepare the thread config
-    thread = {"configurable": {"thread_id": conversation_id}}
+    thread = agent["agent"].graph_config(conversation_id)
 
-    # Prepare the initial state for the graph
+    # Prepare the initial state for the graph. Earlier messages are restored from
+    # the checkpointer, so only the new one is passed in.
     initial_state = {
-        "messages": agent["messages"] + [user_message],
+        "messages": [user_message],
         "conversation_id": conversation_id,
         "context": context,
     }
 
     # Reset execution steps for this invocation
-    agent_instance = agent["agent"]
-    agent_instance.execution_steps = []
+    agent["agent"].reset_execution_steps()
+
+    return conversation_id, thread, initial_state
+
+
+def _finish_invocation(
+    agent: dict[str, Any], conversation_id: str, result: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Build the response from the final graph state.
+
+    Returns:
+        The agent response
+    """
+    # Extract the last AI message as the response
+    messages = result["messages"]
+    response = next(
+        (message.content for message in reversed(messages) if isinstance(message, AIMessage)),
+        # Fallback if no AI message found
+        "I'm not sure how to respond to that.",
+    )
+
+    # Include execution steps in the response metadata
+    execution_steps = list(agent["agent"].execution_steps)
+
+    return {
+        "response": response,
+        "conversation_id": conversation_id,
+        "metadata": {
+            "message_count": len(messages),
+            "execution_steps": execution_steps,
+        },
+    }
+
+
+async def invoke_agent(
+    agent: dict[str, Any],
+    query: str,
+    conversation_id: str | None = None,
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Invoke the agent with a query.
+
+    Args:
+        agent: The agent instance
+        query: The user query to process
+        conversation_id: The conversation ID
+        context: Additional context for the agent
+
+    Returns:
+        The agent response
+    """
+    conversation_id, thread, initial_state = _prepare_invocation(
+        agent, query, conversation_id, context
+    )
 
     # Invoke the agent
     try:
-        result = agent_instance.graph.invoke(initial_state, thread)
+        result = await agent["agent"].graph.ainvoke(initial_state, thread)
+        return _finish_invocation(agent, conversation_id, result)
+    except Exception as e:
+        logger.error(f"Error invoking agent: {str(e)}")
+        raise e
 
-        # Store updated messages in agent
-        agent["messages"] = result["messages"]
 
-        # Extract the last AI message as the response
-        messages = result["messages"]
-        for message in reversed(messages):
-            if isinstance(message, AIMessage):
-                response = message.content
-                break
-        else:
-            # Fallback if no AI message found
-            response = "I'm not sure how to respond to that."
+async def stream_agent(
+    agent: dict[str, Any],
+    query: str,
+    conversation_id: str | None = None,
+    context: dict[str, Any] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Invoke the agent with a query, yielding the answer as it is generated.
+
+    Args:
+        agent: The agent instance
+        query: The user query to process
+        conversation_id: The conversation ID
+        context: Additional context for the agent
 
-        # Include execution steps in the response metadata
-        execution_steps = agent_instance.execution_steps
+    Yields:
+        ``{"type": "token", "content": ...}`` events for each piece of the answer
+        text, followed by one ``{"type": "final", ...}`` event carrying the same
+        response, conversation ID and metadata that invoke_agent returns
+    """
+    conversation_id, thread, initial_state = _prepare_invocation(
+        agent, query, conversation_id, context
+    )
 
-        return {
-            "response": response,
-            "conversation_id": conversation_id,
-            "metadata": {
-                "message_count": len(messages),
-                "execution_steps": execution_steps,
-            },
-        }
+    try:
+        result = initial_state
+        # "messages" surfaces LLM tokens from inside the llm node as they arrive;
+        # "values" gives the full state after each step, the last one being the result
+        async for mode, payload in agent["agent"].graph.astream(
+            initial_state, thread, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                result = payload
+                continue
+
+            chunk, metadata = payload
+            if (
+                metadata.get("langgraph_node") == "llm"
+                and isinstance(chunk, AIMessage)
+                and isinstance(chunk.content, str)
+                and chunk.content
+                and not chunk.tool_calls
+            ):
+                yield {"type": "token", "content": chunk.content}
+
+        yield {"type": "final", **_finish_invocation(agent, conversation_id, result)}
     except Exception as e:
-        logger.error(f"Error invoking agent: {str(e)}")
+        logger.error(f"Error streaming agent: {str(e)}")
         raise e
@@ -2,29 +2,366 @@
 Document processing module for handling knowledge base documents.
 """
 
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import shutil
+import stat
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-
-from langchain_community.document_loaders import (
-    CSVLoader,
-    PDFMinerLoader,
-    TextLoader,
-    UnstructuredMarkdownLoader,
-)
-from langchain_community.vectorstores import FAISS
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
 from langchain_core.documents import Document
-from langchain_openai import OpenAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from agents.document_store import get_document_store
+
+# Loaders, FAISS, embeddings and the splitter are imported where they are first used,
+# so importing this module (and starting the server) stays fast
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+    from langchain_openai import OpenAIEmbeddings
+
+    from agents.text_splitter import SinglePassTextSplitter
+
+# Chunk embeddings are cached on disk when diskcache is installed
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 logger = logging.getLogger(__name__)
 
 # Default documents directory
 DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "documents")
 
-# Metadata database (in-memory for now, could be replaced with a real database)
-DOCUMENT_METADATA = {}
+# Chunks sent per embeddings request; keeps large builds to a few round trips while
+# staying under the provider's per-request and per-minute token limits
+EMBEDDING_BATCH_SIZE = 512
+
+# HNSW graph parameters: links per vector, and candidates considered while inserting.
+# Search stays sub-linear as documents are added, and no training is needed
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+
+# Idle OpenMP threads sleep instead of spinning, which otherwise slows down the small
+# adds of incremental uploads; must be set before faiss is first imported
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+
+# HNSW candidates examined per query for each recall setting of query_knowledge_base;
+# more candidates find more of the true nearest chunks but take longer
+RECALL_EF_SEARCH = {"fast": 16, "balanced": 64, "accurate": 128}
+
+# PDF text extraction: "pymupdf" (a C extension that releases the GIL) when installed,
+# or "pdfminer" (pure Python)
+PDF_BACKEND = os.environ.get("AW_PDF_BACKEND", "pymupdf").lower()
+
+# Files loaded and chunked at the same time when building the vectorstore
+INGEST_WORKERS = int(os.environ.get("AW_INGEST_WORKERS", min(8, os.cpu_count() or 4)))
+
+# Loaded vectorstores by docs directory, with the version directory of the index they
+# were loaded from; the FAISS index is only read again when another process saves it.
+# A cached vectorstore is never modified: changes are made to a copy that replaces it
+_VECTORSTORES: dict[str, tuple[str | None, "FAISS"]] = {}
+# Serializes loading and writing the vectorstores; queries of a cached one do not take it
+_VS_LOCK = threading.RLock()
+
+
+def _index_path(docs_dir: str) -> str:
+    # A symlink to the current version of the index, in a sibling "faiss_index.<id>"
+    return os.path.join(docs_dir, "faiss_index")
+
+
+def _pointer_path(docs_dir: str) -> str:
+    # Names the current version instead of the symlink where symlinks are not
+    # available, e.g. on Windows without developer mode
+    return os.path.join(docs_dir, "faiss_index.current")
+
+
+def _current_index_dir(docs_dir: str) -> str | None:
+    """
+    Directory of the current version of the saved index, or None if there is none.
+
+    Each save writes a new directory, so the result also identifies the version.
+    """
+    index_path = _index_path(docs_dir)
+    if os.path.islink(index_path):
+        # Relative to docs_dir, so the result compares equal to the saved version_dir
+        index_dir = os.path.join(docs_dir, os.readlink(index_path))
+    else:
+        try:
+            with open(_pointer_path(docs_dir), encoding="utf-8") as f:
+                index_dir = os.path.join(docs_dir, f.read().strip())
+        except OSError:
+            # Saved as a plain directory by an older version
+            index_dir = index_path
+
+    if not os.path.exists(os.path.join(index_dir, "index.faiss")):
+        return None
+    return index_dir
+
+
+def _manifest_path(index_dir: str) -> str:
+    # Lives inside the index directory so it is saved and removed together with it
+    return os.path.join(index_dir, "manifest.json")
+
+
+def _read_manifest(index_dir: str | None) -> set[str]:
+    """Read the IDs of the documents in a saved index."""
+    if index_dir is None:
+        return set()
+    try:
+        with open(_manifest_path(index_dir), encoding="utf-8") as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def _write_manifest(index_dir: str, doc_ids: set[str]) -> None:
+    """Record which documents a saved index contains."""
+    with open(_manifest_path(index_dir), "w", encoding="utf-8") as f:
+        json.dump(sorted(doc_ids), f)
+
+
+def _save_vectorstore(docs_dir: str, vectorstore: "FAISS", doc_ids: set[str]) -> None:
+    """
+    Save a vectorstore with its manifest and swap it in as the cached one.
+
+    The index is written to a new version directory, and the ``faiss_index`` symlink
+    (or, without symlink support, the ``faiss_index.current`` pointer file) is pointed
+    at it with one atomic ``os.replace``, so other workers always find a complete
+    index. The previous version is kept for workers still loading it; older ones are
+    removed. Queries holding the previous vectorstore finish on it undisturbed.
+    """
+    index_path = _index_path(docs_dir)
+    version_dir = f"{index_path}.{os.urandom(8).hex()}"
+    vectorstore.save_local(version_dir)
+    _write_manifest(version_dir, doc_ids)
+
+    previous_dir = _current_index_dir(docs_dir)
+    if previous_dir == index_path:
+        # Index saved as a plain directory by an older version: moved aside once
+        previous_dir = f"{index_path}.{os.urandom(8).hex()}"
+        os.rename(index_path, previous_dir)
+
+    try:
+        link_path = f"{version_dir}.link"
+        os.symlink(os.path.basename(version_dir), link_path)
+        os.replace(link_path, index_path)
+    except OSError:
+        pointer_path = _pointer_path(docs_dir)
+        with open(f"{pointer_path}.tmp", "w", encoding="utf-8") as f:
+            f.write(os.path.basename(version_dir))
+        os.replace(f"{pointer_path}.tmp", pointer_path)
+
+    keep = {os.path.basename(version_dir), os.path.basename(previous_dir or "")}
+    with os.scandir(docs_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith("faiss_index.")
+                and entry.is_dir(follow_symlinks=False)
+                and entry.name not in keep
+            ):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    _VECTORSTORES[docs_dir] = (version_dir, vectorstore)
+
+
+@lru_cache(maxsize=1)
+def _get_embeddings() -> "OpenAIEmbeddings":
+    """Get the shared embeddings client, which batches requests and retries rate limits."""
+    from langchain_openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings(chunk_size=EMBEDDING_BATCH_SIZE, max_retries=6)
+
+
+@lru_cache(maxsize=1)
+def _get_embed_cache():
+    """Get the on-disk cache of chunk embeddings, or None if diskcache is not installed."""
+    if diskcache is None:
+        return None
+    return diskcache.Cache(os.path.join(DOCS_DIR, ".embed_cache"))
+
+
+def _embed_texts(texts: list[str]) -> list[list[float]]:
+    """
+    Embed texts, reusing the cached embedding of any text embedded before.
+
+    Reprocessed documents and paragraphs repeated across files are only
+    embedded once.
+    """
+    embeddings = _get_embeddings()
+    cache = _get_embed_cache()
+    if cache is None:
+        return embeddings.embed_documents(texts)
+
+    # The model is part of the key, since another model gives different vectors
+    keys = [hashlib.sha256(f"{embeddings.model}\0{text}".encode()).hexdigest() for text in texts]
+    vectors = [cache.get(key) for key in keys]
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if missing:
+        new_vectors = embeddings.embed_documents([texts[i] for i in missing])
+        for i, vector in zip(missing, new_vectors):
+            cache[keys[i]] = vectors[i] = vector
+
+    logger.info(f"Embedded {len(missing)} chunks, {len(texts) - len(missing)} from cache")
+    return vectors
+
+
+def _chunk_ids(documents: list[Document]) -> list[str]:
+    return [doc.metadata["chunk_id"] for doc in documents]
+
+
+def _vector_ids(vectorstore: "FAISS") -> dict[str, int]:
+    """Position in the FAISS index of every chunk in a vectorstore."""
+    return {chunk_id: vector_id for vector_id, chunk_id in vectorstore.index_to_docstore_id.items()}
+
+
+def _new_index(dimension: int):
+    """Create an empty HNSW index for vectors of the given dimension."""
+    import faiss
+
+    index = faiss.IndexHNSWFlat(dimension, HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    return index
+
+
+def _add_chunks(
+    vectorstore: "FAISS", documents: list[Document], vectors: list[list[float]]
+) -> None:
+    """Add chunks and their embeddings to a vectorstore."""
+    vectorstore.add_embeddings(
+        list(zip((doc.page_content for doc in documents), vectors)),
+        metadatas=[doc.metadata for doc in documents],
+        ids=_chunk_ids(documents),
+    )
+
+
+def _build_vectorstore(documents: list[Document], vectors: list[list[float]]) -> "FAISS":
+    """Build a new FAISS vectorstore from embedded documents."""
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+
+    vectorstore = FAISS(_get_embeddings(), _new_index(len(vectors[0])), InMemoryDocstore(), {})
+    _add_chunks(vectorstore, documents, vectors)
+    return vectorstore
+
+
+def _copy_vectorstore(vectorstore: "FAISS") -> "FAISS":
+    """Copy a vectorstore, so it can be changed while the original keeps serving queries."""
+    import faiss
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+
+    return FAISS(
+        _get_embeddings(),
+        faiss.clone_index(vectorstore.index),
+        InMemoryDocstore(dict(vectorstore.docstore._dict)),
+        dict(vectorstore.index_to_docstore_id),
+    )
+
+
+def _remove_chunks(vectorstore: "FAISS", chunk_ids: list[str]) -> None:
+    """
+    Remove chunks from a vectorstore.
+
+    HNSW indexes cannot remove vectors, so the index is rebuilt from the vectors
+    it keeps; nothing is embedded again.
+    """
+    removed = set(chunk_ids)
+    kept = [
+        (vector_id, chunk_id)
+        for vector_id, chunk_id in sorted(vectorstore.index_to_docstore_id.items())
+        if chunk_id not in removed
+    ]
+
+    index = _new_index(vectorstore.index.d)
+    if kept:
+        vectors = vectorstore.index.reconstruct_n(0, vectorstore.index.ntotal)
+        index.add(vectors[[vector_id for vector_id, _ in kept]])
+
+    vectorstore.index = index
+    vectorstore.index_to_docstore_id = {i: chunk_id for i, (_, chunk_id) in enumerate(kept)}
+    vectorstore.docstore.delete(list(removed))
+
+
+def _remove_document_chunks(vectorstore: "FAISS", doc_id: str) -> bool:
+    """
+    Remove a document's chunks from a vectorstore, if it has any.
+
+    Returns:
+        Whether any chunks were removed
+    """
+    chunk_ids = [
+        chunk_id
+        for chunk_id in vectorstore.index_to_docstore_id.values()
+        if chunk_id.rpartition("#")[0] == doc_id
+    ]
+    if not chunk_ids:
+        return False
+
+    _remove_chunks(vectorstore, chunk_ids)
+    # Removing shifts the positions of the chunks after the removed ones
+    get_document_store().update_vector_ids(_vector_ids(vectorstore).items())
+    return True
+
+
+def _load_or_init_vectorstore(docs_dir: str = DOCS_DIR) -> "FAISS | None":
+    """
+    Return the vectorstore for a docs directory, loading the persisted index once.
+
+    The index is loaded again only if it was saved since, e.g. by another worker.
+
+    Returns:
+        The cached or freshly loaded vectorstore, or None if no index has been built yet
+    """
+    index_dir = _current_index_dir(docs_dir)
+    cached = _VECTORSTORES.get(docs_dir)
+    # Without an index on disk, e.g. deleted by hand, keep serving the cached one
+    if cached is not None and (index_dir is None or cached[0] == index_dir):
+        return cached[1]
+
+    with _VS_LOCK:
+        # Another thread may have loaded or saved it while we waited for the lock
+        index_dir = _current_index_dir(docs_dir)
+        cached = _VECTORSTORES.get(docs_dir)
+        if cached is not None and (index_dir is None or cached[0] == index_dir):
+            return cached[1]
+
+        if index_dir is None:
+            return None
+
+        from langchain_community.vectorstores import FAISS
+
+        try:
+            # The index was written by this application, so deserializing it is safe
+            vectorstore = FAISS.load_local(
+                index_dir, _get_embeddings(), allow_dangerous_deserialization=True
+            )
+        except Exception as e:
+            logger.error(f"Error loading existing vectorstore: {e}")
+            return None
+
+        logger.info(f"Loaded existing vectorstore from {index_dir}")
+        _VECTORSTORES[docs_dir] = (index_dir, vectorstore)
+        return vectorstore
+
+
+@lru_cache(maxsize=1)
+def _get_text_splitter() -> "SinglePassTextSplitter":
+    """Get the splitter that chunks loaded documents; it holds no per-file state."""
+    from agents.text_splitter import SinglePassTextSplitter
+
+    return SinglePassTextSplitter(chunk_size=1000, chunk_overlap=200)
+
+
+@lru_cache(maxsize=1)
+def _use_pymupdf() -> bool:
+    """Whether PDFs are parsed with PyMuPDF, falling back to PDFMiner if it is missing."""
+    return PDF_BACKEND == "pymupdf" and importlib.util.find_spec("fitz") is not None
 
 
 def get_loader_for_file(file_path: str):
@@ -32,29 +369,53 @@ def get_loader_for_file(file_path: str):
     file_ext = os.path.splitext(file_path)[1].lower()
 
     if file_ext == ".pdf":
+        if _use_pymupdf():
+            from langchain_community.document_loaders import PyMuPDFLoader
+
+            return PyMuPDFLoader(file_path)
+        from langchain_community.document_loaders import PDFMinerLoader
+
         return PDFMinerLoader(file_path)
     elif file_ext == ".csv":
+        from langchain_community.document_loaders import CSVLoader
+
         return CSVLoader(file_path)
     elif file_ext == ".md":
+        from langchain_community.document_loaders import UnstructuredMarkdownLoader
+
         return UnstructuredMarkdownLoader(file_path)
     else:
         # Default to text loader for .txt and other files
+        from langchain_community.document_loaders import TextLoader
+
         return TextLoader(file_path)
 
 
-def process_document(file_path: str) -> tuple[list[Document], dict[str, Any]]:
+def process_document(
+    file_path: str, st: os.stat_result | None = None
+) -> tuple[list[Document], dict[str, Any]]:
     """
     Process a document file into a list of Documents and return processing metadata.
 
+    Args:
+        file_path: Path to the document file
+        st: The file's stat result, if the caller already has it
+
     Returns:
         Tuple containing:
         - List of Document objects
         - Dictionary with processing metadata (success, chunk_count, etc.)
     """
+    if st is None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            pass
+
     stats = {
         "success": False,
         "chunk_count": 0,
-        "file_size": os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+        "file_size": st.st_size if st is not None and stat.S_ISREG(st.st_mode) else 0,
         "processing_timestamp": datetime.now().isoformat(),
         "file_name": os.path.basename(file_path),
         "error": None,
@@ -67,13 +428,11 @@ def process_document(file_path: str) -> tuple[list[Document], dict[str, Any]]:
         # Load the document
         raw_documents = loader.load()
 
-        # Use text splitter for chunking
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000, chunk_overlap=200, separators=["\n\n", "\n", ". ", " ", ""]
-        )
-
-        # Create chunks
-        documents = text_splitter.split_documents(raw_documents)
+        # Create chunks, with IDs that stay the same when the index is rebuilt
+        documents = _get_text_splitter().split_documents(raw_documents)
+        doc_id = os.path.basename(file_path)
+        for i, doc in enumerate(documents):
+            doc.metadata["chunk_id"] = f"{doc_id}#{i}"
 
         # Update stats
         stats["success"] = True
@@ -91,65 +450,151 @@ def process_document(file_path: str) -> tuple[list[Document], dict[str, Any]]:
         return [], stats
 
 
+def process_documents(
+    file_paths: list[str], file_stats: dict[str, os.stat_result] | None = None
+) -> list[Document]:
+    """
+    Load and chunk several files in parallel.
+
+    PDFMiner parsing is pure-Python CPU work, so with that backend PDFs are spread
+    over processes when there are several of them. PyMuPDF releases the GIL, so
+    with it PDFs use threads like the other files.
+
+    Args:
+        file_paths: Paths of the files to process
+        file_stats: Stat results of the files by path, if the caller already has them
+
+    Returns:
+        The chunks of all files that could be processed
+    """
+    pdf_paths = [path for path in file_paths if path.lower().endswith(".pdf")]
+    if _use_pymupdf() or len(pdf_paths) < 2:
+        pdf_paths = []
+    other_paths = [path for path in file_paths if path not in pdf_paths]
+
+    file_stats = file_stats or {}
+
+    documents = []
+    with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as threads:
+        other_results = threads.map(
+            process_document, other_paths, [file_stats.get(path) for path in other_paths]
+        )
+        if pdf_paths:
+            with ProcessPoolExecutor(max_workers=min(INGEST_WORKERS, len(pdf_paths))) as processes:
+                pdf_results = processes.map(
+                    process_document, pdf_paths, [file_stats.get(path) for path in pdf_paths]
+                )
+                for doc_chunks, _ in pdf_results:
+                    documents.extend(doc_chunks)
+        for doc_chunks, _ in other_results:
+            documents.extend(doc_chunks)
+
+    return documents
+
+
 def get_vectorstore(docs_dir: str = DOCS_DIR):
     """Get or create a vectorstore from all documents in the docs directory."""
-    try:
-        # If FAISS index exists, load it
-        index_file = os.path.join(docs_dir, "faiss_index")
-        if os.path.exists(index_file):
-            embeddings = OpenAIEmbeddings()
-            vectorstore = FAISS.load_local(index_file, embeddings)
-            logger.info(f"Loaded existing vectorstore from {index_file}")
-            return vectorstore
-    except Exception as e:
-        logger.error(f"Error loading existing vectorstore: {e}")
+    vectorstore = _load_or_init_vectorstore(docs_dir)
+    if vectorstore is not None:
+        return vectorstore
 
-    # Create new vectorstore
-    try:
-        # Process all documents in the docs directory
-        documents = []
-        for filename in os.listdir(docs_dir):
-            file_path = os.path.join(docs_dir, filename)
-            if os.path.isfile(file_path) and not filename.startswith("faiss_index"):
-                doc_chunks, _ = process_document(file_path)
-                documents.extend(doc_chunks)
+    # No index yet: build one from the documents in the docs directory
+    with _VS_LOCK:
+        # Another thread may have built it while we waited for the lock
+        if docs_dir in _VECTORSTORES:
+            return _VECTORSTORES[docs_dir][1]
+
+        try:
+            # Process all documents in the docs directory, reusing scandir's stat results
+            file_stats = {}
+            doc_ids = set()
+            with os.scandir(docs_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and not entry.name.startswith("faiss_index"):
+                        file_stats[entry.path] = entry.stat()
+                        doc_ids.add(entry.name)
+            documents = process_documents(list(file_stats), file_stats)
+
+            if not documents:
+                logger.warning("No documents found to create vectorstore")
+                return None
+
+            # Create vectorstore
+            vectorstore = _build_vectorstore(
+                documents, _embed_texts([doc.page_content for doc in documents])
+            )
 
-        if not documents:
-            logger.warning("No documents found to create vectorstore")
+            # Save the vectorstore and the new positions of the known documents' chunks
+            _save_vectorstore(docs_dir, vectorstore, doc_ids)
+            get_document_store().update_vector_ids(_vector_ids(vectorstore).items())
+            logger.info(f"Created new vectorstore with {len(documents)} documents")
+
+            return vectorstore
+        except Exception as e:
+            logger.error(f"Error creating vectorstore: {e}")
             return None
 
-        # Create vectorstore
-        embeddings = OpenAIEmbeddings()
-        vectorstore = FAISS.from_documents(documents, embeddings)
 
-        # Save the vectorstore
-        os.makedirs(os.path.dirname(index_file), exist_ok=True)
-        vectorstore.save_local(index_file)
-        logger.info(f"Created new vectorstore with {len(documents)} documents")
+def _search_hnsw(vectorstore: "FAISS", query: str, k: int, ef_search: int) -> list[Document]:
+    """
+    Search an HNSW vectorstore with the given efSearch.
 
-        return vectorstore
-    except Exception as e:
-        logger.error(f"Error creating vectorstore: {e}")
-        return None
+    The setting is passed with this search only; the index is shared by concurrent
+    queries, so it is never changed on the index itself.
+    """
+    import faiss
+    import numpy as np
+
+    vector = np.array([_get_embeddings().embed_query(query)], dtype=np.float32)
+    _, ids = vectorstore.index.search(
+        vector, k, params=faiss.SearchParametersHNSW(efSearch=ef_search)
+    )
+
+    results = []
+    for vector_id in ids[0]:
+        # -1 pads the results when the index has fewer than k vectors
+        if vector_id == -1:
+            continue
+        doc = vectorstore.docstore.search(vectorstore.index_to_docstore_id[vector_id])
+        if isinstance(doc, Document):
+            results.append(doc)
+    return results
+
+
+def query_knowledge_base(query: str, k: int = 3, recall: str = "balanced") -> list[Document]:
+    """
+    Query the knowledge base for relevant documents.
 
+    Args:
+        query: The natural language query
+        k: Number of chunks to return
+        recall: "fast", "balanced" or "accurate"; trades search time for finding
+            more of the truly nearest chunks
 
-def query_knowledge_base(query: str, k: int = 3) -> list[Document]:
-    """Query the knowledge base for relevant documents."""
+    Returns:
+        The most relevant chunks
+    """
     try:
         vectorstore = get_vectorstore()
         if not vectorstore:
             logger.warning("No vectorstore available for querying")
             return []
 
-        results = vectorstore.similarity_search(query, k=k)
-        return results
+        # Only HNSW indexes have the knob; indexes saved as flat always search everything
+        if getattr(vectorstore.index, "hnsw", None) is None:
+            return vectorstore.similarity_search(query, k=k)
+
+        if recall not in RECALL_EF_SEARCH:
+            logger.warning(f"Unknown recall setting {recall!r}, using 'balanced'")
+            recall = "balanced"
+        return _search_hnsw(vectorstore, query, k, max(RECALL_EF_SEARCH[recall], k))
     except Exception as e:
         logger.error(f"Error querying knowledge base: {e}")
         return []
 
 
 def add_document_to_knowledge_base(
-    file_path: str, metadata: dict[str, Any] | None = None
+    file_path: str, metadata: dict[str, Any] | None = None, st: os.stat_result | None = None
 ) -> dict[str, Any]:
     """
     Process a document and add it to the knowledge base.
@@ -157,6 +602,7 @@ def add_document_to_knowledge_base(
     Args:
         file_path: Path to the document file
         metadata: Additional metadata to store with the document
+        st: The file's stat result, if the caller already has it
 
     Returns:
         Dictionary with processing results and status information
@@ -173,7 +619,7 @@ def add_document_to_knowledge_base(
 
     try:
         # Process the document
-        documents, processing_stats = process_document(file_path)
+        documents, processing_stats = process_document(file_path, st)
         result.update(processing_stats)
 
         if not documents:
@@ -198,32 +644,45 @@ def add_document_to_knowledge_base(
             # Set the updated metadata
             doc.metadata = doc_metadata
 
-        # Get existing vectorstore or create new one
-        vectorstore = get_vectorstore()
-        if not vectorstore:
-            # Create new vectorstore with just this document
-            embeddings = OpenAIEmbeddings()
-            vectorstore = FAISS.from_documents(documents, embeddings)
-        else:
-            # Add documents to existing vectorstore
-            vectorstore.add_documents(documents)
+        # Only the new chunks are embedded, before taking the lock so other writers
+        # are not held up by the embeddings requests
+        vectors = _embed_texts([doc.page_content for doc in documents])
 
-        # Save updated vectorstore
-        index_file = os.path.join(DOCS_DIR, "faiss_index")
-        vectorstore.save_local(index_file)
+        store = get_document_store()
+        with _VS_LOCK:
+            active = _load_or_init_vectorstore()
+            if active is None:
+                # Create new vectorstore with just this document
+                vectorstore = _build_vectorstore(documents, vectors)
+                indexed = set()
+            else:
+                # Update a copy; queries keep using the active one until it is swapped in
+                vectorstore = _copy_vectorstore(active)
+
+                # A reprocessed document replaces its earlier chunks
+                _remove_document_chunks(vectorstore, doc_id)
+
+                # Add documents to the copy
+                _add_chunks(vectorstore, documents, vectors)
+                indexed = _read_manifest(_current_index_dir(DOCS_DIR))
+
+            # Save updated vectorstore and swap it in
+            _save_vectorstore(DOCS_DIR, vectorstore, indexed | {doc_id})
+            vector_ids = _vector_ids(vectorstore)
 
         # Update result
         result["success"] = True
         result["vectorstore_added"] = True
 
-        # Store document metadata
-        DOCUMENT_METADATA[doc_id] = {
-            "file_path": file_path,
-            "user_metadata": user_metadata,
-            "processing_stats": processing_stats,
-            "ingestion_timestamp": datetime.now().isoformat(),
-            "chunk_count": len(documents),
-        }
+        # Store document metadata, with the index position of each chunk
+        store.put_document(
+            doc_id,
+            file_path,
+            user_metadata,
+            processing_stats,
+            datetime.now().isoformat(),
+            [(chunk_id, vector_ids[chunk_id]) for chunk_id in _chunk_ids(documents)],
+        )
         result["metadata_added"] = True
 
         logger.info(f"Added {len(documents)} chunks from {file_path} to knowledge base")
@@ -235,11 +694,37 @@ def add_document_to_knowledge_base(
         return result
 
 
+def remove_document_from_knowledge_base(doc_id: str) -> bool:
+    """
+    Remove a document's chunks from the knowledge base, along with its metadata.
+
+    Args:
+        doc_id: ID of the document to remove
+
+    Returns:
+        Whether the document had chunks in the knowledge base
+    """
+    with _VS_LOCK:
+        active = _load_or_init_vectorstore()
+        # Update a copy; queries keep using the active one until it is swapped in
+        vectorstore = _copy_vectorstore(active) if active is not None else None
+        removed = vectorstore is not None and _remove_document_chunks(vectorstore, doc_id)
+        if removed:
+            indexed = _read_manifest(_current_index_dir(DOCS_DIR))
+            _save_vectorstore(DOCS_DIR, vectorstore, indexed - {doc_id})
+
+    get_document_store().delete(doc_id)
+
+    if removed:
+        logger.info(f"Removed {doc_id} from knowledge base")
+    return removed
+
+
 def get_document_metadata(doc_id: str) -> dict[str, Any] | None:
     """Retrieve metadata for a specific document."""
-    return DOCUMENT_METADATA.get(doc_id)
+    return get_document_store().get(doc_id)
 
 
 def list_all_documents() -> list[dict[str, Any]]:
     """List all documents with their metadata."""
-    return [{"document_id": doc_id, **metadata} for doc_id, metadata in DOCUMENT_METADATA.items()]
+    return get_document_store().list_all()
@@ -0,0 +1,143 @@
+"""
+SQLite store for the metadata of knowledge base documents in {{project_name}}.
+
+Each document has one row in ``documents``; ``vector_map`` maps every chunk of a
+document to its position in the FAISS index, so positions can be updated on their
+own when the index is rebuilt without rewriting the document rows.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+# Kept next to the documents directory rather than in it, so it is never ingested
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "documents.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    user_metadata TEXT NOT NULL,
+    processing_stats TEXT NOT NULL,
+    chunk_count INTEGER NOT NULL,
+    ts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vector_map (
+    chunk_uuid TEXT PRIMARY KEY,
+    doc_id TEXT NOT NULL,
+    vector_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vector_map_doc_id ON vector_map (doc_id);
+"""
+
+
+def _row_to_metadata(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "file_path": row["file_path"],
+        "user_metadata": json.loads(row["user_metadata"]),
+        "processing_stats": json.loads(row["processing_stats"]),
+        "ingestion_timestamp": row["ts"],
+        "chunk_count": row["chunk_count"],
+    }
+
+
+class DocumentStore:
+    """Document metadata and chunk-to-vector mapping, persisted in SQLite."""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        """
+        Open the database, creating its tables if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = db_path
+        # One connection shared by the request threads; the lock serializes its use
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def put_document(
+        self,
+        doc_id: str,
+        file_path: str,
+        user_metadata: dict[str, Any],
+        processing_stats: dict[str, Any],
+        ingestion_timestamp: str,
+        chunk_vectors: Iterable[tuple[str, int]],
+    ) -> None:
+        """
+        Store a document and the index positions of its chunks in one transaction.
+
+        Args:
+            doc_id: ID of the document
+            file_path: Where the document is stored
+            user_metadata: Metadata provided when the document was uploaded
+            processing_stats: Statistics from loading and chunking the document
+            ingestion_timestamp: When the document was added to the knowledge base
+            chunk_vectors: (chunk ID, FAISS index position) for each chunk
+        """
+        chunk_vectors = list(chunk_vectors)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    doc_id,
+                    file_path,
+                    json.dumps(user_metadata, default=str),
+                    json.dumps(processing_stats, default=str),
+                    len(chunk_vectors),
+                    ingestion_timestamp,
+                ),
+            )
+            self._conn.execute("DELETE FROM vector_map WHERE doc_id = ?", (doc_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vector_map VALUES (?, ?, ?)",
+                [(chunk_id, doc_id, vector_id) for chunk_id, vector_id in chunk_vectors],
+            )
+
+    def update_vector_ids(self, chunk_vectors: Iterable[tuple[str, int]]) -> None:
+        """
+        Record new index positions for chunks, e.g. after the index was rebuilt.
+
+        Only the ``vector_id`` column is written; chunks without a row are ignored.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE vector_map SET vector_id = ? WHERE chunk_uuid = ?",
+                [(vector_id, chunk_id) for chunk_id, vector_id in chunk_vectors],
+            )
+
+    def delete(self, doc_id: str) -> None:
+        """Remove a document and its chunks from the store."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+            self._conn.execute("DELETE FROM vector_map WHERE doc_id = ?", (doc_id,))
+
+    def get(self, doc_id: str) -> dict[str, Any] | None:
+        """Metadata of a document, or None if it is not in the store."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM documents WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+        return _row_to_metadata(row) if row is not None else None
+
+    def list_all(self) -> list[dict[str, Any]]:
+        """Metadata of all documents, in the order they were last added."""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM documents ORDER BY rowid").fetchall()
+        return [{"document_id": row["doc_id"], **_row_to_metadata(row)} for row in rows]
+
+
+@lru_cache(maxsize=1)
+def get_document_store() -> DocumentStore:
+    """Get the process-wide document store, at AW_DOCUMENTS_DB if set."""
+    return DocumentStore(os.environ.get("AW_DOCUMENTS_DB", DEFAULT_DB_PATH))
@@ -0,0 +1,318 @@
+"""
+Response cache for LLM calls made by the {{project_name}} agent.
+
+Identical prompts are answered from an in-process LRU cache, and identical
+prompts that arrive while one is already being answered wait for that answer
+instead of calling the model again. Optionally, a semantic layer backed by a
+Chroma collection also answers paraphrased single-turn questions whose
+embedding is close enough to a cached one.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    SystemMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+# Defaults, overridable through the environment
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+SEMANTIC_COLLECTION = "llm_response_cache"
+
+
+def _hash(payload: Any) -> str:
+    """Hash a JSON-serializable payload into a stable cache key."""
+    data = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+def _message_fingerprint(message: AnyMessage) -> list[Any]:
+    """The parts of a message that influence the model's answer."""
+    return [
+        message.type,
+        message.content,
+        getattr(message, "tool_calls", None) or [],
+        getattr(message, "tool_call_id", None),
+    ]
+
+
+class ResponseCache:
+    """
+    Cache of LLM responses keyed on the model settings and the exact prompt.
+
+    Entries expire after ``ttl`` seconds and the least recently used entry is
+    evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        semantic: bool = False,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        persist_directory: str | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached response stays valid
+            max_entries: Maximum number of exact-match entries kept in memory
+            semantic: Whether to also match paraphrased single-turn questions
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            persist_directory: Where the semantic cache's Chroma collection lives
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: OrderedDict[str, tuple[float, AIMessage]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._semantic_store = None
+
+        if semantic:
+            try:
+                from langchain_chroma import Chroma
+                from langchain_openai import OpenAIEmbeddings
+
+                self._semantic_store = Chroma(
+                    collection_name=SEMANTIC_COLLECTION,
+                    embedding_function=OpenAIEmbeddings(),
+                    persist_directory=persist_directory
+                    or os.environ.get("VECTOR_STORE_DIR", "./vector_store"),
+                    collection_metadata={"hnsw:space": "cosine"},
+                )
+            except Exception as e:
+                logger.warning(f"Semantic LLM cache disabled: {str(e)}")
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Build a cache configured by the LLM_CACHE_* environment variables."""
+        return cls(
+            ttl=float(os.environ.get("LLM_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.environ.get("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            semantic=os.environ.get("LLM_CACHE_SEMANTIC", "false").lower() == "true",
+            similarity_threshold=float(
+                os.environ.get("LLM_CACHE_SIMILARITY_THRESHOLD", DEFAULT_SIMILARITY_THRESHOLD)
+            ),
+        )
+
+    def key(self, scope: Sequence[Any], messages: Sequence[AnyMessage]) -> str:
+        """
+        Build the exact-match key for a prompt.
+
+        Args:
+            scope: Settings that change the answer (model, temperature, bound tools)
+            messages: The full list of messages sent to the model
+
+        Returns:
+            An md5 hex digest identifying the request
+        """
+        return _hash([list(scope), [_message_fingerprint(m) for m in messages]])
+
+    def get(self, scope: Sequence[Any], messages: Sequence[AnyMessage]) -> AIMessage | None:
+        """
+        Look up a cached response for a prompt.
+
+        Args:
+            scope: Settings that change the answer (model, temperature, bound tools)
+            messages: The full list of messages sent to the model
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        response = self._exact_get(self.key(scope, messages))
+        if response is None and (question := self._semantic_question(messages)) is not None:
+            return self._semantic_get(self._semantic_scope(scope, messages), question)
+        return response
+
+    async def aget(self, scope: Sequence[Any], messages: Sequence[AnyMessage]) -> AIMessage | None:
+        """
+        Like ``get``, but the semantic lookup runs in a worker thread.
+
+        Embedding the question and querying Chroma are blocking network and disk
+        calls, so they are kept off the event loop.
+        """
+        response = self._exact_get(self.key(scope, messages))
+        if response is None and (question := self._semantic_question(messages)) is not None:
+            return await asyncio.to_thread(
+                self._semantic_get, self._semantic_scope(scope, messages), question
+            )
+        return response
+
+    def put(
+        self, scope: Sequence[Any], messages: Sequence[AnyMessage], response: AIMessage
+    ) -> None:
+        """
+        Store the response to a prompt.
+
+        Args:
+            scope: Settings that change the answer (model, temperature, bound tools)
+            messages: The full list of messages sent to the model
+            response: The model's response
+        """
+        self._exact_put(self.key(scope, messages), response)
+        if (question := self._semantic_question(messages)) is not None:
+            self._semantic_put(self._semantic_scope(scope, messages), question, response)
+
+    async def aput(
+        self, scope: Sequence[Any], messages: Sequence[AnyMessage], response: AIMessage
+    ) -> None:
+        """Like ``put``, but the semantic store runs in a worker thread."""
+        self._exact_put(self.key(scope, messages), response)
+        if (question := self._semantic_question(messages)) is not None:
+            await asyncio.to_thread(
+                self._semantic_put, self._semantic_scope(scope, messages), question, response
+            )
+
+    async def coalesce(
+        self,
+        scope: Sequence[Any],
+        messages: Sequence[AnyMessage],
+        call: Callable[[], Awaitable[AIMessage]],
+    ) -> tuple[AIMessage, bool]:
+        """
+        Answer a prompt with ``call``, sharing one call between identical prompts.
+
+        If the same prompt is already being answered, wait for that response
+        instead of calling the model again. The response is stored in the cache
+        before other callers are released.
+
+        Args:
+            scope: Settings that change the answer (model, temperature, bound tools)
+            messages: The full list of messages sent to the model
+            call: Calls the model for this prompt
+
+        Returns:
+            The response, and whether it came from another caller's in-flight call
+        """
+        key = self.key(scope, messages)
+
+        # Checking and registering happen without an await in between, so no other
+        # task on the event loop can slip in
+        future = self._inflight.get(key)
+        if future is not None:
+            # Shielded so a cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future), True
+
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await call()
+            await self.aput(scope, messages, response)
+            future.set_result(response)
+            return response, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so a lone call is not reported twice
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _exact_get(self, key: str) -> AIMessage | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, response = entry
+                if now - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    return response
+                del self._entries[key]
+        return None
+
+    def _exact_put(self, key: str, response: AIMessage) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _semantic_question(self, messages: Sequence[AnyMessage]) -> str | None:
+        """The question to match semantically, or None if the semantic layer does not apply."""
+        if self._semantic_store is None:
+            return None
+        return self._single_turn_question(messages)
+
+    @staticmethod
+    def _semantic_scope(scope: Sequence[Any], messages: Sequence[AnyMessage]) -> str:
+        """Key for everything but the question itself: settings plus system prompt."""
+        system = [m.content for m in messages if isinstance(m, SystemMessage)]
+        return _hash([list(scope), system])
+
+    @staticmethod
+    def _single_turn_question(messages: Sequence[AnyMessage]) -> str | None:
+        """
+        Return the user's question if the prompt has no earlier conversation.
+
+        Paraphrase matching only considers the newest question, so it is limited
+        to prompts where nothing else in the history could change the answer.
+        """
+        rest = [m for m in messages if not isinstance(m, SystemMessage)]
+        if len(rest) == 1 and isinstance(rest[0], HumanMessage):
+            content = rest[0].content
+            return content if isinstance(content, str) and content else None
+        return None
+
+    def _semantic_get(self, scope_key: str, question: str) -> AIMessage | None:
+        try:
+            matches = self._semantic_store.similarity_search_with_relevance_scores(
+                question, k=1, filter={"scope": scope_key}
+            )
+        except Exception as e:
+            logger.warning(f"Semantic LLM cache lookup failed: {str(e)}")
+            return None
+
+        if not matches:
+            return None
+
+        document, score = matches[0]
+        if score < self.similarity_threshold:
+            return None
+        if time.time() - document.metadata.get("created_at", 0) >= self.ttl:
+            return None
+
+        logger.info(f"Semantic LLM cache hit (similarity {score:.3f})")
+        return messages_from_dict([json.loads(document.metadata["response"])])[0]
+
+    def _semantic_put(self, scope_key: str, question: str, response: AIMessage) -> None:
+        try:
+            self._semantic_store.add_texts(
+                [question],
+                metadatas=[
+                    {
+                        "scope": scope_key,
+                        "created_at": time.time(),
+                        "response": json.dumps(message_to_dict(response)),
+                    }
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Could not store response in semantic LLM cache: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache shared by all agents."""
+    return ResponseCache.from_env()
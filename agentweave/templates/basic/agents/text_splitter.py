@@ -0,0 +1,87 @@
+"""
+Text splitter used to chunk knowledge base documents in {{project_name}}.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from langchain_text_splitters import TextSplitter
+
+DEFAULT_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
+class SinglePassTextSplitter(TextSplitter):
+    """
+    Split text into chunks of up to ``chunk_size`` characters in one pass.
+
+    Each chunk is filled up to ``chunk_size`` and ends at the most significant
+    separator (paragraph break, line break, sentence end, space) that still leaves
+    it at least half full, or else at the latest separator in the window. The
+    separators are found with ``str.rfind`` over the window only, so the text is
+    never split into pieces and merged back together.
+    """
+
+    def __init__(self, separators: tuple[str, ...] = DEFAULT_SEPARATORS, **kwargs: Any):
+        """
+        Initialize the splitter.
+
+        Args:
+            separators: Boundaries to split at, most significant first
+            **kwargs: Passed to TextSplitter, e.g. chunk_size and chunk_overlap
+        """
+        super().__init__(**kwargs)
+        self._separators = separators
+
+    def split_text(self, text: str) -> list[str]:
+        """Split text into chunks of at most ``chunk_size`` characters."""
+        chunks = []
+        for start, end in self._spans(text):
+            chunk = text[start:end]
+            if self._strip_whitespace:
+                chunk = chunk.strip()
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+
+    def _spans(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield the (start, end) offsets of each chunk, overlapping as configured."""
+        size, overlap = self._chunk_size, self._chunk_overlap
+        # A more significant separator is only used if it leaves the chunk this full
+        min_fill = size // 2
+
+        start = 0
+        length = len(text)
+        while length - start > size:
+            window_end = start + size
+            cut = fallback = -1
+            cut_sep = fallback_sep = ""
+            for sep in self._separators:
+                pos = text.rfind(sep, start + 1, window_end)
+                if pos < 0:
+                    continue
+                # Sentence ends keep their punctuation; other separators start the next chunk
+                pos += len(sep) - len(sep.lstrip(".!?"))
+                if pos - start >= min_fill:
+                    cut, cut_sep = pos, sep
+                    break
+                if fallback < 0:
+                    fallback, fallback_sep = pos, sep
+
+            if cut < 0 and fallback > start:
+                cut, cut_sep = fallback, fallback_sep
+
+            if cut < 0:
+                # No separator in the window: cut mid-word, overlapping by characters
+                cut = window_end
+                next_start = max(cut - overlap, start + 1)
+            else:
+                # Overlap from the first separator of the same kind within the overlap
+                pos = text.find(cut_sep, max(cut - overlap, start + 1), cut)
+                next_start = cut
+                if pos >= 0:
+                    next_start = max(pos + len(cut_sep) - len(cut_sep.lstrip(".!?")), start + 1)
+
+            yield start, cut
+            start = next_start
+
+        yield start, length
@@ -4,14 +4,17 @@
 This is the main entry point for the FastAPI backend server.
 """
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 # Import the agent
-from agents.agent import create_agent, invoke_agent
+from agents.agent import create_agent, invoke_agent, stream_agent
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # Import routers - use absolute imports
@@ -92,7 +95,7 @@ async def query(request: QueryRequest):
         agent = create_agent(request.conversation_id)
 
         # Invoke the agent with the query
-        result = invoke_agent(
+        result = await invoke_agent(
             agent=agent,
             query=request.query,
             conversation_id=request.conversation_id,
@@ -109,6 +112,37 @@ async def query(request: QueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/query/stream")
+async def query_stream(request: QueryRequest):
+    """
+    Process a query using the LangGraph agent, streaming the answer as server-sent events.
+
+    Each event is a JSON object: "token" events carry pieces of the answer as the
+    LLM produces them, and a final "final" event carries the full response with
+    the same fields as /api/query.
+    """
+    try:
+        agent = create_agent(request.conversation_id)
+    except Exception as e:
+        logger.error(f"Error processing query: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event in stream_agent(
+                agent=agent,
+                query=request.query,
+                conversation_id=request.conversation_id,
+                context=request.context or {},
+            ):
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Error processing query: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -5,7 +5,8 @@ Router for agent-related endpoints.
 import logging
 from typing import Any
 
-from agents.agent import create_agent, get_agent_config
+from agents.agent import get_agent_config
+from agents.agent import reset_conversation as reset_agent_conversation
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
@@ -39,8 +40,8 @@ async def get_config():
 async def reset_conversation(conversation_id: str):
     """Reset a conversation."""
     try:
-        # Create a new agent (which will reset the conversation state)
-        create_agent(conversation_id, reset=True)
+        # Clear the stored conversation and create a new agent for it
+        await reset_agent_conversation(conversation_id)
         return {
             "status": "ok",
             "message": f"Conversation {conversation_id} reset successfully",
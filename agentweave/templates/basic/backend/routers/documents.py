@@ -6,22 +6,63 @@ import logging
 import os
 from typing import Any
 
+import aiofiles
 from agents.document_processor import (
     add_document_to_knowledge_base,
     get_document_metadata,
     list_all_documents,
+    remove_document_from_knowledge_base,
 )
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+# Document listings are serialized with orjson when installed, the standard library otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_ListingResponse = ORJSONResponse if orjson is not None else JSONResponse
+
 router = APIRouter()
 
 # Temporary storage for uploaded documents
 DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "documents")
 os.makedirs(DOCS_DIR, exist_ok=True)
 
+# Bytes read from an upload per write to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Metadata of uploaded documents whose ingestion into the knowledge base has not
+# finished yet, by document ID
+_pending_ingestions: dict[str, dict[str, Any]] = {}
+
+PENDING_STATUS = {"processed": False, "status": "pending"}
+
+
+def _ingest_document(doc_id: str, file_path: str, metadata: dict[str, Any]) -> None:
+    """Add an uploaded document to the knowledge base; runs as a background task."""
+    # Deleted before its ingestion started
+    if doc_id not in _pending_ingestions:
+        return
+
+    try:
+        ingestion_result = add_document_to_knowledge_base(file_path, metadata)
+
+        # Check if processing succeeded
+        if not ingestion_result["success"]:
+            logger.warning(
+                f"Document {doc_id} was saved but could not be processed: {ingestion_result.get('error', 'Unknown error')}"
+            )
+    finally:
+        # Deleted while it was being ingested: drop the chunks that were just added
+        if _pending_ingestions.pop(doc_id, None) is None:
+            remove_document_from_knowledge_base(doc_id)
+
 
 class DocumentMetadata(BaseModel):
     """Model for document metadata."""
@@ -49,6 +90,7 @@ class Document(BaseModel):
 
 @router.post("/upload")
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     description: str | None = Form(None),
     tags: str | None = Form(None),
@@ -60,11 +102,12 @@ async def upload_document(
         doc_id = f"{os.urandom(4).hex()}_{file.filename}"
         file_path = os.path.join(DOCS_DIR, doc_id)
 
-        # Save the file
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-            file_size = len(content)
+        # Save the file, a chunk at a time so large uploads are never held in memory
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
+            # The position after the last write is the size, buffered bytes included
+            file_size = await f.tell()
 
         # Prepare metadata
         metadata = {
@@ -75,14 +118,10 @@ async def upload_document(
             "content_type": file.content_type,
         }
 
-        # Process the document and add to knowledge base
-        ingestion_result = add_document_to_knowledge_base(file_path, metadata)
-
-        # Check if processing succeeded
-        if not ingestion_result["success"]:
-            logger.warning(
-                f"Document {doc_id} was saved but could not be processed: {ingestion_result.get('error', 'Unknown error')}"
-            )
+        # Add the document to the knowledge base after responding; parsing and
+        # embedding can take a while. Poll GET /{doc_id} for the result.
+        _pending_ingestions[doc_id] = {**metadata, "size": file_size}
+        background_tasks.add_task(_ingest_document, doc_id, file_path, metadata)
 
         return {
             "status": "success",
@@ -95,9 +134,10 @@ async def upload_document(
                 "tags": metadata["tags"],
                 "category": category,
                 "ingestion_status": {
-                    "processed": ingestion_result["success"],
-                    "chunk_count": ingestion_result.get("chunk_count", 0),
-                    "error": ingestion_result.get("error"),
+                    "processed": False,
+                    "status": "pending",
+                    "chunk_count": 0,
+                    "error": None,
                 },
             },
         }
@@ -106,6 +146,62 @@ async def upload_document(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _matches_filters(user_metadata: dict[str, Any], category: str | None, tag: str | None) -> bool:
+    """Whether a document's metadata passes the category and tag filters of a listing."""
+    # Skip if we're filtering by category and it doesn't match
+    if category and user_metadata.get("category") != category:
+        return False
+
+    # Skip if we're filtering by tag and it doesn't match
+    return not tag or tag in (user_metadata.get("tags") or [])
+
+
+def _pending_documents(
+    listed: set[str], category: str | None, tag: str | None
+) -> list[dict[str, Any]]:
+    """Listing entries for uploads still being ingested that are not in ``listed``."""
+    documents = []
+    # Copied, as background tasks remove entries while this runs
+    for doc_id, metadata in list(_pending_ingestions.items()):
+        if doc_id in listed or not _matches_filters(metadata, category, tag):
+            continue
+        documents.append(
+            {
+                "id": doc_id,
+                "filename": metadata.get("filename", doc_id),
+                "size": metadata.get("size", 0),
+                "type": metadata.get("content_type") or "application/octet-stream",
+                "description": metadata.get("description"),
+                "tags": metadata.get("tags", []),
+                "category": metadata.get("category"),
+                "ingestion_status": PENDING_STATUS,
+            }
+        )
+    return documents
+
+
+def _scan_documents() -> list[dict[str, Any]]:
+    """List the uploaded files in DOCS_DIR, using the stat data cached by scandir."""
+    documents = []
+    with os.scandir(DOCS_DIR) as entries:
+        for entry in entries:
+            # Skip directories and special files like the faiss_index
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith("faiss_index"):
+                # Extract original filename from the stored name
+                original_filename = "_".join(entry.name.split("_")[1:])
+                documents.append(
+                    {
+                        "id": entry.name,
+                        "filename": original_filename,
+                        "size": entry.stat(follow_symlinks=False).st_size,
+                        "type": "application/octet-stream",  # We don't store this info currently
+                    }
+                )
+                if entry.name in _pending_ingestions:
+                    documents[-1]["ingestion_status"] = PENDING_STATUS
+    return documents
+
+
 @router.get("/")
 async def list_documents(
     category: str | None = Query(None),
@@ -121,19 +217,23 @@ async def list_documents(
             documents = []
 
             for doc_meta in processor_docs:
-                # Skip if we're filtering by category and it doesn't match
-                if category and doc_meta.get("user_metadata", {}).get("category") != category:
-                    continue
-
-                # Skip if we're filtering by tag and it doesn't match
-                if tag and tag not in doc_meta.get("user_metadata", {}).get("tags", []):
-                    continue
-
                 # Extract document details
                 doc_id = doc_meta["document_id"]
                 user_metadata = doc_meta.get("user_metadata", {})
                 processing_stats = doc_meta.get("processing_stats", {})
 
+                if not _matches_filters(user_metadata, category, tag):
+                    continue
+
+                if doc_id in _pending_ingestions:
+                    ingestion_status = PENDING_STATUS
+                else:
+                    ingestion_status = {
+                        "processed": processing_stats.get("success", False),
+                        "chunk_count": processing_stats.get("chunk_count", 0),
+                        "error": processing_stats.get("error"),
+                    }
+
                 documents.append(
                     {
                         "id": doc_id,
@@ -145,29 +245,20 @@ async def list_documents(
                         "category": user_metadata.get("category"),
                         "chunk_count": doc_meta.get("chunk_count", 0),
                         "created_at": doc_meta.get("ingestion_timestamp"),
+                        "ingestion_status": ingestion_status,
                     }
                 )
 
-            return {"documents": documents}
+            # Uploads not in the store yet
+            documents.extend(_pending_documents({doc["id"] for doc in documents}, category, tag))
+
+            # Returned as a response directly, skipping FastAPI's jsonable_encoder pass
+            return _ListingResponse({"documents": documents})
 
         # Fallback to file system if no processor metadata
-        documents = []
-        for filename in os.listdir(DOCS_DIR):
-            file_path = os.path.join(DOCS_DIR, filename)
-            # Skip directories and special files like the faiss_index
-            if os.path.isfile(file_path) and not filename.startswith("faiss_index"):
-                # Extract original filename from the stored name
-                original_filename = "_".join(filename.split("_")[1:])
-                documents.append(
-                    {
-                        "id": filename,
-                        "filename": original_filename,
-                        "size": os.path.getsize(file_path),
-                        "type": "application/octet-stream",  # We don't store this info currently
-                    }
-                )
+        documents = await run_in_threadpool(_scan_documents)
 
-        return {"documents": documents}
+        return _ListingResponse({"documents": documents})
     except Exception as e:
         logger.error(f"Error listing documents: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -211,14 +302,16 @@ async def get_document(doc_id: str):
         # Extract original filename from the stored name
         original_filename = "_".join(doc_id.split("_")[1:])
 
-        return {
-            "document": {
-                "id": doc_id,
-                "filename": original_filename,
-                "size": os.path.getsize(file_path),
-                "type": "application/octet-stream",
-            }
+        document = {
+            "id": doc_id,
+            "filename": original_filename,
+            "size": os.path.getsize(file_path),
+            "type": "application/octet-stream",
         }
+        if doc_id in _pending_ingestions:
+            document["ingestion_status"] = PENDING_STATUS
+
+        return {"document": document}
     except HTTPException:
         raise
     except Exception as e:
@@ -236,11 +329,13 @@ async def delete_document(doc_id: str):
         if not os.path.isfile(file_path):
             raise HTTPException(status_code=404, detail="Document not found")
 
-        # Delete the file
-        os.remove(file_path)
+        # Delete the file, off the event loop in case the volume is slow
+        await run_in_threadpool(os.remove, file_path)
 
-        # TODO: Remove the document from the knowledge base
-        # This would be implemented in your document processor
+        # A pending ingestion finds its entry gone and removes what it added itself
+        if _pending_ingestions.pop(doc_id, None) is None:
+            # Remove the document from the knowledge base, keeping the event loop free
+            await run_in_threadpool(remove_document_from_knowledge_base, doc_id)
 
         return {
             "status": "success",
@@ -265,10 +360,9 @@ async def get_document_content(doc_id: str):
 
         # Get document metadata to determine content type
         doc_meta = get_document_metadata(doc_id)
-        content_type = "application/octet-stream"  # Default content type
-
-        if doc_meta and doc_meta.get("user_metadata", {}).get("content_type"):
-            content_type = doc_meta["user_metadata"]["content_type"]
+        user_metadata = (doc_meta or {}).get("user_metadata", {})
+        content_type = user_metadata.get("content_type") or "application/octet-stream"
+        filename = user_metadata.get("filename", doc_id)
 
         # For text-based files, return the content directly
         text_content_types = [
@@ -282,28 +376,24 @@ async def get_document_content(doc_id: str):
         ]
 
         if any(content_type.startswith(prefix) for prefix in text_content_types):
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-            return {"content": content, "content_type": content_type}
-
-        # For binary files like PDFs, images, etc., return base64 encoded content
-        import base64
-
-        with open(file_path, "rb") as f:
-            content = base64.b64encode(f.read()).decode("utf-8")
-
-        return {"content": content, "content_type": content_type, "encoding": "base64"}
+            try:
+                async with aiofiles.open(file_path, encoding="utf-8") as f:
+                    content = await f.read()
+                return {"content": content, "content_type": content_type}
+            except UnicodeDecodeError:
+                # If we can't decode as UTF-8, it's likely a binary file
+                pass
+
+        # For binary files like PDFs, images, etc., stream the file itself
+        return FileResponse(
+            file_path,
+            media_type=content_type,
+            filename=filename,
+            content_disposition_type="inline",
+        )
 
     except HTTPException:
         raise
-    except UnicodeDecodeError:
-        # If we can't decode as UTF-8, it's likely a binary file
-        import base64
-
-        with open(file_path, "rb") as f:
-            content = base64.b64encode(f.read()).decode("utf-8")
-
-        return {"content": content, "content_type": content_type, "encoding": "base64"}
     except Exception as e:
         logger.error(f"Error retrieving document content: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -314,15 +404,20 @@ async def reprocess_document(doc_id: str):
     """Reprocess a document to update the knowledge base."""
     try:
         file_path = os.path.join(DOCS_DIR, doc_id)
-        if not os.path.exists(file_path):
+        try:
+            # Stat once; the result is passed on so processing does not stat again
+            st = os.stat(file_path)
+        except OSError:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
 
         # Get current metadata if available
         doc_meta = get_document_metadata(doc_id)
         user_metadata = doc_meta.get("user_metadata", {}) if doc_meta else {}
 
-        # Reprocess the document
-        ingestion_result = add_document_to_knowledge_base(file_path, user_metadata)
+        # Reprocess the document in the threadpool, keeping the event loop free
+        ingestion_result = await run_in_threadpool(
+            add_document_to_knowledge_base, file_path, user_metadata, st
+        )
 
         return {
             "status": "success",
@@ -5,6 +5,7 @@ Router for tool-related endpoints.
 import logging
 from typing import Any
 
+from agents.agent import refresh_default_tools
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
@@ -66,6 +67,9 @@ async def update_tool_status(tool_name: str, toggle_request: ToolToggleRequest):
         if not success:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
 
+        # New conversations should pick up the change
+        refresh_default_tools()
+
         return {
             "status": "success",
             "tool": tool_name,
@@ -3,31 +3,59 @@ Configuration utilities for the backend.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment variables that override the agent section of the config:
+# (variable, config key, type)
+_LLM_ENV_OVERRIDES = (
+    ("LLM_PROVIDER", "llm_provider", str),
+    ("LLM_MODEL", "model", str),
+    ("LLM_TEMPERATURE", "temperature", float),
+)
+
+# Parsed configuration files, with the modification time they were parsed at
+_CONFIG_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
 
 def load_config(config_path: Path | None = None) -> dict[str, Any]:
     """
     Load the project configuration from the agentweave.yaml file.
+
+    The file is parsed again only after it changes. The returned dict is shared
+    between callers, so it must not be modified.
     """
     if config_path is None:
         # Try to find the config file in the project root
         project_root = Path(__file__).resolve().parents[2]
         config_path = project_root / "agentweave.yaml"
 
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
+    # Binary mode lets libyaml consume the bytes without a separate decode pass
+    with open(config_path, "rb") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    _CONFIG_CACHE[config_path] = (mtime, config)
     return config
 
 
@@ -41,25 +69,27 @@ def get_env_var(name: str, default: str | None = None) -> str:
     return value
 
 
+@lru_cache(maxsize=1)
 def get_llm_config() -> dict[str, Any]:
     """
     Get the LLM configuration from the environment or config file.
+
+    Computed once per process; call ``get_llm_config.cache_clear()`` to pick up
+    changes. The returned dict is shared between callers, so it must not be modified.
     """
     # Try to load from config file first
     try:
         config = load_config()
-        llm_config = config.get("agent", {})
+        # Copied, since the loaded config is shared and the overrides below modify it
+        llm_config = dict(config.get("agent", {}))
     except Exception:
         llm_config = {}
 
     # Override with environment variables if set
-    if os.environ.get("LLM_PROVIDER"):
-        llm_config["llm_provider"] = os.environ.get("LLM_PROVIDER")
-
-    if os.environ.get("LLM_MODEL"):
-        llm_config["model"] = os.environ.get("LLM_MODEL")
-
-    if os.environ.get("LLM_TEMPERATURE"):
-        llm_config["temperature"] = float(os.environ.get("LLM_TEMPERATURE"))
+    environ = os.environ
+    for name, key, convert in _LLM_ENV_OVERRIDES:
+        value = environ.get(name)
+        if value:
+            llm_config[key] = convert(value)
 
     return llm_config
@@ -84,6 +84,7 @@ interface Document {
   description?: string;
   ingestion_status?: {
     processed: boolean;
+    status?: "pending";
     error?: string;
   };
   chunk_count?: number;
@@ -378,7 +379,7 @@ export default function Home() {
               </Dialog>
             </div>
 
-            {isDocumentsLoading ? (
+            {isDocumentsLoading && !documentsData ? (
               <div className="text-muted-foreground text-center py-8">
                 <FileUp className="mx-auto h-6 w-6 mb-2 opacity-40 animate-pulse" />
                 <p className="text-xs">Loading documents...</p>
@@ -428,19 +429,25 @@ export default function Home() {
                           className={`w-2 h-2 rounded-full ${
                             doc.ingestion_status.processed
                               ? "bg-green-500"
-                              : "bg-red-500"
+                              : doc.ingestion_status.status === "pending"
+                                ? "bg-yellow-500"
+                                : "bg-red-500"
                           }`}
                         />
                         <span
                           className={
                             doc.ingestion_status.processed
                               ? "text-green-500"
-                              : "text-red-500"
+                              : doc.ingestion_status.status === "pending"
+                                ? "text-yellow-500"
+                                : "text-red-500"
                           }
                         >
                           {doc.ingestion_status.processed
                             ? "Processed"
-                            : "Failed"}
+                            : doc.ingestion_status.status === "pending"
+                              ? "Processing"
+                              : "Failed"}
                         </span>
                         {doc.chunk_count !== undefined && (
                           <span className="text-muted-foreground ml-2">
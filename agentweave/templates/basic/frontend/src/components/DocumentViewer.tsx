@@ -51,6 +51,15 @@ export function DocumentViewer({
     }
   }, [isOpen]);
 
+  // Release the object URL of a previously fetched file
+  useEffect(() => {
+    return () => {
+      if (encoding === "url" && content) {
+        URL.revokeObjectURL(content);
+      }
+    };
+  }, [content, encoding]);
+
   const renderContent = () => {
     if (isLoading) {
       return (
@@ -131,12 +140,12 @@ export function DocumentViewer({
         );
       }
 
-      // PDF (base64 encoded)
-      if (contentType === "application/pdf" && encoding === "base64") {
+      // PDF (served as a file)
+      if (contentType === "application/pdf" && encoding === "url") {
         return (
           <div className="w-full h-[70vh]">
             <iframe
-              src={`data:application/pdf;base64,${content}`}
+              src={content}
               className="w-full h-full rounded-md border"
               title={documentName}
             />
@@ -144,12 +153,12 @@ export function DocumentViewer({
         );
       }
 
-      // Images (base64 encoded)
-      if (contentType.startsWith("image/") && encoding === "base64") {
+      // Images (served as a file)
+      if (contentType.startsWith("image/") && encoding === "url") {
         return (
           <div className="flex justify-center max-h-[70vh] overflow-auto">
             <img
-              src={`data:${contentType};base64,${content}`}
+              src={content}
               alt={documentName}
               className="max-w-full max-h-full rounded-md"
             />
@@ -48,9 +48,20 @@ export function useApi<T>(
   };
 }
 
+// How often to refresh the document list while any upload is still being ingested
+const PENDING_REFRESH_INTERVAL_MS = 2000;
+
 // Hook for fetching documents
 export function useDocuments() {
-  return useApi<{ documents: any[] }>("/api/documents/");
+  return useApi<{ documents: any[] }>("/api/documents/", {
+    // Poll only while a document is pending, so the list shows when it is processed
+    refreshInterval: (data) =>
+      data?.documents?.some(
+        (doc) => doc.ingestion_status?.status === "pending",
+      )
+        ? PENDING_REFRESH_INTERVAL_MS
+        : 0,
+  });
 }
 
 // Type for query response
@@ -271,6 +282,17 @@ export function useDocumentContent() {
         });
       }
 
+      // Text documents come back as JSON; binary ones (PDFs, images) as the raw file
+      const contentType = response.headers.get("content-type") || "";
+      if (!contentType.startsWith("application/json")) {
+        const blob = await response.blob();
+        return {
+          content: URL.createObjectURL(blob),
+          content_type: contentType.split(";")[0],
+          encoding: "url",
+        };
+      }
+
       return await response.json();
     } catch (err: any) {
       const apiError: ApiError = {
@@ -2,8 +2,10 @@
 Metrics module for collecting performance metrics of agent activities.
 """
 
+import atexit
 import json
 import logging
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -23,7 +25,8 @@ class MetricsCollector:
 
         Args:
             metrics_dir: Directory to store metrics
-            flush_interval: Interval in seconds to flush metrics to disk
+            flush_interval: Interval in seconds to flush metrics to disk; a background
+                thread flushes them so requests never wait on the write
         """
         self.metrics = {
             "total_requests": 0,
@@ -44,6 +47,16 @@ class MetricsCollector:
             self.metrics_dir = Path("metrics")
             self.metrics_dir.mkdir(parents=True, exist_ok=True)
 
+        # Guards self.metrics, which the flusher thread reads while requests record
+        self._lock = threading.Lock()
+        # Whether anything was recorded since the last flush
+        self._dirty = False
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="metrics-flusher", daemon=True
+        )
+        self._flusher.start()
+
     def record_request(
         self,
         success: bool,
@@ -60,18 +73,16 @@ class MetricsCollector:
             query: The query that was processed
             conversation_id: Optional conversation ID
         """
-        self.metrics["total_requests"] += 1
+        with self._lock:
+            self.metrics["total_requests"] += 1
 
-        if success:
-            self.metrics["successful_requests"] += 1
-        else:
-            self.metrics["failed_requests"] += 1
+            if success:
+                self.metrics["successful_requests"] += 1
+            else:
+                self.metrics["failed_requests"] += 1
 
-        self.metrics["response_times"].append(response_time)
-
-        # Check if we should flush metrics
-        if time.time() - self.last_flush_time > self.flush_interval:
-            self.flush_metrics()
+            self.metrics["response_times"].append(response_time)
+            self._dirty = True
 
     def record_tool_usage(self, tool_name: str, success: bool, execution_time: float) -> None:
         """
@@ -82,23 +93,25 @@ class MetricsCollector:
             success: Whether the tool execution was successful
             execution_time: Time taken to execute the tool in seconds
         """
-        if tool_name not in self.metrics["tool_usage"]:
-            self.metrics["tool_usage"][tool_name] = {
-                "total_calls": 0,
-                "successful_calls": 0,
-                "failed_calls": 0,
-                "execution_times": [],
-            }
+        with self._lock:
+            if tool_name not in self.metrics["tool_usage"]:
+                self.metrics["tool_usage"][tool_name] = {
+                    "total_calls": 0,
+                    "successful_calls": 0,
+                    "failed_calls": 0,
+                    "execution_times": [],
+                }
 
-        tool_metrics = self.metrics["tool_usage"][tool_name]
-        tool_metrics["total_calls"] += 1
+            tool_metrics = self.metrics["tool_usage"][tool_name]
+            tool_metrics["total_calls"] += 1
 
-        if success:
-            tool_metrics["successful_calls"] += 1
-        else:
-            tool_metrics["failed_calls"] += 1
+            if success:
+                tool_metrics["successful_calls"] += 1
+            else:
+                tool_metrics["failed_calls"] += 1
 
-        tool_metrics["execution_times"].append(execution_time)
+            tool_metrics["execution_times"].append(execution_time)
+            self._dirty = True
 
     def record_error(
         self,
@@ -114,24 +127,26 @@ class MetricsCollector:
             error_message: Error message
             context: Additional context for the error
         """
-        if error_type not in self.metrics["errors"]:
-            self.metrics["errors"][error_type] = {
-                "count": 0,
-                "examples": [],
-            }
-
-        error_metrics = self.metrics["errors"][error_type]
-        error_metrics["count"] += 1
-
-        # Store the error with context but limit the number of examples
-        if len(error_metrics["examples"]) < 10:
-            error_metrics["examples"].append(
-                {
-                    "message": error_message,
-                    "context": context or {},
-                    "timestamp": time.time(),
+        with self._lock:
+            if error_type not in self.metrics["errors"]:
+                self.metrics["errors"][error_type] = {
+                    "count": 0,
+                    "examples": [],
                 }
-            )
+
+            error_metrics = self.metrics["errors"][error_type]
+            error_metrics["count"] += 1
+
+            # Store the error with context but limit the number of examples
+            if len(error_metrics["examples"]) < 10:
+                error_metrics["examples"].append(
+                    {
+                        "message": error_message,
+                        "context": context or {},
+                        "timestamp": time.time(),
+                    }
+                )
+            self._dirty = True
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -140,63 +155,65 @@ class MetricsCollector:
         Returns:
             A dictionary with summarized metrics
         """
-        # Calculate summary statistics
-        total_requests = self.metrics["total_requests"]
-        if total_requests > 0:
-            success_rate = self.metrics["successful_requests"] / total_requests * 100
-        else:
-            success_rate = 0
+        # Held throughout, as the record methods update these dicts from other threads
+        with self._lock:
+            # Calculate summary statistics
+            total_requests = self.metrics["total_requests"]
+            if total_requests > 0:
+                success_rate = self.metrics["successful_requests"] / total_requests * 100
+            else:
+                success_rate = 0
 
-        response_times = self.metrics["response_times"]
-        if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
-            max_response_time = max(response_times)
-            min_response_time = min(response_times)
-        else:
-            avg_response_time = 0
-            max_response_time = 0
-            min_response_time = 0
-
-        # Summarize tool usage
-        tool_usage_summary = {}
-        for tool_name, tool_metrics in self.metrics["tool_usage"].items():
-            total_calls = tool_metrics["total_calls"]
-            if total_calls > 0:
-                success_rate_tool = tool_metrics["successful_calls"] / total_calls * 100
-                avg_execution_time = sum(tool_metrics["execution_times"]) / len(
-                    tool_metrics["execution_times"]
-                )
+            response_times = self.metrics["response_times"]
+            if response_times:
+                avg_response_time = sum(response_times) / len(response_times)
+                max_response_time = max(response_times)
+                min_response_time = min(response_times)
             else:
-                success_rate_tool = 0
-                avg_execution_time = 0
+                avg_response_time = 0
+                max_response_time = 0
+                min_response_time = 0
+
+            # Summarize tool usage
+            tool_usage_summary = {}
+            for tool_name, tool_metrics in self.metrics["tool_usage"].items():
+                total_calls = tool_metrics["total_calls"]
+                if total_calls > 0:
+                    success_rate_tool = tool_metrics["successful_calls"] / total_calls * 100
+                    avg_execution_time = sum(tool_metrics["execution_times"]) / len(
+                        tool_metrics["execution_times"]
+                    )
+                else:
+                    success_rate_tool = 0
+                    avg_execution_time = 0
+
+                tool_usage_summary[tool_name] = {
+                    "total_calls": total_calls,
+                    "success_rate": success_rate_tool,
+                    "avg_execution_time": avg_execution_time,
+                }
 
-            tool_usage_summary[tool_name] = {
-                "total_calls": total_calls,
-                "success_rate": success_rate_tool,
-                "avg_execution_time": avg_execution_time,
+            # Create the summary
+            summary = {
+                "total_requests": total_requests,
+                "success_rate": success_rate,
+                "response_time": {
+                    "avg": avg_response_time,
+                    "max": max_response_time,
+                    "min": min_response_time,
+                },
+                "tool_usage": tool_usage_summary,
+                "error_count": sum(error["count"] for error in self.metrics["errors"].values()),
+                "most_common_errors": sorted(
+                    [
+                        {"type": err_type, "count": err_data["count"]}
+                        for err_type, err_data in self.metrics["errors"].items()
+                    ],
+                    key=lambda x: x["count"],
+                    reverse=True,
+                )[:5],
             }
 
-        # Create the summary
-        summary = {
-            "total_requests": total_requests,
-            "success_rate": success_rate,
-            "response_time": {
-                "avg": avg_response_time,
-                "max": max_response_time,
-                "min": min_response_time,
-            },
-            "tool_usage": tool_usage_summary,
-            "error_count": sum(error["count"] for error in self.metrics["errors"].values()),
-            "most_common_errors": sorted(
-                [
-                    {"type": err_type, "count": err_data["count"]}
-                    for err_type, err_data in self.metrics["errors"].items()
-                ],
-                key=lambda x: x["count"],
-                reverse=True,
-            )[:5],
-        }
-
         return summary
 
     def flush_metrics(self) -> None:
@@ -206,17 +223,41 @@ class MetricsCollector:
         timestamp = int(time.time())
         metrics_file = self.metrics_dir / f"metrics_{timestamp}.json"
 
-        with open(metrics_file, "w") as f:
-            json.dump(self.metrics, f, indent=2)
+        # Serialize under the lock, write outside it so recording is never held up by I/O
+        with self._lock:
+            data = json.dumps(self.metrics, indent=2)
+
+            # Reset certain metrics after flushing
+            self.metrics["response_times"] = []
+            self._dirty = False
 
-        # Reset certain metrics after flushing
-        self.metrics["response_times"] = []
+        with open(metrics_file, "w") as f:
+            f.write(data)
 
         # Reset the flush timer
         self.last_flush_time = time.time()
 
         logger.info(f"Metrics flushed to {metrics_file}")
 
+    def _flush_loop(self) -> None:
+        """Flush metrics every flush interval until the collector is closed."""
+        while not self._stopped.wait(self.flush_interval):
+            if not self._dirty:
+                continue
+            try:
+                self.flush_metrics()
+            except Exception as e:
+                logger.error(f"Error flushing metrics: {str(e)}")
+
+    def close(self) -> None:
+        """Stop the background flusher and flush anything recorded since the last flush."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._flusher.join()
+        if self._dirty:
+            self.flush_metrics()
+
     def timing_decorator(self, func: Callable) -> Callable:
         """
         Decorator to time function execution and record metrics.
@@ -261,3 +302,4 @@ class MetricsCollector:
 
 # Singleton instance
 metrics = MetricsCollector()
+atexit.register(metrics.close)
@@ -3,9 +3,11 @@ Knowledge base tool for querying document knowledge.
 """
 
 import logging
+from typing import Any
 
 from agents.document_processor import query_knowledge_base
 from langchain.tools import BaseTool
+from langchain_core.runnables.config import ensure_config
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +20,19 @@ class KnowledgeBaseTool(BaseTool):
     This is useful when you need to retrieve information from documents that have been uploaded by the user.
     The input should be a natural language query related to the content of the documents.
     """
+    # Results change as documents are uploaded, so the agent must not reuse them
+    metadata: dict[str, Any] | None = {"cacheable": False}
 
     def _run(self, query: str) -> str:
         """Run the knowledge base query."""
         try:
+            # The query's context may ask for faster or more accurate search. Read from
+            # the current run's config, so it stays out of the schema the model sees
+            context = ensure_config().get("configurable", {}).get("context") or {}
+            recall = context.get("recall", "balanced")
+
             # Query the knowledge base
-            results = query_knowledge_base(query)
+            results = query_knowledge_base(query, recall=recall)
 
             if not results:
                 return "No relevant information found in the knowledge base."
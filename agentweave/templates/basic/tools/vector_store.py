@@ -57,6 +57,8 @@ class VectorStoreQueryTool(BaseTool):
     name: str = "vector_store_query"
     description: str = "Query a vector store for documents similar to the input query. Use this when you need to retrieve information from a knowledge base."
     args_schema: type[BaseModel] = VectorStoreQueryInput
+    # Results depend on what has been stored, so the agent must not reuse them
+    metadata: dict[str, Any] | None = {"cacheable": False}
     persist_directory: str | None = None
     embedding_model: Any | None = None
     _error_message: str | None = None
@@ -154,6 +156,8 @@ class VectorStoreAddTool(BaseTool):
     name: str = "vector_store_add"
     description: str = "Add text to the vector store knowledge base. Use this when you need to store information for later retrieval."
     args_schema: type[BaseModel] = VectorStoreAddInput
+    # Adding text has side effects, so the agent must always run it
+    metadata: dict[str, Any] | None = {"cacheable": False}
     persist_directory: str | None = None
     embedding_model: Any | None = None
     _error_message: str | None = None
@@ -2,6 +2,7 @@
 Weather tool for getting current weather information.
 """
 
+import asyncio
 import logging
 import os
 
@@ -121,7 +122,8 @@ class WeatherTool(BaseTool):
 
     async def _arun(self, location: str) -> str:
         """Get weather information asynchronously."""
-        return self._run(location)
+        # The HTTP request blocks, so keep it off the event loop
+        return await asyncio.to_thread(self._run, location)
 
 
 # Example of using the tool
@@ -2,28 +2,56 @@
 Configuration utilities for AgentWeave.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file with the libyaml-backed safe loader when it is available."""
+    # Binary mode lets libyaml consume the bytes without a separate decode pass
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+# Resolved directories known to be AgentWeave projects. Only positive results are kept:
+# a directory can become a project later in the same process, e.g. through ``init``
+_PROJECT_DIRS: set[Path] = set()
+
 
 def is_agentweave_project(path: Path | None = None) -> bool:
     """Check if the given path is an AgentWeave project."""
-    path = path or Path.cwd()
-    return (path / "agentweave.yaml").exists()
+    path = (path or Path.cwd()).resolve()
+    if path in _PROJECT_DIRS:
+        return True
+    if (path / "agentweave.yaml").exists():
+        _PROJECT_DIRS.add(path)
+        return True
+    return False
 
 
-def load_project_config(path: Path | None = None) -> dict[str, Any]:
-    """Load the project configuration."""
-    path = path or Path.cwd()
-    config_path = path / "agentweave.yaml"
+def load_project_config(path: Path | None = None) -> Mapping[str, Any]:
+    """Load the project configuration as a read-only mapping."""
+    try:
+        return _load_project_config((path or Path.cwd()).resolve())
+    except FileNotFoundError:
+        # Not cached, so a config written later in the process is picked up
+        return MappingProxyType({})
 
-    if not config_path.exists():
-        return {}
 
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+@lru_cache(maxsize=8)
+def _load_project_config(path: Path) -> Mapping[str, Any]:
+    """Cached config parse, keyed on the resolved project path."""
+    return MappingProxyType(load_yaml_file(path / "agentweave.yaml") or {})
 
 
 def save_project_config(config: dict[str, Any], path: Path | None = None) -> None:
@@ -34,6 +62,9 @@ def save_project_config(config: dict[str, Any], path: Path | None = None) -> Non
     with open(config_path, "w") as f:
         yaml.dump(config, f, default_flow_style=False)
 
+    # The cached parse would otherwise keep serving the old contents
+    _load_project_config.cache_clear()
+
 
 def get_available_templates() -> list[str]:
     """Get a list of available project templates."""
@@ -42,50 +73,60 @@ def get_available_templates() -> list[str]:
     return [d.name for d in templates_dir.iterdir() if d.is_dir() and not d.name.startswith("__")]
 
 
-def get_available_tools() -> list[str]:
-    """Get a list of available tools."""
-    # For now, return a static list
+@lru_cache(maxsize=1)
+def get_available_tools() -> frozenset[str]:
+    """Get the set of available tools."""
+    # For now, return a static set
     # In the future, this should scan the tools directory
-    return [
-        "web-search",
-        "file-io",
-        "calculator",
-        "weather",
-        "wikipedia",
-        "calendar",
-        "email",
-        "code-interpreter",
-        "database",
-        "api-connector",
-    ]
-
-
-def get_available_memories() -> list[str]:
-    """Get a list of available memory components."""
-    # For now, return a static list
+    return frozenset(
+        {
+            "web-search",
+            "file-io",
+            "calculator",
+            "weather",
+            "wikipedia",
+            "calendar",
+            "email",
+            "code-interpreter",
+            "database",
+            "api-connector",
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def get_available_memories() -> frozenset[str]:
+    """Get the set of available memory components."""
+    # For now, return a static set
     # In the future, this should scan the memory directory
-    return [
-        "simple",
-        "vector-store",
-        "conversation",
-        "document",
-        "redis",
-    ]
-
-
-def get_available_monitors() -> list[str]:
-    """Get a list of available monitoring components."""
-    # For now, return a static list
+    return frozenset(
+        {
+            "simple",
+            "vector-store",
+            "conversation",
+            "document",
+            "redis",
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def get_available_monitors() -> frozenset[str]:
+    """Get the set of available monitoring components."""
+    # For now, return a static set
     # In the future, this should scan the monitoring directory
-    return [
-        "tracing",
-        "dashboard",
-        "metrics",
-        "debugger",
-        "langfuse",
-    ]
-
-
+    return frozenset(
+        {
+            "tracing",
+            "dashboard",
+            "metrics",
+            "debugger",
+            "langfuse",
+        }
+    )
+
+
+@lru_cache(maxsize=1)
 def get_package_path() -> Path:
     """Get the path to the AgentWeave package."""
     import agentweave
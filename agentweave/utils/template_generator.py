@@ -5,17 +5,24 @@ This module provides a declarative configuration-based approach to template gene
 replacing the previous Jinja2 template system with a more maintainable approach.
 """
 
+import fnmatch
 import os
 import re
 import shutil
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from agentweave.utils.config import get_package_path
+from agentweave.utils.config import get_package_path, load_yaml_file
 
+# Directories that never belong in a template; pruned before the walk descends
+_ALWAYS_EXCLUDED_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv"})
 
+
+@lru_cache(maxsize=1)
 def get_templates_dir() -> Path:
     """Get the path to the templates directory."""
     return get_package_path() / "templates"
@@ -61,8 +68,7 @@ class TemplateGenerator:
 
     def _load_schema(self) -> dict[str, Any]:
         """Load and parse the template schema file."""
-        with open(self.schema_path) as f:
-            return yaml.safe_load(f)
+        return load_yaml_file(self.schema_path)
 
     def _validate_config(self) -> None:
         """Validate the provided configuration against the schema."""
@@ -192,11 +198,29 @@ def generate_from_template(
     generator.generate()
 
 
+def compile_exclude_patterns(patterns: Iterable[str]) -> re.Pattern:
+    """
+    Compile shell-style exclude globs (e.g. "*.pyc") into one regular expression.
+
+    Args:
+        patterns: Glob patterns matched against file names, directory names and
+            relative paths
+
+    Returns:
+        A compiled pattern whose ``match`` succeeds if any glob matches
+    """
+    translated = [f"(?:{fnmatch.translate(pattern)})" for pattern in patterns]
+    if not translated:
+        # An empty alternation would match everything
+        return re.compile(r"(?!)")
+    return re.compile("|".join(translated))
+
+
 def create_template_from_project(
     project_dir: Path,
     template_name: str,
     output_dir: Path | None = None,
-    exclude_paths: list[str] | None = None,
+    exclude_paths: list[str] | re.Pattern | None = None,
 ) -> None:
     """
     Create a template from an existing project.
@@ -205,7 +229,8 @@ def create_template_from_project(
         project_dir: Directory of the existing project
         template_name: Name to give the new template
         output_dir: Directory where the template will be created (defaults to agentweave/templates/{template_name})
-        exclude_paths: List of relative paths to exclude from the template
+        exclude_paths: Glob patterns to exclude from the template, or a pattern
+            already compiled with compile_exclude_patterns
     """
     if not output_dir:
         output_dir = get_templates_dir() / template_name
@@ -231,6 +256,11 @@ def create_template_from_project(
             "build",
         ]
 
+    if isinstance(exclude_paths, re.Pattern):
+        exclude = exclude_paths
+    else:
+        exclude = compile_exclude_patterns(exclude_paths)
+
     # Create a simple schema.yaml file
     schema = {
         "description": "Template configuration schema",
@@ -252,14 +282,14 @@ def create_template_from_project(
     # Copy project files to template directory
     for root, dirs, files in os.walk(project_dir):
         # Apply exclusions
-        dirs[:] = [d for d in dirs if not any(re.match(pattern, d) for pattern in exclude_paths)]
+        dirs[:] = [d for d in dirs if d not in _ALWAYS_EXCLUDED_DIRS and not exclude.match(d)]
 
         # Calculate relative path from project directory
         rel_path = Path(root).relative_to(project_dir)
         target_dir = output_dir / rel_path
 
         # Skip excluded paths
-        if any(re.match(pattern, str(rel_path)) for pattern in exclude_paths):
+        if exclude.match(str(rel_path)):
             continue
 
         # Create target directory
@@ -270,7 +300,7 @@ def create_template_from_project(
             src_file = Path(root) / file
 
             # Skip excluded files
-            if any(re.match(pattern, file) for pattern in exclude_paths):
+            if exclude.match(file):
                 continue
 
             # Copy the file to the template directory